@@ -1,6 +1,8 @@
 """Abstract interfaces for audio processing components."""
 
+import multiprocessing
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -73,6 +75,52 @@ class AudioProcessor(ABC):
         """
         pass
 
+    def process_batch(
+        self,
+        input_paths: List[Path],
+        output_dir: Path,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> List[ProcessResult]:
+        """
+        Process several files in parallel worker processes.
+        
+        Files are independent, so each one is handed to process() in its
+        own worker. Workers are spawned rather than forked, since forking
+        after numba or FFT thread pools have started can deadlock. Falls
+        back to a plain loop for a single file or a single worker.
+        
+        Args:
+            input_paths: Paths to input audio files
+            output_dir: Directory for output files
+            max_workers: Worker process count (default: CPU count)
+            **kwargs: Processor-specific parameters passed to process()
+            
+        Returns:
+            One ProcessResult per input, in input order
+        """
+        if len(input_paths) <= 1 or max_workers == 1:
+            return [self.process(path, output_dir, **kwargs) for path in input_paths]
+        
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            futures = [
+                executor.submit(self.process, path, output_dir, **kwargs)
+                for path in input_paths
+            ]
+            results = []
+            for path, future in zip(input_paths, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # process() reports its own errors; this covers dead workers
+                    results.append(ProcessResult(
+                        success=False,
+                        input_path=path,
+                        error_message=f"Worker failed: {e}",
+                    ))
+        return results
+
     def validate_params(self, **kwargs) -> List[str]:
         """
         Validate parameters before processing.
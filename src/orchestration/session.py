@@ -2,12 +2,13 @@
 
 import signal
 import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from ..core.exceptions import SessionError, SessionNotFoundError
 from ..core.interfaces import AudioProcessor, ProgressReporter, SessionStore
-from ..core.types import FileRecord, FileStatus, Session, SessionStatus
+from ..core.types import FileRecord, FileStatus, ProcessResult, Session, SessionStatus
 from ..utils.progress import RichProgressReporter, SilentProgressReporter
 
 
@@ -99,7 +100,8 @@ class SessionManager:
         input_files: List[Path],
         output_dir: Path,
         config: dict,
-        resume_session_id: Optional[str] = None
+        resume_session_id: Optional[str] = None,
+        max_concurrent: int = 1
     ) -> Session:
         """
         Execute processor on all files with checkpointing.
@@ -113,6 +115,7 @@ class SessionManager:
             output_dir: Directory for output files
             config: Processor configuration
             resume_session_id: Session ID to resume (optional)
+            max_concurrent: Files processed at the same time (default: 1)
             
         Returns:
             Final session state
@@ -165,51 +168,34 @@ class SessionManager:
             
             progress.start(total=total_files, description=description)
             
-            processed_in_batch = 0
-            
-            for file_path in files_to_process:
-                if self._interrupted:
-                    break
-                
-                # Mark as processing
-                self.store.update_file_status(
-                    session.session_id,
-                    file_path,
-                    FileStatus.PROCESSING
+            if max_concurrent > 1:
+                processed_in_batch = self._process_concurrently(
+                    processor, session.session_id, files_to_process,
+                    output_dir, config, progress, max_concurrent,
                 )
+            else:
+                processed_in_batch = 0
                 
-                try:
-                    result = processor.process(file_path, output_dir, **config)
+                for file_path in files_to_process:
+                    if self._interrupted:
+                        break
                     
-                    if result.success:
-                        self.store.update_file_status(
-                            session.session_id,
-                            file_path,
-                            FileStatus.COMPLETED,
-                            output_paths=result.output_paths
-                        )
-                    else:
-                        self.store.update_file_status(
-                            session.session_id,
-                            file_path,
-                            FileStatus.FAILED,
-                            error_message=result.error_message
-                        )
-                        
-                except Exception as e:
+                    # Mark as processing
                     self.store.update_file_status(
                         session.session_id,
                         file_path,
-                        FileStatus.FAILED,
-                        error_message=str(e)
+                        FileStatus.PROCESSING
                     )
-                
-                processed_in_batch += 1
-                progress.update(processed_in_batch)
-                
-                # Checkpoint every N files
-                if processed_in_batch % self.checkpoint_interval == 0:
-                    self.store.checkpoint(session.session_id)
+                    
+                    result = self._process_file(processor, file_path, output_dir, config)
+                    self._record_result(session.session_id, file_path, result)
+                    
+                    processed_in_batch += 1
+                    progress.update(processed_in_batch)
+                    
+                    # Checkpoint every N files
+                    if processed_in_batch % self.checkpoint_interval == 0:
+                        self.store.checkpoint(session.session_id)
             
             # Final state
             if not self._interrupted:
@@ -231,6 +217,93 @@ class SessionManager:
         finally:
             self._restore_signal_handlers()
     
+    def _process_file(
+        self,
+        processor: AudioProcessor,
+        file_path: Path,
+        output_dir: Path,
+        config: dict,
+    ) -> ProcessResult:
+        """Run the processor on one file, reporting exceptions as a failed result."""
+        try:
+            return processor.process(file_path, output_dir, **config)
+        except Exception as e:
+            return ProcessResult(success=False, input_path=file_path, error_message=str(e))
+    
+    def _record_result(self, session_id: str, file_path: Path, result: ProcessResult) -> None:
+        """Record the outcome of one file in the session store."""
+        if result.success:
+            self.store.update_file_status(
+                session_id,
+                file_path,
+                FileStatus.COMPLETED,
+                output_paths=result.output_paths
+            )
+        else:
+            self.store.update_file_status(
+                session_id,
+                file_path,
+                FileStatus.FAILED,
+                error_message=result.error_message
+            )
+    
+    def _process_concurrently(
+        self,
+        processor: AudioProcessor,
+        session_id: str,
+        files: List[Path],
+        output_dir: Path,
+        config: dict,
+        progress: ProgressReporter,
+        max_concurrent: int,
+    ) -> int:
+        """
+        Process files in worker threads, at most max_concurrent at a time.
+        
+        Processors spend their time in ffmpeg subprocesses and numpy, so
+        threads overlap files without a process pool. Only this thread
+        talks to the session store: a file is marked processing when it
+        is submitted and its result is recorded as it finishes, so an
+        interrupted batch resumes the same way as a sequential one.
+        
+        Returns:
+            Number of files processed
+        """
+        processed = 0
+        remaining = iter(files)
+        running: Dict[Future, Path] = {}
+        
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            def submit_next() -> None:
+                for file_path in remaining:
+                    self.store.update_file_status(session_id, file_path, FileStatus.PROCESSING)
+                    future = executor.submit(
+                        self._process_file, processor, file_path, output_dir, config
+                    )
+                    running[future] = file_path
+                    return
+            
+            for _ in range(max_concurrent):
+                submit_next()
+            
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path = running.pop(future)
+                    self._record_result(session_id, file_path, future.result())
+                    
+                    processed += 1
+                    progress.update(processed)
+                    
+                    # Checkpoint every N files
+                    if processed % self.checkpoint_interval == 0:
+                        self.store.checkpoint(session_id)
+                    
+                    if not self._interrupted:
+                        submit_next()
+        
+        return processed
+    
     def resume_latest(self) -> Optional[Session]:
         """
         Resume the most recent incomplete session.
@@ -59,6 +59,11 @@ def visualize_audio(
         "--format", "-f",
         help="Output image format: png, jpg, svg, pdf",
     ),
+    axes: bool = typer.Option(
+        True,
+        "--axes/--no-axes",
+        help="Draw axes and colorbar (spectrogram and mel without them render faster)",
+    ),
 ) -> None:
     """
     Generate audio visualizations (waveform, spectrogram).
@@ -83,6 +88,7 @@ def visualize_audio(
             height=height,
             colormap=colormap,
             output_format=output_format,
+            axes=axes,
         )
         
         if result.success:
@@ -254,11 +260,16 @@ def transcribe_audio(
         "--translate",
         help="Translate to English",
     ),
+    compute_type: str = typer.Option(
+        "int8",
+        "--compute-type",
+        help="faster-whisper weight precision: int8, int8_float16, float16, float32",
+    ),
 ) -> None:
     """
-    Transcribe audio using OpenAI Whisper.
+    Transcribe audio using OpenAI Whisper models.
     
-    Requires: pip install openai-whisper
+    Requires: pip install faster-whisper (or openai-whisper)
     
     Examples:
         audio-toolkit analyze transcribe audio.wav
@@ -281,6 +292,7 @@ def transcribe_audio(
                 language=language,
                 output_format=output_format,
                 task="translate" if translate else "transcribe",
+                compute_type=compute_type,
             )
         
         if result.success:
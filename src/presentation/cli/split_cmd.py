@@ -1,5 +1,6 @@
 """Split command for CLI."""
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -65,6 +66,12 @@ def split_fixed(
         "--recursive", "-r",
         help="Process directories recursively",
     ),
+    max_concurrent: int = typer.Option(
+        1,
+        "--max-concurrent",
+        min=1,
+        help="Number of files to split at the same time (CPU cores are shared between them)",
+    ),
     resume: bool = typer.Option(
         False,
         "--resume",
@@ -106,6 +113,18 @@ def split_fixed(
     duration_ms = duration * 1000
     min_last_segment_ms = min_last_segment * 1000
     
+    config = {
+        "duration_ms": duration_ms,
+        "output_format": output_format,
+        "min_last_segment_ms": min_last_segment_ms,
+    }
+    
+    # Each file exports its segments on its own thread pool of ffmpeg
+    # processes; split the cores between concurrent files instead of
+    # giving every one of them all of them
+    if max_concurrent > 1:
+        config["max_workers"] = max(1, (os.cpu_count() or 1) // max_concurrent)
+    
     # Initialize session store and manager
     store = SQLiteSessionStore()
     progress_reporter = create_progress_reporter(silent=quiet)
@@ -163,12 +182,9 @@ def split_fixed(
                     processor=splitter,
                     input_files=[],  # Not used in resume
                     output_dir=output_dir,
-                    config={
-                        "duration_ms": duration_ms,
-                        "output_format": output_format,
-                        "min_last_segment_ms": min_last_segment_ms,
-                    },
+                    config=config,
                     resume_session_id=resumable_session.session_id,
+                    max_concurrent=max_concurrent,
                 )
                 
                 _print_session_summary(session)
@@ -225,18 +241,13 @@ def split_fixed(
     splitter = get_processor("splitter-fixed")
     
     # Run batch with session tracking
-    config = {
-        "duration_ms": duration_ms,
-        "output_format": output_format,
-        "min_last_segment_ms": min_last_segment_ms,
-    }
-    
     try:
         session = session_manager.run_batch(
             processor=splitter,
             input_files=files,
             output_dir=output_dir,
             config=config,
+            max_concurrent=max_concurrent,
         )
         
         _print_session_summary(session)
@@ -17,6 +17,23 @@ from ..utils.validators import validate_format, validate_input_file
 
 logger = get_logger(__name__)
 
+# Optional numpy import - silence detection falls back to pydub slicing
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+try:
+    import soxr
+    HAS_SOXR = True
+except ImportError:
+    HAS_SOXR = False
+
+# numpy dtype of pydub's interleaved raw data by sample width in bytes
+SAMPLE_WIDTH_DTYPES = {1: "int8", 2: "int16", 4: "int32"}
+
 
 class FormatConverter(AudioProcessor):
     """
@@ -97,27 +114,275 @@ class FormatConverter(AudioProcessor):
             ),
         ]
     
+    def _audio_to_samples(self, audio: AudioSegment) -> "np.ndarray":
+        """View the raw AudioSegment buffer as a (frames, channels) integer array."""
+        samples = np.frombuffer(audio.raw_data, dtype=SAMPLE_WIDTH_DTYPES[audio.sample_width])
+        return samples.reshape(-1, audio.channels)
+    
+    def _samples_to_audio(
+        self,
+        samples: "np.ndarray",
+        frame_rate: int,
+        sample_width: int,
+    ) -> AudioSegment:
+        """Build an AudioSegment from a (frames, channels) integer array."""
+        return AudioSegment(
+            samples.tobytes(),
+            frame_rate=frame_rate,
+            sample_width=sample_width,
+            channels=samples.shape[1],
+        )
+    
+    def _resample(
+        self,
+        samples: "np.ndarray",
+        frame_rate: int,
+        sample_rate: int,
+        sample_width: int,
+    ) -> "np.ndarray":
+        """
+        Resample samples from frame_rate to sample_rate.
+        
+        Uses libsoxr's high-quality resampler on the raw 16/32-bit frames
+        when soxr is installed, pydub's set_frame_rate otherwise.
+        """
+        if not HAS_SOXR or sample_width not in (2, 4):
+            audio = self._samples_to_audio(samples, frame_rate, sample_width)
+            return self._audio_to_samples(audio.set_frame_rate(sample_rate))
+        
+        return soxr.resample(samples, frame_rate, sample_rate, quality="HQ")
+    
+    def _set_channels(self, samples: "np.ndarray", channels: int) -> "np.ndarray":
+        """
+        Convert samples to the given channel count.
+        
+        Follows pydub's set_channels: stereo is downmixed with floor((l + r) / 2),
+        other layouts with the per-channel floor-divided sum, and mono is
+        duplicated into every output channel.
+        """
+        current = samples.shape[1]
+        if channels == current:
+            return samples
+        
+        if channels == 1:
+            if current == 2:
+                mixed = samples.sum(axis=1, dtype=np.int64) // 2
+            else:
+                mixed = (samples // current).sum(axis=1, dtype=np.int64)
+            return mixed.astype(samples.dtype).reshape(-1, 1)
+        
+        if current == 1:
+            return np.repeat(samples, channels, axis=1)
+        
+        raise ProcessingError(
+            f"Cannot convert {current} channels to {channels}: "
+            "only mono-to-multi and multi-to-mono conversion is supported"
+        )
+    
+    def _normalize(
+        self,
+        samples: "np.ndarray",
+        sample_width: int,
+        headroom_db: float = 0.1,
+    ) -> "np.ndarray":
+        """
+        Scale samples so their peak sits headroom_db below full scale.
+        
+        Same result as pydub.effects.normalize (floor rounding, saturating
+        at the sample limits), computed with one numpy scan for the peak
+        and one for the gain instead of audioop round-trips.
+        """
+        if not samples.size:
+            return samples
+        
+        # Python ints, so abs() of the most negative sample cannot overflow
+        peak = max(abs(int(samples.min())), abs(int(samples.max())))
+        if peak == 0:
+            return samples
+        
+        max_amplitude = 2 ** (sample_width * 8 - 1)
+        target_peak = max_amplitude * 10 ** (-headroom_db / 20)
+        scaled = samples * (target_peak / peak)
+        np.floor(scaled, out=scaled)
+        limits = np.iinfo(samples.dtype)
+        np.clip(scaled, limits.min, limits.max, out=scaled)
+        
+        return scaled.astype(samples.dtype)
+    
+    def _chunk_dbfs(
+        self,
+        frame_energy: "np.ndarray",
+        frame_rate: int,
+        channels: int,
+        sample_width: int,
+        chunk_size: int,
+    ) -> "np.ndarray":
+        """
+        Compute the dBFS of consecutive chunk_size ms chunks in one pass.
+        
+        Matches pydub's AudioSegment.dBFS: RMS over all channels' samples
+        relative to full scale, -inf for digital silence. The last chunk
+        may be shorter than chunk_size. Chunk boundaries are converted
+        from milliseconds to frames the way AudioSegment slicing does, so
+        at rates that are not a multiple of 1000 / chunk_size Hz the
+        chunks line up with pydub's instead of drifting from them.
+        """
+        duration_ms = round(1000 * len(frame_energy) / frame_rate)
+        bounds_ms = np.minimum(np.arange(0, duration_ms + chunk_size, chunk_size), duration_ms)
+        bounds = (bounds_ms * frame_rate / 1000).astype(np.int64)
+        counts = np.diff(bounds)
+        
+        # reduceat needs in-range indices; empty chunks are zeroed below
+        energy = np.add.reduceat(frame_energy, np.minimum(bounds[:-1], len(frame_energy) - 1))
+        energy[counts == 0] = 0
+        
+        rms = np.sqrt(energy / np.maximum(counts * channels, 1))
+        with np.errstate(divide="ignore"):
+            return 20 * np.log10(rms / 2 ** (sample_width * 8 - 1))
+    
+    def _detect_leading_silence(
+        self,
+        frame_energy: "np.ndarray",
+        frame_rate: int,
+        channels: int,
+        sample_width: int,
+        threshold_dbfs: float,
+        chunk_size: int,
+    ) -> Optional[int]:
+        """Return the length in ms of the leading silence, or None if all silent."""
+        if not len(frame_energy):
+            return None
+        
+        loud = self._chunk_dbfs(
+            frame_energy, frame_rate, channels, sample_width, chunk_size
+        ) >= threshold_dbfs
+        if not loud.any():
+            return None
+        return int(np.argmax(loud)) * chunk_size
+    
     def _remove_silence(
+        self,
+        samples: "np.ndarray",
+        frame_rate: int,
+        sample_width: int,
+        threshold_dbfs: float = -50.0,
+        chunk_size: int = 10,
+    ) -> "np.ndarray":
+        """
+        Remove leading and trailing silence from samples.
+        
+        Trim points are found on a millisecond grid and converted to
+        frames the way AudioSegment slicing does, so the result matches
+        trimming the equivalent AudioSegment.
+        """
+        frame_energy = np.square(samples, dtype=np.float64).sum(axis=1)
+        args = (frame_rate, samples.shape[1], sample_width, threshold_dbfs, chunk_size)
+        
+        start_trim = self._detect_leading_silence(frame_energy, *args)
+        if start_trim is None:
+            return samples[:0]
+        # Scan the tail through a reversed view rather than a reversed copy
+        end_trim = self._detect_leading_silence(frame_energy[::-1], *args)
+        
+        duration_ms = round(1000 * len(samples) / frame_rate)
+        start = int(start_trim * frame_rate / 1000)
+        end = int((duration_ms - end_trim) * frame_rate / 1000)
+        return samples[start:end]
+    
+    def _detect_leading_silence_pydub(
+        self,
+        sound: AudioSegment,
+        threshold_dbfs: float,
+        chunk_size: int,
+    ) -> int:
+        """Slice-by-slice leading silence scan, used when numpy is missing."""
+        trim_ms = 0
+        while sound[trim_ms:trim_ms + chunk_size].dBFS < threshold_dbfs:
+            trim_ms += chunk_size
+            if trim_ms >= len(sound):
+                return len(sound)
+        return trim_ms
+    
+    def _remove_silence_pydub(
         self,
         audio: AudioSegment,
         threshold_dbfs: float = -50.0,
         chunk_size: int = 10,
     ) -> AudioSegment:
-        """Remove leading and trailing silence from audio."""
-        def detect_leading_silence(sound: AudioSegment, thresh: float) -> int:
-            trim_ms = 0
-            while sound[trim_ms:trim_ms + chunk_size].dBFS < thresh:
-                trim_ms += chunk_size
-                if trim_ms >= len(sound):
-                    return len(sound)
-            return trim_ms
-        
-        start_trim = detect_leading_silence(audio, threshold_dbfs)
-        end_trim = detect_leading_silence(audio.reverse(), threshold_dbfs)
+        """Remove leading and trailing silence from audio using pydub slicing."""
+        start_trim = self._detect_leading_silence_pydub(audio, threshold_dbfs, chunk_size)
+        end_trim = self._detect_leading_silence_pydub(audio.reverse(), threshold_dbfs, chunk_size)
         
         duration = len(audio)
         return audio[start_trim:duration - end_trim]
     
+    def _convert_samples(
+        self,
+        audio: AudioSegment,
+        sample_rate: Optional[int],
+        channels: Optional[int],
+        normalize_audio: bool,
+        remove_silence: bool,
+        silence_threshold: float,
+    ) -> AudioSegment:
+        """
+        Run the enabled conversion stages on one numpy array.
+        
+        The buffer is decoded once, every stage works on the array, and a
+        single AudioSegment is built at the end.
+        """
+        samples = self._audio_to_samples(audio)
+        frame_rate = audio.frame_rate
+        
+        if sample_rate is not None and sample_rate != frame_rate:
+            logger.debug(f"Resampling from {frame_rate}Hz to {sample_rate}Hz")
+            samples = self._resample(samples, frame_rate, sample_rate, audio.sample_width)
+            frame_rate = sample_rate
+        
+        if channels is not None and channels != samples.shape[1]:
+            logger.debug(f"Converting from {samples.shape[1]} to {channels} channels")
+            samples = self._set_channels(samples, channels)
+        
+        if normalize_audio:
+            logger.debug("Normalizing audio")
+            samples = self._normalize(samples, audio.sample_width)
+        
+        if remove_silence:
+            logger.debug(f"Removing silence (threshold: {silence_threshold}dBFS)")
+            samples = self._remove_silence(
+                samples, frame_rate, audio.sample_width, silence_threshold
+            )
+        
+        return self._samples_to_audio(samples, frame_rate, audio.sample_width)
+    
+    def _convert_segment(
+        self,
+        audio: AudioSegment,
+        sample_rate: Optional[int],
+        channels: Optional[int],
+        normalize_audio: bool,
+        remove_silence: bool,
+        silence_threshold: float,
+    ) -> AudioSegment:
+        """Run the enabled conversion stages with pydub, used when numpy is missing."""
+        if sample_rate is not None and sample_rate != audio.frame_rate:
+            logger.debug(f"Resampling from {audio.frame_rate}Hz to {sample_rate}Hz")
+            audio = audio.set_frame_rate(sample_rate)
+        
+        if channels is not None and channels != audio.channels:
+            logger.debug(f"Converting from {audio.channels} to {channels} channels")
+            audio = audio.set_channels(channels)
+        
+        if normalize_audio:
+            logger.debug("Normalizing audio")
+            audio = normalize(audio)
+        
+        if remove_silence:
+            logger.debug(f"Removing silence (threshold: {silence_threshold}dBFS)")
+            audio = self._remove_silence_pydub(audio, silence_threshold)
+        
+        return audio
+    
     def process(
         self,
         input_path: Path,
@@ -165,24 +430,16 @@ class FormatConverter(AudioProcessor):
             original_sample_rate = audio.frame_rate
             original_channels = audio.channels
             
-            # Apply sample rate conversion if requested
-            if sample_rate is not None and sample_rate != audio.frame_rate:
-                logger.debug(f"Resampling from {audio.frame_rate}Hz to {sample_rate}Hz")
-                audio = audio.set_frame_rate(sample_rate)
-            
-            # Apply channel conversion if requested
-            if channels is not None and channels != audio.channels:
-                logger.debug(f"Converting from {audio.channels} to {channels} channels")
-                audio = audio.set_channels(channels)
-            
-            # Apply processing
-            if normalize_audio:
-                logger.debug("Normalizing audio")
-                audio = normalize(audio)
-            
-            if remove_silence:
-                logger.debug(f"Removing silence (threshold: {silence_threshold}dBFS)")
-                audio = self._remove_silence(audio, silence_threshold)
+            # Apply conversion stages
+            convert = self._convert_samples if HAS_NUMPY else self._convert_segment
+            audio = convert(
+                audio,
+                sample_rate,
+                channels,
+                normalize_audio,
+                remove_silence,
+                silence_threshold,
+            )
             
             # Generate output path
             output_path = output_dir / f"{input_path.stem}.{output_format}"
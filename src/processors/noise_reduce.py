@@ -1,8 +1,11 @@
 """Noise reduction processor using spectral subtraction."""
 
+import importlib.util
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from ..core.exceptions import ProcessingError, ValidationError
 from ..core.interfaces import AudioProcessor
@@ -16,18 +19,96 @@ logger = get_logger(__name__)
 # Optional numpy import
 try:
     import numpy as np
-    from numpy.fft import fft, ifft
+    from numpy.lib.stride_tricks import sliding_window_view
     HAS_NUMPY = True
 except ImportError:
     HAS_NUMPY = False
     np = None
 
+# scipy and numba take over a second to import between them, so they are
+# only located here and imported on first use
+HAS_SCIPY = importlib.util.find_spec("scipy") is not None
+HAS_SCIPY_FFT = HAS_SCIPY
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
 try:
     from pydub import AudioSegment
     HAS_PYDUB = True
 except ImportError:
     HAS_PYDUB = False
 
+# numpy dtype of pydub's interleaved raw data by sample width in bytes
+# (pydub stores 8-bit audio signed and widens 24-bit audio to 32-bit)
+SAMPLE_WIDTH_DTYPES = {1: "int8", 2: "int16", 4: "int32"}
+
+
+@lru_cache(maxsize=8)
+def _get_window(window_size: int, dtype: "np.dtype") -> "np.ndarray":
+    """
+    Return the square-root periodic Hann (sine) window for a frame size.
+    
+    Used for both analysis and synthesis: the product is a periodic Hann
+    window, which sums to exactly 1 at 50% overlap, so overlap-add only
+    needs normalizing at the edges. Memoized so channels and files share
+    one read-only copy.
+    """
+    window = np.sin(np.pi * np.arange(window_size) / window_size).astype(dtype)
+    window.flags.writeable = False
+    return window
+
+
+@lru_cache(maxsize=1)
+def _get_fft() -> Tuple[Callable, Callable]:
+    """
+    Return the (rfft, irfft) pair, importing it on first use.
+    
+    scipy.fft is a drop-in for numpy.fft that can split transforms
+    across threads; numpy.fft is the fallback.
+    """
+    if HAS_SCIPY_FFT:
+        from scipy.fft import rfft, irfft
+    else:
+        from numpy.fft import rfft, irfft
+    return rfft, irfft
+
+
+def _subtract_noise_spectrum(spectrum, noise_profile, reduction_factor, smoothing_factor):
+    """
+    Spectral subtraction of a (frames, bins) spectrum, in place.
+    
+    Fuses noise subtraction, the 2% floor, frame-to-frame smoothing and
+    the real gain into one pass, walking bins contiguously per frame.
+    Only used compiled; see _get_subtraction_kernel.
+    """
+    num_frames, num_bins = spectrum.shape
+    prev_magnitude = np.empty(num_bins, dtype=noise_profile.dtype)
+    for i in range(num_frames):
+        for k in range(num_bins):
+            magnitude = abs(spectrum[i, k])
+            reduced = max(
+                magnitude - reduction_factor * noise_profile[k],
+                0.02 * noise_profile[k],
+            )
+            if i > 0:
+                reduced = (
+                    smoothing_factor * prev_magnitude[k] +
+                    (1 - smoothing_factor) * reduced
+                )
+            prev_magnitude[k] = reduced
+            spectrum[i, k] *= reduced / max(magnitude, 1e-12)
+
+
+@lru_cache(maxsize=1)
+def _get_subtraction_kernel() -> Callable:
+    """
+    Import numba and compile _subtract_noise_spectrum on first use.
+    
+    Compiled without the GIL so the per-channel worker threads run it
+    in parallel.
+    """
+    from numba import njit
+    return njit(cache=True, nogil=True)(_subtract_noise_spectrum)
+
 
 class NoiseReducer(AudioProcessor):
     """
@@ -109,43 +190,46 @@ class NoiseReducer(AudioProcessor):
             )
     
     def _audio_to_samples(self, audio: "AudioSegment") -> "np.ndarray":
-        """Convert AudioSegment to numpy array of samples."""
-        samples = np.array(audio.get_array_of_samples())
+        """
+        Convert AudioSegment to a (channels, frames) array of samples.
         
-        # Normalize to -1.0 to 1.0
-        max_val = float(2 ** (audio.sample_width * 8 - 1))
-        samples = samples.astype(np.float64) / max_val
+        Each channel is deinterleaved into its own contiguous row, so the
+        framing and FFTs of the STFT read memory sequentially.
+        """
+        if audio.sample_width not in SAMPLE_WIDTH_DTYPES:
+            raise ProcessingError(f"Unsupported sample width: {audio.sample_width} bytes")
         
-        # Handle stereo by reshaping
-        if audio.channels == 2:
-            samples = samples.reshape((-1, 2))
-        else:
-            samples = samples.reshape((-1, 1))
+        interleaved = np.frombuffer(
+            audio.raw_data, dtype=SAMPLE_WIDTH_DTYPES[audio.sample_width]
+        ).reshape((-1, audio.channels))
+        
+        # Deinterleave and convert in one pass, then normalize to -1.0 to 1.0
+        # (float32 is ample for 16-bit sources)
+        samples = interleaved.T.astype(np.float32, order="C")
+        samples *= 1.0 / float(2 ** (audio.sample_width * 8 - 1))
         
         return samples
     
     def _samples_to_audio(
         self,
-        samples: "np.ndarray",
+        samples: Sequence["np.ndarray"],
         sample_rate: int,
         sample_width: int,
         channels: int,
     ) -> "AudioSegment":
-        """Convert numpy samples back to AudioSegment."""
-        # Flatten if stereo
-        if channels == 2:
-            samples = samples.flatten()
-        else:
-            samples = samples.ravel()
-        
-        # Convert back to integer range
+        """Interleave per-channel sample rows back into an AudioSegment."""
+        # Convert back to the integer range of the original sample width
         max_val = float(2 ** (sample_width * 8 - 1))
-        samples = np.clip(samples * max_val, -max_val, max_val - 1)
-        samples = samples.astype(np.int16)
+        scale_dtype = np.float64 if sample_width == 4 else np.float32
+        interleaved = np.empty((len(samples[0]), channels), dtype=scale_dtype)
+        for ch, channel_samples in enumerate(samples):
+            np.multiply(channel_samples, max_val, out=interleaved[:, ch])
+        np.clip(interleaved, -max_val, max_val - 1, out=interleaved)
+        pcm = interleaved.astype(SAMPLE_WIDTH_DTYPES[sample_width])
         
         # Create AudioSegment
         audio = AudioSegment(
-            samples.tobytes(),
+            pcm.tobytes(),
             frame_rate=sample_rate,
             sample_width=sample_width,
             channels=channels,
@@ -168,29 +252,80 @@ class NoiseReducer(AudioProcessor):
             window_size: FFT window size
             
         Returns:
-            Average noise magnitude spectrum
+            Average noise magnitude spectrum (window_size // 2 + 1 rfft bins)
         """
         noise_section = samples[:noise_samples]
+        if len(noise_section) < window_size:
+            return np.zeros(window_size // 2 + 1, dtype=samples.dtype)
         
-        # Use overlapping windows
+        # Use overlapping windows, transformed in one batch
         hop_size = window_size // 2
-        num_windows = max(1, (len(noise_section) - window_size) // hop_size + 1)
+        window = _get_window(window_size, samples.dtype)
+        frames = sliding_window_view(noise_section, window_size)[::hop_size] * window
+        rfft, _ = _get_fft()
+        fft_kwargs = {"workers": -1} if HAS_SCIPY_FFT else {}
+        
+        return np.abs(rfft(frames, axis=1, **fft_kwargs)).mean(axis=0)
+    
+    def _overlap_add(
+        self,
+        frames: "np.ndarray",
+        hop_size: int,
+        output: "np.ndarray",
+    ) -> None:
+        """
+        Overlap-add (num_frames, window_size) frames into output in place.
+        
+        With window_size a multiple of hop_size, every window_size // hop_size-th
+        frame tiles the signal without overlap, so each such group is added
+        as one contiguous slice.
+        """
+        stride = frames.shape[1] // hop_size
+        for offset in range(stride):
+            group = frames[offset::stride]
+            start = offset * hop_size
+            output[start:start + group.size] += group.ravel()
+    
+    def _smooth_frames(
+        self,
+        magnitudes: "np.ndarray",
+        smoothing_factor: float,
+    ) -> "np.ndarray":
+        """
+        Smooth magnitudes across frames with a one-pole recursion.
         
-        noise_spectrum = np.zeros(window_size)
-        window = np.hanning(window_size)
+        Computes y[i] = s * y[i - 1] + (1 - s) * x[i] with y[0] = x[0] along
+        axis 0 of a (num_frames, bins) array. With scipy this is one lfilter
+        call whose initial state reproduces y[0] = x[0]; otherwise a loop
+        over frames, each step vectorized across bins. With no smoothing
+        the input is returned as is.
+        """
+        if smoothing_factor == 0:
+            return magnitudes
         
-        for i in range(num_windows):
-            start = i * hop_size
-            end = start + window_size
-            if end > len(noise_section):
-                break
+        if HAS_SCIPY:
+            from scipy.signal import lfilter
             
-            windowed = noise_section[start:end] * window
-            spectrum = np.abs(fft(windowed))
-            noise_spectrum += spectrum
+            # Coefficients in the magnitude dtype keep lfilter from upcasting
+            b = np.array([1 - smoothing_factor], dtype=magnitudes.dtype)
+            a = np.array([1.0, -smoothing_factor], dtype=magnitudes.dtype)
+            initial_state = smoothing_factor * magnitudes[:1]
+            smoothed, _ = lfilter(
+                b,
+                a,
+                magnitudes,
+                axis=0,
+                zi=initial_state,
+            )
+            return smoothed
         
-        noise_spectrum /= num_windows
-        return noise_spectrum
+        smoothed = magnitudes.copy()
+        for i in range(1, len(smoothed)):
+            smoothed[i] = (
+                smoothing_factor * smoothed[i - 1] +
+                (1 - smoothing_factor) * smoothed[i]
+            )
+        return smoothed
     
     def _spectral_subtraction(
         self,
@@ -204,61 +339,68 @@ class NoiseReducer(AudioProcessor):
         
         Args:
             samples: Audio samples (mono)
-            noise_profile: Estimated noise spectrum
+            noise_profile: Estimated noise spectrum (rfft bins)
             reduction_factor: How much to reduce noise
             smoothing_factor: Smoothing between frames
             
         Returns:
             Processed audio samples
         """
-        window_size = len(noise_profile)
+        window_size = 2 * (len(noise_profile) - 1)
         hop_size = window_size // 2
-        window = np.hanning(window_size)
+        window = _get_window(window_size, samples.dtype)
         
         # Prepare output array
-        output = np.zeros(len(samples))
-        window_sum = np.zeros(len(samples))
+        output = np.zeros(len(samples), dtype=samples.dtype)
         
-        # Previous magnitude for smoothing
-        prev_mag = None
+        num_frames = len(range(0, len(samples) - window_size, hop_size))
+        if num_frames == 0:
+            return output
         
-        for i in range(0, len(samples) - window_size, hop_size):
-            # Extract and window frame
-            frame = samples[i:i + window_size] * window
-            
-            # FFT
-            spectrum = fft(frame)
+        # Extract and window all frames at once: (num_frames, window_size)
+        frames = sliding_window_view(samples, window_size)[:num_frames * hop_size:hop_size]
+        rfft, irfft = _get_fft()
+        fft_kwargs = {"workers": -1} if HAS_SCIPY_FFT else {}
+        spectrum = rfft(frames * window, axis=1, **fft_kwargs)
+        
+        if HAS_NUMBA:
+            subtract_noise = _get_subtraction_kernel()
+            subtract_noise(spectrum, noise_profile, reduction_factor, smoothing_factor)
+        else:
             magnitude = np.abs(spectrum)
-            phase = np.angle(spectrum)
             
             # Subtract noise
             magnitude_reduced = magnitude - reduction_factor * noise_profile
             
             # Apply floor to avoid negative values and musical noise
             floor = 0.02 * noise_profile
-            magnitude_reduced = np.maximum(magnitude_reduced, floor)
+            np.maximum(magnitude_reduced, floor, out=magnitude_reduced)
             
             # Smooth with previous frame to reduce artifacts
-            if prev_mag is not None:
-                magnitude_reduced = (
-                    smoothing_factor * prev_mag +
-                    (1 - smoothing_factor) * magnitude_reduced
-                )
-            prev_mag = magnitude_reduced.copy()
-            
-            # Reconstruct spectrum
-            spectrum_reduced = magnitude_reduced * np.exp(1j * phase)
+            magnitude_reduced = self._smooth_frames(magnitude_reduced, smoothing_factor)
             
-            # IFFT
-            frame_reduced = np.real(ifft(spectrum_reduced))
-            
-            # Overlap-add
-            output[i:i + window_size] += frame_reduced * window
-            window_sum[i:i + window_size] += window ** 2
+            # Scale the original spectrum by the real gain |X'| / |X|, which
+            # keeps the phase without an angle/exp round trip
+            np.maximum(magnitude, 1e-12, out=magnitude)
+            np.divide(magnitude_reduced, magnitude, out=magnitude_reduced)
+            spectrum *= magnitude_reduced
+        
+        # Transform back
+        if HAS_SCIPY_FFT:
+            # The spectrum is ours, so irfft may reuse its memory
+            fft_kwargs["overwrite_x"] = True
+        frames_reduced = irfft(spectrum, n=window_size, axis=1, **fft_kwargs)
         
-        # Normalize by window sum (avoid division by zero)
-        window_sum = np.maximum(window_sum, 1e-8)
-        output = output / window_sum
+        # Overlap-add. The squared windows sum to 1 wherever two frames
+        # overlap; only the first hop and the last frame's second half are
+        # covered by a single frame, so only they are divided by its window
+        frames_reduced *= window
+        self._overlap_add(frames_reduced, hop_size, output)
+        
+        edge_sum = np.maximum(window * window, 1e-8)
+        last_start = (num_frames - 1) * hop_size
+        output[:hop_size] /= edge_sum[:hop_size]
+        output[last_start + hop_size:last_start + window_size] /= edge_sum[hop_size:]
         
         return output
     
@@ -270,12 +412,21 @@ class NoiseReducer(AudioProcessor):
         reduction_factor: float,
         smoothing_factor: float,
     ) -> "np.ndarray":
-        """Process a single audio channel."""
+        """
+        Process a single audio channel.
+        
+        If the noise section is digitally silent there is nothing to
+        subtract, so the STFT is skipped and the samples are returned as is.
+        """
         # Estimate noise profile
         noise_profile = self._estimate_noise_profile(
             samples, noise_floor_samples, window_size
         )
         
+        if noise_profile.max() < 1e-10:
+            logger.debug("Noise profile is silent, skipping spectral subtraction")
+            return samples
+        
         # Apply spectral subtraction
         processed = self._spectral_subtraction(
             samples, noise_profile, reduction_factor, smoothing_factor
@@ -328,7 +479,7 @@ class NoiseReducer(AudioProcessor):
             window_size = 2048  # Good balance of frequency/time resolution
             reduction_factor = 10 ** (noise_reduce_db / 20)
             
-            if noise_floor_samples >= len(samples):
+            if noise_floor_samples >= samples.shape[1]:
                 raise ValidationError(
                     f"Noise floor duration ({noise_floor_ms}ms) is too long for audio"
                 )
@@ -338,25 +489,24 @@ class NoiseReducer(AudioProcessor):
                 f"{noise_floor_ms}ms noise floor"
             )
             
-            # Process each channel
-            processed_channels = []
-            for ch in range(samples.shape[1]):
+            # Process channels concurrently; the FFTs and array math
+            # release the GIL, so threads are enough
+            def process_channel(ch: int) -> "np.ndarray":
                 logger.debug(f"Processing channel {ch + 1}")
-                processed = self._process_channel(
-                    samples[:, ch],
+                return self._process_channel(
+                    samples[ch],
                     noise_floor_samples,
                     window_size,
                     reduction_factor,
                     smoothing_factor,
                 )
-                processed_channels.append(processed)
             
-            # Combine channels
-            processed_samples = np.column_stack(processed_channels)
+            with ThreadPoolExecutor(max_workers=len(samples)) as executor:
+                processed_channels = list(executor.map(process_channel, range(len(samples))))
             
-            # Convert back to audio
+            # Interleave the channels back into audio
             processed_audio = self._samples_to_audio(
-                processed_samples,
+                processed_channels,
                 audio.frame_rate,
                 audio.sample_width,
                 audio.channels,
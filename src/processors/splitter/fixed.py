@@ -1,14 +1,20 @@
 """Fixed duration audio splitter."""
 
+import json
+import os
+import subprocess
 import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from pydub import AudioSegment
+from pydub.utils import get_prober_name
 
 from ...core.exceptions import ProcessingError, ValidationError
 from ...core.types import ParameterSpec, ProcessResult
-from ...utils.audio import export_audio, load_audio
+from ...utils.audio import calculate_segments, export_audio, load_audio
 from ...utils.file_ops import ensure_directory
 from ...utils.logger import get_logger
 from ...utils.validators import validate_duration, validate_input_file
@@ -35,6 +41,10 @@ class FixedSplitter(BaseSplitter):
     # Maximum segment duration: 1 hour
     MAX_DURATION_MS = 3_600_000.0
     
+    # Lossy formats whose segments are cut by ffmpeg stream copy when the
+    # output format matches the input (no decode, no generational loss)
+    STREAM_COPY_FORMATS = frozenset({"mp3"})
+    
     @property
     def name(self) -> str:
         return "splitter-fixed"
@@ -83,6 +93,14 @@ class FixedSplitter(BaseSplitter):
                 min_value=0.0,
                 max_value=5000.0,
             ),
+            ParameterSpec(
+                name="max_workers",
+                type="integer",
+                description="Segments exported concurrently (None = CPU count)",
+                required=False,
+                default=None,
+                min_value=1,
+            ),
         ]
     
     def _calculate_segments(
@@ -102,29 +120,167 @@ class FixedSplitter(BaseSplitter):
         Returns:
             List of (start_ms, end_ms) tuples
         """
-        total_duration = len(audio)
-        segments = []
-        start = 0.0
+        return self._segments_for_duration(len(audio), duration_ms, min_last_segment_ms)
+    
+    def _segments_for_duration(
+        self,
+        total_duration: float,
+        duration_ms: float,
+        min_last_segment_ms: float = 1000.0,
+    ) -> List[Tuple[float, float]]:
+        """Calculate fixed-duration segment boundaries for a total length.
         
+        Args:
+            total_duration: Length of the audio in milliseconds
+            duration_ms: Target duration per segment
+            min_last_segment_ms: Minimum last segment length
+            
+        Returns:
+            List of (start_ms, end_ms) tuples
+        """
         # Edge case: file shorter than requested duration
         if total_duration <= duration_ms:
             logger.debug(f"File duration ({total_duration}ms) <= segment duration ({duration_ms}ms), returning single segment")
             return [(0.0, float(total_duration))]
         
-        while start < total_duration:
-            end = min(start + duration_ms, total_duration)
-            
-            # Cleanup: merge short last segment with previous
-            remaining = total_duration - end
-            if 0 < remaining < min_last_segment_ms:
-                end = total_duration
-                logger.debug(f"Merging short remainder ({remaining}ms) with previous segment")
-            
-            segments.append((start, end))
-            start = end
+        segments = calculate_segments(total_duration, duration_ms, min_last_segment_ms)
+        
+        last_start, last_end = segments[-1]
+        if last_end - last_start > duration_ms:
+            logger.debug(f"Merged short remainder into last segment ({last_end - last_start}ms)")
         
         return segments
     
+    def _probe_duration_ms(self, input_path: Path) -> Optional[float]:
+        """
+        Read the duration of a file from its container with ffprobe.
+        
+        Returns:
+            Duration in milliseconds, or None if it could not be probed
+        """
+        command = [
+            get_prober_name(),
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "json",
+            str(input_path),
+        ]
+        
+        try:
+            completed = subprocess.run(command, capture_output=True, check=True)
+            duration_s = float(json.loads(completed.stdout)["format"]["duration"])
+        except (OSError, subprocess.CalledProcessError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Could not probe duration of {input_path}: {e}")
+            return None
+        
+        return float(round(duration_s * 1000))
+    
+    def _can_stream_copy(self, input_path: Path, output_format: str) -> bool:
+        """Check whether segments can be stream-copied from the input file."""
+        input_format = input_path.suffix.lower().lstrip(".")
+        return input_format == output_format and input_format in self.STREAM_COPY_FORMATS
+    
+    def _copy_segments(
+        self,
+        input_path: Path,
+        segments: List[Tuple[float, float]],
+        output_paths: List[Path],
+    ) -> List[Path]:
+        """
+        Cut all segments out of the input file in one ffmpeg stream copy.
+        
+        The segment muxer splits the encoded stream at the segment starts
+        in a single pass, so no samples are decoded, nothing is re-encoded
+        and consecutive segments neither overlap nor leave gaps. Cuts snap
+        to the codec's frame boundaries (about 26 ms for MP3).
+        
+        Raises:
+            ProcessingError: If ffmpeg fails
+        """
+        command = [
+            AudioSegment.converter,
+            "-y",
+            "-v", "error",
+            "-i", str(input_path),
+            "-map", "0:a",
+            "-c", "copy",
+        ]
+        if len(segments) > 1:
+            # Output names follow _generate_segment_filename, numbered from 1
+            prefix, _, extension = output_paths[0].name.rpartition("_segment_001.")
+            pattern = f"{prefix.replace('%', '%%')}_segment_%03d.{extension}"
+            split_times = ",".join(f"{int(start) / 1000:.3f}" for start, _ in segments[1:])
+            command += [
+                "-f", "segment",
+                "-segment_times", split_times,
+                "-segment_start_number", "1",
+                "-reset_timestamps", "1",
+                str(output_paths[0].parent / pattern),
+            ]
+        else:
+            command.append(str(output_paths[0]))
+        
+        completed = subprocess.run(command, capture_output=True)
+        if completed.returncode != 0:
+            error = completed.stderr.decode(errors="replace").strip()
+            raise ProcessingError(f"Stream copy failed for {input_path}: {error}")
+        
+        missing = [path.name for path in output_paths if not path.exists()]
+        if missing:
+            raise ProcessingError(f"Stream copy did not produce: {', '.join(missing)}")
+        
+        return output_paths
+    
+    def _export_segment(
+        self,
+        audio: AudioSegment,
+        start: float,
+        end: float,
+        output_path: Path,
+        output_format: str,
+    ) -> Path:
+        """Slice one segment out of the source audio and export it."""
+        if output_format == "wav" and audio.sample_width > 1:
+            return self._write_wav_segment(audio, start, end, output_path)
+        
+        segment = audio[int(start):int(end)]
+        return export_audio(segment, output_path, format=output_format)
+    
+    def _write_wav_segment(
+        self,
+        audio: AudioSegment,
+        start: float,
+        end: float,
+        output_path: Path,
+    ) -> Path:
+        """
+        Write one segment as WAV straight from the source PCM buffer.
+        
+        Produces the same file as exporting audio[start:end] with pydub,
+        but writes a view of the shared raw data instead of copying it
+        into a new AudioSegment first. 8-bit audio, which WAV stores
+        unsigned, goes through pydub.
+        """
+        frame_width = audio.frame_width
+        start_frame = int(audio.frame_count(ms=min(int(start), len(audio))))
+        end_frame = int(audio.frame_count(ms=min(int(end), len(audio))))
+        data = memoryview(audio.raw_data)[start_frame * frame_width:end_frame * frame_width]
+        
+        with wave.open(str(output_path), "wb") as wav_file:
+            wav_file.setnchannels(audio.channels)
+            wav_file.setsampwidth(audio.sample_width)
+            wav_file.setframerate(audio.frame_rate)
+            wav_file.setnframes(end_frame - start_frame)
+            wav_file.writeframesraw(data)
+            # Pad with silence where millisecond rounding overshoots the
+            # last frame, as pydub's slicing does
+            missing_bytes = (end_frame - start_frame) * frame_width - len(data)
+            if missing_bytes:
+                wav_file.writeframesraw(bytes(missing_bytes))
+        
+        logger.debug(f"Exported audio to {output_path}")
+        return output_path
+    
     def process(
         self,
         input_path: Path,
@@ -132,6 +288,7 @@ class FixedSplitter(BaseSplitter):
         duration_ms: float,
         output_format: str = "mp3",
         min_last_segment_ms: float = 1000.0,
+        max_workers: Optional[int] = None,
         **kwargs
     ) -> ProcessResult:
         """
@@ -143,6 +300,7 @@ class FixedSplitter(BaseSplitter):
             duration_ms: Duration of each segment in milliseconds
             output_format: Output audio format
             min_last_segment_ms: Minimum length for last segment
+            max_workers: Maximum segments exported at once (default: CPU count)
             
         Returns:
             ProcessResult with success status and output paths
@@ -157,29 +315,50 @@ class FixedSplitter(BaseSplitter):
             # Ensure output directory exists
             ensure_directory(output_dir)
             
-            # Load audio
-            logger.info(f"Loading audio: {input_path}")
-            audio = load_audio(input_path)
+            # Cut segments without re-encoding when the format allows it;
+            # then only the duration is needed, so skip decoding if it probes
+            stream_copy = self._can_stream_copy(input_path, output_format)
+            audio = None
+            total_duration = None
+            if stream_copy:
+                logger.debug("Output format matches input, using stream copy")
+                total_duration = self._probe_duration_ms(input_path)
+            
+            if total_duration is None:
+                logger.info(f"Loading audio: {input_path}")
+                audio = load_audio(input_path)
+                total_duration = len(audio)
             
             # Calculate segments
-            segments = self._calculate_segments(
-                audio,
+            segments = self._segments_for_duration(
+                total_duration,
                 duration_ms=duration_ms,
                 min_last_segment_ms=min_last_segment_ms,
             )
             
             logger.info(f"Splitting into {len(segments)} segments")
             
-            # Export segments
-            output_paths = []
-            for i, (start, end) in enumerate(segments, 1):
-                segment = audio[int(start):int(end)]
-                output_path = self._generate_segment_filename(
-                    input_path, i, output_dir, output_format
-                )
-                export_audio(segment, output_path, format=output_format)
-                output_paths.append(output_path)
-                logger.debug(f"Created segment {i}: {output_path}")
+            output_paths = [
+                self._generate_segment_filename(input_path, i, output_dir, output_format)
+                for i in range(1, len(segments) + 1)
+            ]
+            
+            if stream_copy:
+                self._copy_segments(input_path, segments, output_paths)
+            else:
+                # Export segments concurrently; each export is an independent
+                # ffmpeg process, so threads overlap the subprocesses
+                workers = min(max_workers or os.cpu_count() or 1, len(segments))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(
+                            self._export_segment, audio, start, end, output_path, output_format
+                        )
+                        for (start, end), output_path in zip(segments, output_paths)
+                    ]
+                    for i, future in enumerate(futures, 1):
+                        future.result()
+                        logger.debug(f"Created segment {i}: {output_paths[i - 1]}")
             
             elapsed_ms = (time.time() - start_time) * 1000
             
@@ -194,10 +373,11 @@ class FixedSplitter(BaseSplitter):
                 metadata={
                     "segment_count": len(output_paths),
                     "duration_ms": duration_ms,
-                    "total_duration_ms": len(audio),
-                    "avg_segment_ms": len(audio) / len(output_paths) if output_paths else 0,
+                    "total_duration_ms": total_duration,
+                    "avg_segment_ms": total_duration / len(output_paths) if output_paths else 0,
                     "output_format": output_format,
                     "input_format": input_path.suffix.lstrip("."),
+                    "stream_copy": stream_copy,
                     "processor": self.name,
                     "version": self.version,
                 },
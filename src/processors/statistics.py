@@ -1,9 +1,11 @@
 """Audio statistics analyzer for extracting audio metrics."""
 
+import importlib.util
 import json
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 from ..core.exceptions import ProcessingError, ValidationError
 from ..core.interfaces import AudioProcessor
@@ -22,12 +24,129 @@ except ImportError:
     HAS_NUMPY = False
     np = None
 
+# numba takes most of a second to import, so it is only located here and
+# imported on first use
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
 try:
     from pydub import AudioSegment
     HAS_PYDUB = True
 except ImportError:
     HAS_PYDUB = False
 
+# Optional soundfile import - PCM files are then analyzed block by block
+# instead of being decoded into memory whole
+try:
+    import soundfile as sf
+    HAS_SOUNDFILE = True
+except ImportError:
+    HAS_SOUNDFILE = False
+    sf = None
+
+# numpy dtype of pydub's interleaved raw data by sample width in bytes
+# (pydub stores 8-bit audio signed and widens 24-bit audio to 32-bit)
+SAMPLE_WIDTH_DTYPES = {1: "int8", 2: "int16", 4: "int32"}
+
+# soundfile subtypes read as the same integers pydub decodes them to,
+# by pydub's sample width in bytes
+STREAM_SUBTYPE_WIDTHS = {"PCM_16": 2, "PCM_24": 4, "PCM_32": 4}
+
+# Frames analyzed per block (1 MB of float64 per channel)
+BLOCK_FRAMES = 1 << 17
+
+# Samples from which the numba kernel pays for importing numba (about
+# 12 minutes of 44.1 kHz stereo); once loaded it is used for any length
+NUMBA_MIN_SAMPLES = 1 << 26
+
+
+def _sum_block_levels(
+    block,
+    frame_offset,
+    mix_scale,
+    chunk_starts,
+    chunk_end,
+    chunk_energy,
+    window,
+    window_energy,
+):
+    """
+    Fused level sums over one integer (frames, channels) block.
+    
+    Walks the block once, adding frame energy to the pydub chunks and
+    the squared normalized mixdown to the dynamic range windows, and
+    returns the block's (total energy, mixdown energy, mixdown peak).
+    Only used compiled; see _get_levels_kernel.
+    """
+    num_frames, channels = block.shape
+    total_energy = 0.0
+    mix_energy = 0.0
+    peak = 0.0
+    
+    # Chunk of the first frame and the frame where the next chunk starts
+    chunk = np.searchsorted(chunk_starts, frame_offset, side="right") - 1
+    next_start = chunk_end
+    if chunk + 1 < len(chunk_starts):
+        next_start = min(chunk_starts[chunk + 1], chunk_end)
+    
+    # Stereo is averaged into one value per frame; other layouts stay
+    # interleaved. Track the window of the first value and its remainder
+    values_per_frame = 1 if channels == 2 else channels
+    position = frame_offset * values_per_frame
+    window_index = position // window
+    window_left = window - position % window
+    
+    # Sums of the current chunk and window, stored when they end
+    chunk_sum = 0.0
+    window_sum = 0.0
+    for i in range(num_frames):
+        energy = 0.0
+        for c in range(channels):
+            value = float(block[i, c])
+            energy += value * value
+        total_energy += energy
+        
+        frame = frame_offset + i
+        if frame >= next_start and frame < chunk_end:
+            chunk_energy[chunk] += chunk_sum
+            chunk_sum = 0.0
+            while frame >= next_start:
+                chunk += 1
+                next_start = chunk_end
+                if chunk + 1 < len(chunk_starts):
+                    next_start = min(chunk_starts[chunk + 1], chunk_end)
+        if frame < chunk_end:
+            chunk_sum += energy
+        
+        for c in range(values_per_frame):
+            if channels == 2:
+                mix = (float(block[i, 0]) + float(block[i, 1])) * 0.5 * mix_scale
+            else:
+                mix = float(block[i, c]) * mix_scale
+            mix_energy += mix * mix
+            peak = max(peak, abs(mix))
+            window_sum += mix * mix
+            window_left -= 1
+            if window_left == 0:
+                if window_index < len(window_energy):
+                    window_energy[window_index] += window_sum
+                window_sum = 0.0
+                window_index += 1
+                window_left = window
+    
+    if chunk >= 0:
+        chunk_energy[chunk] += chunk_sum
+    if window_index < len(window_energy):
+        window_energy[window_index] += window_sum
+    
+    return total_energy, mix_energy, peak
+
+
+@lru_cache(maxsize=1)
+def _get_levels_kernel() -> Callable:
+    """Import numba and compile _sum_block_levels on first use."""
+    from numba import njit
+    return njit(cache=True)(_sum_block_levels)
+
 
 class AudioStatistics(AudioProcessor):
     """
@@ -112,24 +231,180 @@ class AudioStatistics(AudioProcessor):
                 f"Install with: pip install {' '.join(missing)}"
             )
     
-    def _audio_to_samples(self, audio: "AudioSegment") -> "np.ndarray":
-        """Convert AudioSegment to numpy array of samples."""
-        samples = np.array(audio.get_array_of_samples())
+    def _open_stream(self, input_path: Path) -> Optional["sf.SoundFile"]:
+        """
+        Open an integer PCM file for block-wise reading with soundfile.
         
-        # Handle stereo by taking mean
-        if audio.channels == 2:
-            samples = samples.reshape((-1, 2))
-            samples = samples.mean(axis=1)
+        Returns:
+            Open SoundFile, or None if the file should be decoded by pydub
+            (soundfile missing, 8-bit, float or compressed audio)
+        """
+        if not HAS_SOUNDFILE:
+            return None
         
-        # Normalize to -1.0 to 1.0
-        max_val = float(2 ** (audio.sample_width * 8 - 1))
-        samples = samples.astype(np.float64) / max_val
+        try:
+            stream = sf.SoundFile(str(input_path))
+        except RuntimeError as e:
+            logger.debug(f"Not streaming {input_path}: {e}")
+            return None
         
-        return samples
+        if stream.subtype not in STREAM_SUBTYPE_WIDTHS:
+            stream.close()
+            return None
+        return stream
     
-    def _calculate_rms(self, samples: "np.ndarray") -> float:
-        """Calculate RMS level."""
-        return float(np.sqrt(np.mean(samples ** 2)))
+    def _stream_blocks(self, stream: "sf.SoundFile") -> Iterator["np.ndarray"]:
+        """Read integer (frames, channels) blocks from an open SoundFile."""
+        sample_width = STREAM_SUBTYPE_WIDTHS[stream.subtype]
+        out = np.empty((BLOCK_FRAMES, stream.channels), dtype=SAMPLE_WIDTH_DTYPES[sample_width])
+        for block in stream.blocks(out=out):
+            if stream.subtype == "PCM_24":
+                # pydub widens negative 24-bit samples with a 0xFF low byte
+                np.add(block, 255, out=block, where=block < 0)
+            yield block
+    
+    def _audio_blocks(self, audio: "AudioSegment") -> Iterator["np.ndarray"]:
+        """Yield integer (frames, channels) views of an AudioSegment's raw data."""
+        if audio.sample_width not in SAMPLE_WIDTH_DTYPES:
+            raise ProcessingError(f"Unsupported sample width: {audio.sample_width} bytes")
+        
+        raw = np.frombuffer(audio.raw_data, dtype=SAMPLE_WIDTH_DTYPES[audio.sample_width])
+        frames = raw.reshape(-1, audio.channels)
+        for start in range(0, len(frames), BLOCK_FRAMES):
+            yield frames[start:start + BLOCK_FRAMES]
+    
+    def _add_chunk_sums(
+        self,
+        sums: "np.ndarray",
+        values: "np.ndarray",
+        offset: int,
+        chunk_starts: "np.ndarray",
+        end: int,
+    ) -> None:
+        """
+        Add a block of values to the running per-chunk sums.
+        
+        Args:
+            sums: Per-chunk totals, updated in place
+            values: Values at positions offset, offset + 1, ...
+            offset: Position of the first value
+            chunk_starts: Sorted start position of each chunk
+            end: Position where the last chunk ends
+        """
+        stop = min(offset + len(values), end)
+        if stop <= offset:
+            return
+        
+        first = int(np.searchsorted(chunk_starts, offset, side="right")) - 1
+        last = int(np.searchsorted(chunk_starts, stop, side="left"))
+        boundaries = np.concatenate(([0], chunk_starts[first + 1:last] - offset))
+        sums[first:last] += np.add.reduceat(values[:stop - offset], boundaries, dtype=np.float64)
+    
+    def _measure_levels(
+        self,
+        blocks: Iterable["np.ndarray"],
+        frame_rate: int,
+        channels: int,
+        sample_width: int,
+        total_frames: int,
+        chunk_size_ms: int,
+    ) -> Dict[str, Any]:
+        """
+        Measure levels in one pass over integer (frames, channels) blocks.
+        
+        RMS, peak and dynamic range are measured on the normalized stereo
+        mixdown. Chunk and overall dBFS reproduce pydub's dBFS: the same
+        millisecond-to-frame rounding, silence padding and truncated
+        integer RMS over all channels. Memory use is bounded by the block
+        size plus one value per chunk. Long inputs are summed by the
+        compiled _sum_block_levels kernel when numba is installed.
+        
+        Returns:
+            Dict with rms, peak, chunk RMS values for the dynamic range,
+            per-chunk and overall dBFS and the duration in milliseconds
+        """
+        max_val = float(2 ** (sample_width * 8 - 1))
+        duration_ms = round(1000 * (total_frames / frame_rate))
+        
+        # Chunks as pydub slices them: audio[i:i + chunk_size_ms]
+        frames_per_ms = frame_rate / 1000.0
+        starts_ms = np.arange(0, duration_ms, chunk_size_ms)
+        ends_ms = np.minimum(starts_ms + chunk_size_ms, duration_ms)
+        chunk_starts = (starts_ms * frames_per_ms).astype(np.int64)
+        chunk_frames = (ends_ms * frames_per_ms).astype(np.int64) - chunk_starts
+        chunk_end = min(int(chunk_starts[-1] + chunk_frames[-1]), total_frames) if len(starts_ms) else 0
+        chunk_energy = np.zeros(len(chunk_starts))
+        
+        # Whole chunk-long windows of the mixdown for the dynamic range
+        mix_length = total_frames if channels <= 2 else total_frames * channels
+        window = int(frame_rate * chunk_size_ms / 1000)
+        window_count = mix_length // window
+        window_starts = np.arange(window_count) * window
+        window_energy = np.zeros(window_count)
+        
+        total_energy = 0.0
+        mix_energy = 0.0
+        peak = 0.0
+        frame_offset = 0
+        use_kernel = HAS_NUMBA and (
+            total_frames * channels >= NUMBA_MIN_SAMPLES
+            or _get_levels_kernel.cache_info().currsize > 0
+        )
+        sum_levels = _get_levels_kernel() if use_kernel else None
+        for block in blocks:
+            if sum_levels is not None:
+                block_energy, block_mix_energy, block_peak = sum_levels(
+                    block, frame_offset, 1.0 / max_val,
+                    chunk_starts, chunk_end, chunk_energy,
+                    window, window_energy,
+                )
+                total_energy += block_energy
+                mix_energy += block_mix_energy
+                peak = max(peak, block_peak)
+            else:
+                # Integer squares need float64 to stay exact for pydub's dBFS
+                samples = block.astype(np.float64)
+                frame_energy = np.square(samples[:, 0])
+                for channel in range(1, channels):
+                    frame_energy += np.square(samples[:, channel])
+                total_energy += float(frame_energy.sum())
+                self._add_chunk_sums(chunk_energy, frame_energy, frame_offset, chunk_starts, chunk_end)
+                
+                # The normalized mixdown only needs float32 (sums stay float64).
+                # Stereo is averaged; other layouts stay interleaved
+                mix = block.astype(np.float32)
+                if channels == 2:
+                    mix = mix[:, 0] + mix[:, 1]
+                    mix *= np.float32(0.5 / max_val)
+                else:
+                    mix = mix.ravel()
+                    mix *= np.float32(1.0 / max_val)
+                mix_offset = frame_offset if channels <= 2 else frame_offset * channels
+                mix_energy += float(np.einsum("i,i->", mix, mix, dtype=np.float64))
+                if len(mix):
+                    peak = max(peak, float(mix.max()), -float(mix.min()))
+                self._add_chunk_sums(window_energy, np.square(mix), mix_offset, window_starts, window_count * window)
+            
+            frame_offset += len(block)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Chunks overshooting the end are padded with silence, as in pydub
+            chunk_rms = np.floor(np.sqrt(chunk_energy / (chunk_frames * channels)))
+            chunk_dbfs = 20 * np.log10(chunk_rms / max_val)
+            overall_rms = np.floor(np.sqrt(total_energy / (total_frames * channels))) if total_frames else 0.0
+            overall_dbfs = float(20 * np.log10(overall_rms / max_val)) if overall_rms else -float("inf")
+        
+        # Skip a trailing chunk shorter than half a chunk
+        chunk_lengths_ms = np.round(1000 * (chunk_frames / frame_rate))
+        
+        return {
+            "rms": float(np.sqrt(mix_energy / mix_length)) if mix_length else 0.0,
+            "peak": peak,
+            "window_rms": np.sqrt(window_energy / window),
+            "chunk_dbfs": chunk_dbfs[chunk_lengths_ms >= chunk_size_ms // 2],
+            "overall_dbfs": overall_dbfs,
+            "duration_ms": duration_ms,
+        }
     
     def _calculate_rms_db(self, rms: float) -> float:
         """Convert RMS to dB."""
@@ -137,36 +412,22 @@ class AudioStatistics(AudioProcessor):
             return -100.0
         return float(20 * np.log10(rms))
     
-    def _calculate_peak(self, samples: "np.ndarray") -> float:
-        """Calculate peak amplitude."""
-        return float(np.max(np.abs(samples)))
-    
     def _calculate_peak_db(self, peak: float) -> float:
         """Convert peak to dB."""
         if peak <= 0:
             return -100.0
         return float(20 * np.log10(peak))
     
-    def _calculate_dynamic_range(self, samples: "np.ndarray", chunk_size: int) -> float:
-        """Calculate dynamic range in dB."""
-        # Split into chunks and calculate RMS for each
-        num_chunks = len(samples) // chunk_size
-        if num_chunks < 2:
+    def _calculate_dynamic_range(self, window_rms: "np.ndarray") -> float:
+        """Calculate dynamic range in dB from per-window RMS values."""
+        if len(window_rms) < 2:
             return 0.0
         
-        rms_values = []
-        for i in range(num_chunks):
-            chunk = samples[i * chunk_size:(i + 1) * chunk_size]
-            rms = self._calculate_rms(chunk)
-            if rms > 0:
-                rms_values.append(rms)
-        
+        rms_values = window_rms[window_rms > 0]
         if len(rms_values) < 2:
             return 0.0
         
-        rms_values = np.array(rms_values)
-        max_rms = np.percentile(rms_values, 95)  # Avoid outliers
-        min_rms = np.percentile(rms_values, 5)
+        max_rms, min_rms = np.percentile(rms_values, [95, 5])  # Avoid outliers
         
         if min_rms <= 0:
             return 60.0  # Max reasonable dynamic range
@@ -175,32 +436,23 @@ class AudioStatistics(AudioProcessor):
     
     def _calculate_silence_ratio(
         self,
-        audio: "AudioSegment",
+        levels: Dict[str, Any],
         threshold_dbfs: float,
         chunk_size_ms: int,
     ) -> float:
         """Calculate ratio of silent chunks."""
-        if len(audio) < chunk_size_ms:
-            return 0.0 if audio.dBFS > threshold_dbfs else 1.0
+        if levels["duration_ms"] < chunk_size_ms:
+            return 0.0 if levels["overall_dbfs"] > threshold_dbfs else 1.0
         
-        silent_chunks = 0
-        total_chunks = 0
-        
-        for i in range(0, len(audio), chunk_size_ms):
-            chunk = audio[i:i + chunk_size_ms]
-            if len(chunk) >= chunk_size_ms // 2:  # At least half a chunk
-                total_chunks += 1
-                if chunk.dBFS < threshold_dbfs:
-                    silent_chunks += 1
-        
-        if total_chunks == 0:
+        chunk_dbfs = levels["chunk_dbfs"]
+        if not len(chunk_dbfs):
             return 0.0
         
-        return silent_chunks / total_chunks
+        return int(np.count_nonzero(chunk_dbfs < threshold_dbfs)) / len(chunk_dbfs)
     
     def _calculate_vad(
         self,
-        audio: "AudioSegment",
+        levels: Dict[str, Any],
         threshold_dbfs: float,
         chunk_size_ms: int,
     ) -> Dict[str, Any]:
@@ -210,23 +462,19 @@ class AudioStatistics(AudioProcessor):
         Returns:
             Dict with VAD statistics
         """
-        if len(audio) < chunk_size_ms:
-            is_voice = audio.dBFS > threshold_dbfs
+        duration_ms = levels["duration_ms"]
+        if duration_ms < chunk_size_ms:
+            is_voice = levels["overall_dbfs"] > threshold_dbfs
             return {
                 "voice_ratio": 1.0 if is_voice else 0.0,
                 "voice_segments": 1 if is_voice else 0,
-                "avg_segment_duration_ms": len(audio) if is_voice else 0,
-                "total_voice_duration_ms": len(audio) if is_voice else 0,
+                "avg_segment_duration_ms": duration_ms if is_voice else 0,
+                "total_voice_duration_ms": duration_ms if is_voice else 0,
             }
         
-        voice_chunks = []
+        voice_chunks = levels["chunk_dbfs"] > threshold_dbfs
         
-        for i in range(0, len(audio), chunk_size_ms):
-            chunk = audio[i:i + chunk_size_ms]
-            if len(chunk) >= chunk_size_ms // 2:
-                voice_chunks.append(chunk.dBFS > threshold_dbfs)
-        
-        if not voice_chunks:
+        if not len(voice_chunks):
             return {
                 "voice_ratio": 0.0,
                 "voice_segments": 0,
@@ -234,30 +482,14 @@ class AudioStatistics(AudioProcessor):
                 "total_voice_duration_ms": 0,
             }
         
-        # Count voice segments (consecutive voice chunks)
-        voice_segments = 0
-        in_voice = False
-        segment_durations = []
-        current_duration = 0
-        
-        for is_voice in voice_chunks:
-            if is_voice:
-                if not in_voice:
-                    voice_segments += 1
-                    in_voice = True
-                current_duration += chunk_size_ms
-            else:
-                if in_voice:
-                    segment_durations.append(current_duration)
-                    current_duration = 0
-                in_voice = False
+        # Count voice segments (runs of consecutive voice chunks) from the
+        # silence-to-voice transitions
+        transitions = np.diff(voice_chunks.astype(np.int8))
+        voice_segments = int(voice_chunks[0]) + int(np.count_nonzero(transitions == 1))
         
-        if in_voice:
-            segment_durations.append(current_duration)
-        
-        voice_count = sum(voice_chunks)
+        voice_count = int(np.count_nonzero(voice_chunks))
         voice_ratio = voice_count / len(voice_chunks)
-        total_voice_ms = sum(segment_durations)
+        total_voice_ms = voice_count * chunk_size_ms
         avg_duration = total_voice_ms / voice_segments if voice_segments > 0 else 0
         
         return {
@@ -341,34 +573,49 @@ class AudioStatistics(AudioProcessor):
             validate_input_file(input_path)
             ensure_directory(output_dir)
             
-            # Load audio
-            logger.info(f"Loading audio: {input_path}")
-            audio = AudioSegment.from_file(input_path)
-            samples = self._audio_to_samples(audio)
-            
-            # Calculate statistics
-            logger.info("Calculating audio statistics")
-            
-            rms = self._calculate_rms(samples)
-            peak = self._calculate_peak(samples)
+            # Stream integer PCM block by block; decode anything else whole
+            stream = self._open_stream(input_path)
+            if stream is not None:
+                logger.info(f"Streaming audio: {input_path}")
+                with stream:
+                    frame_rate = stream.samplerate
+                    channels = stream.channels
+                    sample_width = STREAM_SUBTYPE_WIDTHS[stream.subtype]
+                    logger.info("Calculating audio statistics")
+                    levels = self._measure_levels(
+                        self._stream_blocks(stream),
+                        frame_rate, channels, sample_width, stream.frames, chunk_size_ms,
+                    )
+            else:
+                logger.info(f"Loading audio: {input_path}")
+                audio = AudioSegment.from_file(input_path)
+                frame_rate = audio.frame_rate
+                channels = audio.channels
+                sample_width = audio.sample_width
+                logger.info("Calculating audio statistics")
+                levels = self._measure_levels(
+                    self._audio_blocks(audio),
+                    frame_rate, channels, sample_width, int(audio.frame_count()), chunk_size_ms,
+                )
             
-            chunk_samples = int(audio.frame_rate * chunk_size_ms / 1000)
-            dynamic_range = self._calculate_dynamic_range(samples, chunk_samples)
+            rms = levels["rms"]
+            peak = levels["peak"]
+            dynamic_range = self._calculate_dynamic_range(levels["window_rms"])
             
-            silence_ratio = self._calculate_silence_ratio(audio, silence_threshold, chunk_size_ms)
-            vad_stats = self._calculate_vad(audio, vad_threshold, chunk_size_ms)
+            silence_ratio = self._calculate_silence_ratio(levels, silence_threshold, chunk_size_ms)
+            vad_stats = self._calculate_vad(levels, vad_threshold, chunk_size_ms)
             
             # Build statistics dict
             stats = {
                 "file": {
                     "name": input_path.name,
                     "path": str(input_path),
-                    "duration_seconds": len(audio) / 1000,
-                    "duration_ms": len(audio),
+                    "duration_seconds": levels["duration_ms"] / 1000,
+                    "duration_ms": levels["duration_ms"],
                     "format": input_path.suffix.lstrip("."),
-                    "sample_rate": audio.frame_rate,
-                    "channels": audio.channels,
-                    "sample_width_bits": audio.sample_width * 8,
+                    "sample_rate": frame_rate,
+                    "channels": channels,
+                    "sample_width_bits": sample_width * 8,
                 },
                 "levels": {
                     "rms": rms,
@@ -376,7 +623,7 @@ class AudioStatistics(AudioProcessor):
                     "peak": peak,
                     "peak_db": self._calculate_peak_db(peak),
                     "dynamic_range_db": dynamic_range,
-                    "overall_dbfs": audio.dBFS,
+                    "overall_dbfs": levels["overall_dbfs"],
                 },
                 "silence": {
                     "ratio": silence_ratio,
@@ -391,7 +638,7 @@ class AudioStatistics(AudioProcessor):
                 "analysis": {
                     "processor": self.name,
                     "version": self.version,
-                    "processing_time_ms": 0,  # Will be updated
+                    "processing_time_ms": 0,  # Set before rendering
                 },
             }
             
@@ -399,14 +646,10 @@ class AudioStatistics(AudioProcessor):
             ext = "json" if output_format == "json" else "txt"
             output_path = output_dir / f"{input_path.stem}_stats.{ext}"
             
-            output_content = self._format_output(stats, output_format)
-            
+            # Render once, with the final processing time
             elapsed_ms = (time.time() - start_time) * 1000
             stats["analysis"]["processing_time_ms"] = elapsed_ms
-            
-            # Update content with final processing time
-            if output_format == "json":
-                output_content = json.dumps(stats, indent=2)
+            output_content = self._format_output(stats, output_format)
             
             # Write output
             output_path.write_text(output_content, encoding="utf-8")
@@ -1,9 +1,15 @@
 """Audio transcriber using Whisper."""
 
+import importlib.util
 import json
+import math
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from ..core.exceptions import ProcessingError, ValidationError
 from ..core.interfaces import AudioProcessor
@@ -14,17 +20,97 @@ from ..utils.validators import validate_input_file
 
 logger = get_logger(__name__)
 
-# Optional Whisper import
+# Optional Whisper backends. faster-whisper (CTranslate2, quantized) is
+# preferred and openai-whisper is the fallback. Both pull in large
+# runtimes, so they are only located here and imported when a model loads
+HAS_FASTER_WHISPER = importlib.util.find_spec("faster_whisper") is not None
+HAS_OPENAI_WHISPER = importlib.util.find_spec("whisper") is not None
+HAS_WHISPER = HAS_FASTER_WHISPER or HAS_OPENAI_WHISPER
+
+# Optional orjson import (stdlib json encodes indented output in pure Python)
 try:
-    import whisper
-    HAS_WHISPER = True
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional soundfile import - long files are then streamed to the model in
+# windows instead of being decoded into memory whole
+try:
+    import numpy as np
+    import soundfile as sf
+    HAS_SOUNDFILE = True
 except ImportError:
-    HAS_WHISPER = False
+    HAS_SOUNDFILE = False
+
+# scipy is only needed to resample windows that are not already 16 kHz
+HAS_SCIPY = importlib.util.find_spec("scipy") is not None
+
+# Whisper's input rate and context window
+WHISPER_SAMPLE_RATE = 16000
+STREAM_WINDOW_SECONDS = 30
+
+# Shorter files are transcribed in one call, where windowing buys nothing
+STREAM_MIN_SECONDS = 60
+
+# Serializes model loads so concurrent workers share one copy
+_MODEL_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_model(
+    model_name: str,
+    compute_type: Optional[str],
+    compile_encoder: bool = False,
+    num_workers: int = 1,
+) -> Any:
+    """
+    Load a Whisper model, keeping the last one resident for the process.
+    
+    Only one model is kept: switching model or compute type releases the
+    previous one instead of holding several gigabytes of weights.
+    num_workers is how many transcribe calls a faster-whisper model
+    serves at once; further concurrent calls wait for a free worker.
+    """
+    if HAS_FASTER_WHISPER:
+        from faster_whisper import WhisperModel
+        
+        logger.info(f"Loading Whisper model: {model_name} ({compute_type})")
+        return WhisperModel(
+            model_name, device="auto", compute_type=compute_type, num_workers=num_workers
+        )
+    
+    import whisper
+    
+    logger.info(f"Loading Whisper model: {model_name}")
+    model = whisper.load_model(model_name)
+    
+    if compile_encoder and model.device.type == "cuda":
+        import torch
+        
+        # The encoder always sees one 30 s mel window, so a single compiled
+        # graph serves every chunk. The decoder's growing kv-cache would
+        # recompile on every token, so it stays eager
+        logger.info("Compiling Whisper encoder (the first chunk will be slow)")
+        model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+    
+    return model
+
+
+def _format_clock(seconds: float, separator: str) -> str:
+    """Format seconds as HH:MM:SS<separator>mmm, rounded to the millisecond."""
+    hours, millis = divmod(round(seconds * 1000), 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
 
 
 class AudioTranscriber(AudioProcessor):
     """
-    Audio transcriber using OpenAI Whisper.
+    Audio transcriber using OpenAI Whisper models.
+    
+    Runs on faster-whisper when installed, with int8 weights by default,
+    and on openai-whisper otherwise.
     
     Features:
     - Multiple model sizes (tiny, base, small, medium, large)
@@ -42,9 +128,6 @@ class AudioTranscriber(AudioProcessor):
         "large": {"params": "1550M", "vram": "~10GB", "speed": "1x"},
     }
     
-    _loaded_model = None
-    _loaded_model_name = None
-    
     @property
     def name(self) -> str:
         return "transcriber"
@@ -90,7 +173,7 @@ class AudioTranscriber(AudioProcessor):
             ParameterSpec(
                 name="word_timestamps",
                 type="boolean",
-                description="Include word-level timestamps (slower)",
+                description="Include word-level timestamps in JSON output (slower)",
                 required=False,
                 default=False,
             ),
@@ -102,46 +185,195 @@ class AudioTranscriber(AudioProcessor):
                 default="transcribe",
                 choices=["transcribe", "translate"],
             ),
+            ParameterSpec(
+                name="compute_type",
+                type="string",
+                description="Weight precision for faster-whisper (ignored by openai-whisper)",
+                required=False,
+                default="int8",
+                choices=["int8", "int8_float16", "float16", "float32"],
+            ),
+            ParameterSpec(
+                name="torch_compile",
+                type="boolean",
+                description="Compile the openai-whisper encoder with torch.compile on CUDA",
+                required=False,
+                default=False,
+            ),
         ]
     
     def _check_dependencies(self) -> None:
         """Check if required dependencies are available."""
         if not HAS_WHISPER:
             raise ProcessingError(
-                "Missing required dependency: openai-whisper. "
-                "Install with: pip install openai-whisper"
+                "Missing required dependency: faster-whisper (or openai-whisper). "
+                "Install with: pip install faster-whisper"
             )
     
-    def _load_model(self, model_name: str) -> "whisper.Whisper":
-        """Load Whisper model (cached)."""
-        if self._loaded_model is not None and self._loaded_model_name == model_name:
-            logger.debug(f"Using cached model: {model_name}")
-            return self._loaded_model
+    def _load_model(
+        self,
+        model_name: str,
+        compute_type: str = "int8",
+        torch_compile: bool = False,
+        num_workers: int = 1,
+    ) -> Any:
+        """Load Whisper model (cached per process)."""
+        with _MODEL_LOCK:
+            if HAS_FASTER_WHISPER:
+                return _get_model(model_name, compute_type, num_workers=num_workers)
+            return _get_model(model_name, None, torch_compile)
+    
+    def _transcribe(self, whisper_model: Any, input_path: Path, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Transcribe a file, streaming long ones window by window.
+        
+        As Whisper seeks through long audio itself, each window starts
+        where the last complete segment of the previous one ended: the
+        final segment of a window may be cut off at its edge, so it is
+        dropped and transcribed whole in the next window. Timestamps are
+        shifted by the window start and segments renumbered, so the
+        result reads as one transcription. The language detected in the
+        first window is kept for the rest, and each window is prompted
+        with the previous window's text.
+        """
+        info = self._stream_info(input_path)
+        if info is None:
+            return self._transcribe_audio(whisper_model, input_path, options)
+        
+        options = dict(options)
+        language = None
+        window_frames = STREAM_WINDOW_SECONDS * info.samplerate
+        texts: List[str] = []
+        segments: List[Dict[str, Any]] = []
+        with sf.SoundFile(str(input_path)) as sound_file:
+            start = 0
+            while start < info.frames:
+                window = self._read_window(sound_file, start, window_frames)
+                result = self._transcribe_audio(whisper_model, window, options)
+                if language is None:
+                    language = result.get("language")
+                    options["language"] = language
+                
+                offset = start / info.samplerate
+                window_segments = result["segments"]
+                next_start = start + window_frames
+                if next_start < info.frames and len(window_segments) > 1:
+                    window_segments = window_segments[:-1]
+                    seek = start + round(window_segments[-1]["end"] * info.samplerate)
+                    if seek > start:
+                        next_start = min(seek, next_start)
+                
+                for seg in window_segments:
+                    segment = {**seg, "id": len(segments), "start": seg["start"] + offset, "end": seg["end"] + offset}
+                    if "words" in seg:
+                        segment["words"] = [
+                            {**w, "start": w["start"] + offset, "end": w["end"] + offset}
+                            for w in seg["words"]
+                        ]
+                    segments.append(segment)
+                text = "".join(seg["text"] for seg in window_segments)
+                texts.append(text)
+                if text.strip():
+                    options["initial_prompt"] = text.strip()
+                start = next_start
+        
+        return {"text": "".join(texts), "language": language, "segments": segments}
+    
+    def _stream_info(self, input_path: Path) -> Optional[Any]:
+        """
+        Check whether a file can be streamed to the model in windows.
+        
+        Returns:
+            soundfile's info for the file, or None to transcribe in one call
+            (short file, soundfile missing or unable to decode the format,
+            or a rate that needs scipy to resample)
+        """
+        if not HAS_SOUNDFILE:
+            return None
+        
+        try:
+            info = sf.info(str(input_path))
+        except RuntimeError:
+            return None
+        
+        if info.duration < STREAM_MIN_SECONDS:
+            return None
+        if info.samplerate != WHISPER_SAMPLE_RATE and not HAS_SCIPY:
+            return None
+        
+        return info
+    
+    def _read_window(self, sound_file: Any, start: int, frames: int) -> Any:
+        """Read a window from frame start, downmixed to mono and resampled to 16 kHz."""
+        sound_file.seek(start)
+        window = sound_file.read(frames, dtype="float32", always_2d=True).mean(axis=1, dtype=np.float32)
+        
+        sample_rate = sound_file.samplerate
+        if sample_rate != WHISPER_SAMPLE_RATE:
+            from scipy.signal import resample_poly
+            
+            divisor = math.gcd(sample_rate, WHISPER_SAMPLE_RATE)
+            up, down = WHISPER_SAMPLE_RATE // divisor, sample_rate // divisor
+            window = resample_poly(window, up, down).astype(np.float32)
+        return window
+    
+    def _transcribe_audio(
+        self, whisper_model: Any, audio: Union[Path, Any], options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Transcribe a file or 16 kHz samples with the loaded backend.
+        
+        faster-whisper yields segments lazily; they are collected into the
+        same result dict openai-whisper returns, which the formatters expect.
+        """
+        if not HAS_FASTER_WHISPER:
+            return whisper_model.transcribe(self._whisper_audio(whisper_model, audio), **options)
+        
+        segments, info = whisper_model.transcribe(
+            str(audio) if isinstance(audio, Path) else audio, **options
+        )
+        result_segments = []
+        for i, seg in enumerate(segments):
+            result_segment = {"id": i, "start": seg.start, "end": seg.end, "text": seg.text}
+            if seg.words is not None:
+                result_segment["words"] = [
+                    {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
+                    for w in seg.words
+                ]
+            result_segments.append(result_segment)
+        
+        return {
+            "text": "".join(seg["text"] for seg in result_segments),
+            "language": info.language,
+            "segments": result_segments,
+        }
+    
+    def _whisper_audio(self, whisper_model: Any, audio: Union[Path, Any]) -> Any:
+        """
+        Prepare a file or 16 kHz samples for openai-whisper, on the model's device.
         
-        logger.info(f"Loading Whisper model: {model_name}")
-        model = whisper.load_model(model_name)
+        openai-whisper computes the log-mel spectrogram of the whole input on
+        whatever device the audio tensor is on, which for a path is the CPU.
+        Handing it a GPU tensor moves the STFT and mel filter onto the GPU.
+        """
+        if whisper_model.device.type == "cpu":
+            return str(audio) if isinstance(audio, Path) else audio
         
-        # Cache the model
-        AudioTranscriber._loaded_model = model
-        AudioTranscriber._loaded_model_name = model_name
+        import torch
         
-        return model
+        if isinstance(audio, Path):
+            import whisper
+            
+            audio = whisper.load_audio(str(audio))
+        return torch.from_numpy(audio).to(whisper_model.device)
     
     def _format_timestamp(self, seconds: float) -> str:
         """Format seconds as HH:MM:SS,mmm for SRT."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+        return _format_clock(seconds, ",")
     
     def _format_vtt_timestamp(self, seconds: float) -> str:
         """Format seconds as HH:MM:SS.mmm for VTT."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+        return _format_clock(seconds, ".")
     
     def _format_txt(self, result: Dict[str, Any]) -> str:
         """Format transcription as plain text."""
@@ -149,51 +381,63 @@ class AudioTranscriber(AudioProcessor):
     
     def _format_json(self, result: Dict[str, Any], input_path: Path) -> str:
         """Format transcription as JSON."""
+        segments = []
+        for seg in result.get("segments", []):
+            segment = {
+                "id": seg["id"],
+                "start": seg["start"],
+                "end": seg["end"],
+                "text": seg["text"].strip(),
+            }
+            # Both backends attach word timestamps to their segment
+            if "words" in seg:
+                segment["words"] = seg["words"]
+            segments.append(segment)
+        
         output = {
             "file": str(input_path.name),
             "language": result.get("language", "unknown"),
             "text": result["text"].strip(),
-            "segments": [
-                {
-                    "id": seg["id"],
-                    "start": seg["start"],
-                    "end": seg["end"],
-                    "text": seg["text"].strip(),
-                }
-                for seg in result.get("segments", [])
-            ],
+            "segments": segments,
         }
         
         # Add word timestamps if available
         if "words" in result:
             output["words"] = result["words"]
         
+        if HAS_ORJSON:
+            return orjson.dumps(
+                output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ).decode("utf-8")
         return json.dumps(output, indent=2, ensure_ascii=False)
     
+    def _iter_srt(self, result: Dict[str, Any]) -> Iterator[str]:
+        """Yield SRT subtitle cues, blank-line separated."""
+        for i, seg in enumerate(result.get("segments", []), 1):
+            if i > 1:
+                yield "\n"
+            yield (
+                f"{i}\n"
+                f"{_format_clock(seg['start'], ',')} --> {_format_clock(seg['end'], ',')}\n"
+                f"{seg['text'].strip()}\n"
+            )
+    
+    def _iter_vtt(self, result: Dict[str, Any]) -> Iterator[str]:
+        """Yield the WebVTT header and cues, blank-line separated."""
+        yield "WEBVTT\n"
+        for seg in result.get("segments", []):
+            yield (
+                f"\n{_format_clock(seg['start'], '.')} --> {_format_clock(seg['end'], '.')}\n"
+                f"{seg['text'].strip()}\n"
+            )
+    
     def _format_srt(self, result: Dict[str, Any]) -> str:
         """Format transcription as SRT subtitles."""
-        lines = []
-        for i, seg in enumerate(result.get("segments", []), 1):
-            start = self._format_timestamp(seg["start"])
-            end = self._format_timestamp(seg["end"])
-            text = seg["text"].strip()
-            lines.append(f"{i}")
-            lines.append(f"{start} --> {end}")
-            lines.append(text)
-            lines.append("")
-        return "\n".join(lines)
+        return "".join(self._iter_srt(result))
     
     def _format_vtt(self, result: Dict[str, Any]) -> str:
         """Format transcription as WebVTT subtitles."""
-        lines = ["WEBVTT", ""]
-        for seg in result.get("segments", []):
-            start = self._format_vtt_timestamp(seg["start"])
-            end = self._format_vtt_timestamp(seg["end"])
-            text = seg["text"].strip()
-            lines.append(f"{start} --> {end}")
-            lines.append(text)
-            lines.append("")
-        return "\n".join(lines)
+        return "".join(self._iter_vtt(result))
     
     def process(
         self,
@@ -204,6 +448,9 @@ class AudioTranscriber(AudioProcessor):
         output_format: str = "txt",
         word_timestamps: bool = False,
         task: str = "transcribe",
+        compute_type: str = "int8",
+        torch_compile: bool = False,
+        num_workers: int = 1,
         **kwargs
     ) -> ProcessResult:
         """
@@ -215,8 +462,12 @@ class AudioTranscriber(AudioProcessor):
             model: Whisper model size
             language: Language code or 'auto'
             output_format: Output format (txt, json, srt, vtt)
-            word_timestamps: Include word-level timestamps
+            word_timestamps: Include word-level timestamps (JSON output only)
             task: 'transcribe' or 'translate'
+            compute_type: Weight precision for faster-whisper
+            torch_compile: Compile the openai-whisper encoder on CUDA
+            num_workers: Concurrent transcriptions the faster-whisper model
+                serves (set by process_batch)
             
         Returns:
             ProcessResult with success status and output path
@@ -232,13 +483,21 @@ class AudioTranscriber(AudioProcessor):
             ensure_directory(output_dir)
             
             # Load model
-            whisper_model = self._load_model(model)
+            whisper_model = self._load_model(model, compute_type, torch_compile, num_workers)
             
             logger.info(
                 f"Transcribing: {input_path.name} "
                 f"(model={model}, language={language}, task={task})"
             )
             
+            # Only JSON output carries words; aligning them costs extra decoding
+            if word_timestamps and output_format != "json":
+                logger.warning(
+                    f"Word timestamps are only written to JSON output, "
+                    f"skipping them for {output_format}"
+                )
+                word_timestamps = False
+            
             # Prepare options
             options = {
                 "task": task,
@@ -249,23 +508,22 @@ class AudioTranscriber(AudioProcessor):
                 options["language"] = language
             
             # Transcribe
-            result = whisper_model.transcribe(str(input_path), **options)
+            result = self._transcribe(whisper_model, input_path, options)
             
-            # Format output
-            if output_format == "txt":
-                output_content = self._format_txt(result)
-            elif output_format == "json":
-                output_content = self._format_json(result, input_path)
+            # Format output (subtitles are written cue by cue, not joined first)
+            if output_format == "json":
+                output_chunks = [self._format_json(result, input_path)]
             elif output_format == "srt":
-                output_content = self._format_srt(result)
+                output_chunks = self._iter_srt(result)
             elif output_format == "vtt":
-                output_content = self._format_vtt(result)
+                output_chunks = self._iter_vtt(result)
             else:
-                output_content = self._format_txt(result)
+                output_chunks = [self._format_txt(result)]
             
             # Write output
             output_path = output_dir / f"{input_path.stem}.{output_format}"
-            output_path.write_text(output_content, encoding="utf-8")
+            with output_path.open("w", encoding="utf-8") as f:
+                f.writelines(output_chunks)
             
             logger.info(f"Transcription saved to: {output_path}")
             
@@ -278,6 +536,7 @@ class AudioTranscriber(AudioProcessor):
                 "language_detected": result.get("language", "unknown"),
                 "language_requested": language,
                 "task": task,
+                "backend": "faster-whisper" if HAS_FASTER_WHISPER else "openai-whisper",
                 "word_timestamps": word_timestamps,
                 "output_format": output_format,
                 "text_length": len(result["text"]),
@@ -308,3 +567,42 @@ class AudioTranscriber(AudioProcessor):
                 error_message=f"Unexpected error: {e}",
                 processing_time_ms=(time.time() - start_time) * 1000,
             )
+    
+    def process_batch(
+        self,
+        input_paths: List[Path],
+        output_dir: Path,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> List[ProcessResult]:
+        """
+        Transcribe several files with one shared model.
+        
+        The base implementation gives every file a worker process, and each
+        worker would load its own copy of the model. Here the model is loaded
+        once. faster-whisper models are built with one worker per thread and
+        run inference outside the GIL, so files are transcribed on threads.
+        openai-whisper keeps its decoder kv-cache in hooks on the shared
+        model, so concurrent decodes would mix caches; its files are
+        transcribed one after another.
+        
+        Args:
+            input_paths: Paths to input audio files
+            output_dir: Directory for output files
+            max_workers: Worker thread count (default: CPU count); ignored
+                by openai-whisper
+            **kwargs: Transcription parameters passed to process()
+            
+        Returns:
+            One ProcessResult per input, in input order
+        """
+        if len(input_paths) <= 1 or max_workers == 1 or not HAS_FASTER_WHISPER:
+            return [self.process(path, output_dir, **kwargs) for path in input_paths]
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(input_paths))
+        kwargs = {**kwargs, "num_workers": workers}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda path: self.process(path, output_dir, **kwargs),
+                input_paths,
+            ))
@@ -7,12 +7,21 @@ from typing import Any, Dict, List, Optional, Tuple
 from ..core.exceptions import ProcessingError, ValidationError
 from ..core.interfaces import AudioProcessor
 from ..core.types import ParameterSpec, ProcessorCategory, ProcessResult
+from ..utils.audio import read_pcm_audio, write_flac
 from ..utils.file_ops import ensure_directory
 from ..utils.logger import get_logger
 from ..utils.validators import validate_input_file
 
 logger = get_logger(__name__)
 
+# Optional numpy import
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
 try:
     from pydub import AudioSegment
     from pydub.silence import detect_silence, detect_nonsilent
@@ -20,6 +29,13 @@ try:
 except ImportError:
     HAS_PYDUB = False
 
+# numpy dtype of pydub's interleaved raw data by sample width in bytes
+# (pydub stores 8-bit audio signed and widens 24-bit audio to 32-bit)
+SAMPLE_WIDTH_DTYPES = {1: "int8", 2: "int16", 4: "int32"}
+
+# Frames squared and summed at a time when scanning for silence
+BLOCK_FRAMES = 1 << 17
+
 
 class AudioTrimmer(AudioProcessor):
     """
@@ -113,25 +129,109 @@ class AudioTrimmer(AudioProcessor):
                 "Install with: pip install pydub"
             )
     
+    def _detect_nonsilent(
+        self,
+        audio: "AudioSegment",
+        min_silence_len: int,
+        silence_thresh: float,
+    ) -> List[List[int]]:
+        """
+        Find non-silent ranges, as pydub.silence.detect_nonsilent does.
+        
+        pydub measures the RMS of a fresh min_silence_len slice at every
+        millisecond. Here the cumulative sample energy is sampled at each
+        millisecond boundary once, so every window's RMS is a difference
+        of two sums. Slice boundaries, the integer RMS and the range
+        merging follow pydub, so the ranges are the same.
+        
+        Returns:
+            List of [start_ms, end_ms] ranges
+        """
+        if not HAS_NUMPY or audio.sample_width not in SAMPLE_WIDTH_DTYPES:
+            return detect_nonsilent(
+                audio,
+                min_silence_len=min_silence_len,
+                silence_thresh=silence_thresh,
+            )
+        
+        seg_len = len(audio)
+        if seg_len < min_silence_len:
+            return [[0, seg_len]]
+        
+        channels = audio.channels
+        samples = np.frombuffer(audio.raw_data, dtype=SAMPLE_WIDTH_DTYPES[audio.sample_width])
+        samples = samples.reshape(-1, channels)
+        frame_count = len(samples)
+        
+        # Frame index of every millisecond (pydub truncates ms * rate / 1000);
+        # slices running past the last frame are padded with silence
+        bounds = np.arange(seg_len + 1, dtype=np.int64) * audio.frame_rate // 1000
+        clipped = np.minimum(bounds, frame_count)
+        
+        # Squares of 8/16-bit samples sum exactly in int64; wider ones
+        # use float64 like audioop does
+        energy_dtype = np.int64 if audio.sample_width <= 2 else np.float64
+        cumulative = np.zeros(seg_len + 1, dtype=energy_dtype)
+        total = energy_dtype(0)
+        for start in range(0, frame_count, BLOCK_FRAMES):
+            block = samples[start:start + BLOCK_FRAMES].astype(energy_dtype)
+            block_energy = np.cumsum(np.einsum("ij,ij->i", block, block))
+            block_energy += total
+            lo, hi = np.searchsorted(clipped, [start, start + len(block)], side="right")
+            cumulative[lo:hi] = block_energy[clipped[lo:hi] - start - 1]
+            total = block_energy[-1]
+        
+        window_energy = cumulative[min_silence_len:] - cumulative[:-min_silence_len]
+        window_samples = (bounds[min_silence_len:] - bounds[:-min_silence_len]) * channels
+        with np.errstate(divide="ignore", invalid="ignore"):
+            window_rms = np.floor(np.sqrt(window_energy / window_samples))
+        window_rms[window_samples == 0] = 0
+        
+        threshold = 10 ** (silence_thresh / 20) * audio.max_possible_amplitude
+        silence_starts = np.flatnonzero(window_rms <= threshold)
+        if not len(silence_starts):
+            return [[0, seg_len]]
+        
+        # Silent windows less than a window apart form one silent range
+        breaks = np.flatnonzero(np.diff(silence_starts) > min_silence_len)
+        range_starts = silence_starts[np.concatenate(([0], breaks + 1))].tolist()
+        range_ends = (silence_starts[np.append(breaks, -1)] + min_silence_len).tolist()
+        
+        if range_starts[0] == 0 and range_ends[0] == seg_len:
+            return []
+        
+        nonsilent_ranges = []
+        prev_end = 0
+        for start, end in zip(range_starts, range_ends):
+            nonsilent_ranges.append([prev_end, start])
+            prev_end = end
+        if prev_end != seg_len:
+            nonsilent_ranges.append([prev_end, seg_len])
+        if nonsilent_ranges[0] == [0, 0]:
+            nonsilent_ranges.pop(0)
+        
+        return nonsilent_ranges
+    
     def _trim_edges(
         self,
         audio: "AudioSegment",
         silence_thresh: float,
         min_silence_len: int,
         padding_ms: int,
+        nonsilent_ranges: Optional[List[List[int]]] = None,
     ) -> Tuple["AudioSegment", Dict[str, Any]]:
         """
         Trim silence from start and end of audio.
         
+        Args:
+            nonsilent_ranges: Ranges already detected in audio (optional)
+        
         Returns:
             Tuple of (trimmed audio, trim info dict)
         """
         # Detect non-silent sections
-        nonsilent_ranges = detect_nonsilent(
-            audio,
-            min_silence_len=min_silence_len,
-            silence_thresh=silence_thresh,
-        )
+        if nonsilent_ranges is None:
+            nonsilent_ranges = self._detect_nonsilent(audio, min_silence_len, silence_thresh)
         
         if not nonsilent_ranges:
             # Entire audio is silent
@@ -169,6 +269,7 @@ class AudioTrimmer(AudioProcessor):
         silence_thresh: float,
         min_silence_len: int,
         max_silence_ms: int,
+        nonsilent_ranges: Optional[List[List[int]]] = None,
     ) -> Tuple["AudioSegment", Dict[str, Any]]:
         """
         Remove or reduce all internal silences.
@@ -178,16 +279,14 @@ class AudioTrimmer(AudioProcessor):
             silence_thresh: Silence threshold in dBFS
             min_silence_len: Minimum silence to detect (ms)
             max_silence_ms: Maximum silence to keep (ms)
+            nonsilent_ranges: Ranges already detected in audio (optional)
             
         Returns:
             Tuple of (processed audio, info dict)
         """
         # Detect non-silent sections
-        nonsilent_ranges = detect_nonsilent(
-            audio,
-            min_silence_len=min_silence_len,
-            silence_thresh=silence_thresh,
-        )
+        if nonsilent_ranges is None:
+            nonsilent_ranges = self._detect_nonsilent(audio, min_silence_len, silence_thresh)
         
         if not nonsilent_ranges:
             return audio[:0], {
@@ -203,36 +302,42 @@ class AudioTrimmer(AudioProcessor):
                 "silence_removed_ms": start + (len(audio) - end),
             }
         
-        # Build output by joining non-silent sections with reduced silence
-        segments = []
-        total_silence_removed = 0
+        # Zeroed frames in the audio's own format, shared by every gap
+        silence_frames = int(audio.frame_rate * max_silence_ms / 1000.0)
+        silence = bytes(silence_frames * audio.frame_width)
         
-        for i, (start, end) in enumerate(nonsilent_ranges):
-            # Add the non-silent section
-            segments.append(audio[start:end])
+        if HAS_NUMPY:
+            data, total_silence_removed = self._join_sections(
+                audio, nonsilent_ranges, max_silence_ms, silence
+            )
+        else:
+            # Build output by joining non-silent sections with reduced
+            # silence. The raw data is joined once at the end: adding
+            # AudioSegments one by one copies the growing result every time
+            chunks = []
+            total_silence_removed = 0
             
-            # Add silence between sections (if not last)
-            if i < len(nonsilent_ranges) - 1:
-                next_start = nonsilent_ranges[i + 1][0]
-                silence_duration = next_start - end
+            for i, (start, end) in enumerate(nonsilent_ranges):
+                # Add the non-silent section
+                chunks.append(audio[start:end].raw_data)
                 
-                if silence_duration > max_silence_ms:
-                    # Reduce silence to max_silence_ms
-                    total_silence_removed += silence_duration - max_silence_ms
-                    if max_silence_ms > 0:
-                        # Keep some silence
-                        segments.append(AudioSegment.silent(
-                            duration=max_silence_ms,
-                            frame_rate=audio.frame_rate,
-                        ))
-                else:
-                    # Keep original silence
-                    segments.append(audio[end:next_start])
+                # Add silence between sections (if not last)
+                if i < len(nonsilent_ranges) - 1:
+                    next_start = nonsilent_ranges[i + 1][0]
+                    silence_duration = next_start - end
+                    
+                    if silence_duration > max_silence_ms:
+                        # Reduce silence to max_silence_ms
+                        total_silence_removed += silence_duration - max_silence_ms
+                        chunks.append(silence)
+                    else:
+                        # Keep original silence
+                        chunks.append(audio[end:next_start].raw_data)
+            
+            data = b"".join(chunks)
         
         # Combine segments
-        result = segments[0]
-        for seg in segments[1:]:
-            result = result + seg
+        result = audio._spawn(data)
         
         info = {
             "sections_found": len(nonsilent_ranges),
@@ -243,6 +348,55 @@ class AudioTrimmer(AudioProcessor):
         
         return result, info
     
+    def _join_sections(
+        self,
+        audio: "AudioSegment",
+        nonsilent_ranges: List[List[int]],
+        max_silence_ms: int,
+        silence: bytes,
+    ) -> Tuple[bytes, int]:
+        """
+        Join non-silent sections with gaps capped at max_silence_ms, using NumPy.
+        
+        Gaps short enough to keep merge with the sections around them into
+        one run of the original data, so only shortened gaps split the copy.
+        Millisecond positions map to frames exactly as pydub slicing does.
+        
+        Args:
+            audio: Audio segment
+            nonsilent_ranges: At least two [start, end] ranges in ms
+            max_silence_ms: Maximum silence to keep (ms)
+            silence: Zeroed raw data put in place of each shortened gap
+            
+        Returns:
+            Tuple of (raw data, silence removed in ms)
+        """
+        ranges = np.asarray(nonsilent_ranges, dtype=np.int64)
+        starts, ends = ranges[:, 0], ranges[:, 1]
+        gaps = starts[1:] - ends[:-1]
+        shortened = np.flatnonzero(gaps > max_silence_ms)
+        total_silence_removed = int((gaps[shortened] - max_silence_ms).sum())
+        
+        # Byte offsets of the runs of original audio between shortened gaps
+        run_starts = np.concatenate((starts[:1], starts[shortened + 1]))
+        run_ends = np.concatenate((ends[shortened], ends[-1:]))
+        frames_per_ms = audio.frame_rate / 1000.0
+        byte_starts = (run_starts * frames_per_ms).astype(np.int64) * audio.frame_width
+        byte_ends = (run_ends * frames_per_ms).astype(np.int64) * audio.frame_width
+        
+        raw = memoryview(audio.raw_data)
+        chunks = []
+        for start, end in zip(byte_starts.tolist(), byte_ends.tolist()):
+            if chunks:
+                chunks.append(silence)
+            chunks.append(raw[start:end])
+        
+        # pydub pads a slice ending past the data (by under a frame's worth
+        # of rounding) with silence; match it so lengths agree
+        chunks.append(bytes(max(0, byte_ends[-1] - len(raw))))
+        
+        return b"".join(chunks), total_silence_removed
+    
     def process(
         self,
         input_path: Path,
@@ -281,9 +435,11 @@ class AudioTrimmer(AudioProcessor):
             validate_input_file(input_path)
             ensure_directory(output_dir)
             
-            # Load audio
+            # Load audio (PCM files are decoded directly when possible)
             logger.info(f"Loading audio: {input_path}")
-            audio = AudioSegment.from_file(input_path)
+            audio = read_pcm_audio(input_path)
+            if audio is None:
+                audio = AudioSegment.from_file(input_path)
             
             logger.info(
                 f"Trimming mode='{mode}', threshold={silence_threshold}dBFS, "
@@ -299,20 +455,26 @@ class AudioTrimmer(AudioProcessor):
                     padding_ms,
                 )
             else:  # mode == "all"
+                # Detect once; both steps work from the same ranges
+                nonsilent_ranges = self._detect_nonsilent(audio, min_silence_ms, silence_threshold)
+                
                 # First trim edges
                 trimmed, edge_info = self._trim_edges(
                     audio,
                     silence_threshold,
                     min_silence_ms,
                     padding_ms=0,  # No padding for intermediate step
+                    nonsilent_ranges=nonsilent_ranges,
                 )
                 
-                # Then remove internal silence
+                # Then remove internal silence (ranges shifted into the trimmed audio)
+                offset = nonsilent_ranges[0][0] if nonsilent_ranges else 0
                 processed, internal_info = self._remove_all_silence(
                     trimmed,
                     silence_threshold,
                     min_silence_ms,
                     max_silence_ms,
+                    nonsilent_ranges=[[start - offset, end - offset] for start, end in nonsilent_ranges],
                 )
                 
                 trim_info = {
@@ -338,7 +500,9 @@ class AudioTrimmer(AudioProcessor):
             output_path = output_dir / f"{input_path.stem}_trimmed.{output_format}"
             logger.info(f"Exporting to: {output_path}")
             
-            processed.export(output_path, format=output_format)
+            # FLAC is written in-process (pydub already writes WAV directly)
+            if output_format != "flac" or not write_flac(processed, output_path):
+                processed.export(output_path, format=output_format)
             
             elapsed_ms = (time.time() - start_time) * 1000
             
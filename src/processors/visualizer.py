@@ -1,9 +1,13 @@
 """Audio visualizer for generating spectrograms and waveforms."""
 
+import importlib.util
 import json
+import threading
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 from ..core.exceptions import ProcessingError, ValidationError
 from ..core.interfaces import AudioProcessor
@@ -31,12 +35,127 @@ except ImportError:
     HAS_MATPLOTLIB = False
     plt = None
 
+# Optional Pillow import (a matplotlib dependency) - spectrograms without
+# axes are then written straight to an image
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
 try:
     from pydub import AudioSegment
     HAS_PYDUB = True
 except ImportError:
     HAS_PYDUB = False
 
+# Optional soundfile import - files libsndfile decodes are then read
+# straight into float32 samples, without ffmpeg or a pydub AudioSegment
+try:
+    import soundfile as sf
+    HAS_SOUNDFILE = True
+except ImportError:
+    HAS_SOUNDFILE = False
+    sf = None
+
+# scipy.fft can split the frame transforms across threads; it is only
+# located here and imported when a spectrogram is drawn
+HAS_SCIPY_FFT = importlib.util.find_spec("scipy") is not None
+
+# numba takes most of a second to import, so it is only located here and
+# imported on first use
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# torch is only located here; it is imported (and CUDA initialized) the
+# first time a spectrogram is long enough to move to the GPU
+HAS_TORCH = importlib.util.find_spec("torch") is not None
+
+# numpy dtype of pydub's interleaved raw data by sample width in bytes
+# (pydub stores 8-bit audio signed and widens 24-bit audio to 32-bit)
+SAMPLE_WIDTH_DTYPES = {1: "int8", 2: "int16", 4: "int32"}
+
+# Byte budget for decoded samples kept between process() calls, so drawing
+# several views of one file decodes it once
+SAMPLE_CACHE_BYTES = 512 * 1024 * 1024
+
+# (samples, sample rate, duration) by (resolved path, mtime in ns, size),
+# least recently used first
+_SAMPLE_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[np.ndarray, int, float]]" = OrderedDict()
+_SAMPLE_CACHE_LOCK = threading.Lock()
+
+# Samples from which the numba kernel pays for importing numba (about
+# 12 minutes of 44.1 kHz stereo); once loaded it is used for any length
+NUMBA_MIN_SAMPLES = 1 << 26
+
+# Frames transformed per CPU batch (2 MiB of float32 input at 2048-sample
+# frames), so the windowed frames and their spectrum stay in cache
+STFT_BLOCK_FRAMES = 256
+
+# Samples from which spectrograms are computed on a CUDA GPU, which pays
+# for importing torch and starting CUDA (about 50 minutes at 44.1 kHz)
+GPU_MIN_SAMPLES = 1 << 27
+
+# Frames transformed per GPU batch, bounding device memory (64 MiB of
+# float32 input at 2048-sample frames)
+GPU_BLOCK_FRAMES = 1 << 13
+
+
+def _mix_frames(frames, scale, out):
+    """
+    Average (frames, channels) integer samples into normalized float32.
+    
+    Widens, sums and scales each frame in one pass over memory, with the
+    same float32 operations as the NumPy path. Only used compiled; see
+    _get_mix_kernel.
+    """
+    num_frames, channels = frames.shape
+    if channels == 2:
+        # Fixed-width loop LLVM can vectorize, for the common layout
+        for i in range(num_frames):
+            out[i] = (np.float32(frames[i, 0]) + np.float32(frames[i, 1])) * scale
+        return
+    
+    for i in range(num_frames):
+        total = np.float32(frames[i, 0])
+        for c in range(1, channels):
+            total += np.float32(frames[i, c])
+        out[i] = total * scale
+
+
+@lru_cache(maxsize=1)
+def _get_mix_kernel() -> Callable:
+    """Import numba and compile _mix_frames on first use."""
+    from numba import njit
+    return njit(cache=True)(_mix_frames)
+
+
+@lru_cache(maxsize=1)
+def _get_cuda_device() -> Optional[Any]:
+    """Import torch and return the CUDA device, or None without a GPU."""
+    import torch
+    return torch.device("cuda") if torch.cuda.is_available() else None
+
+
+@lru_cache(maxsize=8)
+def _get_window(nfft: int) -> "np.ndarray":
+    """
+    Return the Hann window matplotlib's specgram uses for a frame size.
+    
+    Memoized so every spectrogram of the same size shares one read-only copy.
+    """
+    window = np.hanning(nfft).astype(np.float32)
+    window.flags.writeable = False
+    return window
+
+
+@lru_cache(maxsize=8)
+def _get_colormap_lut(colormap: str) -> "np.ndarray":
+    """Return a colormap as a read-only 256 x 3 table of RGB bytes."""
+    lut = matplotlib.colormaps[colormap](np.linspace(0.0, 1.0, 256))[:, :3]
+    lut = np.round(lut * 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
 
 class AudioVisualizer(AudioProcessor):
     """
@@ -110,6 +229,13 @@ class AudioVisualizer(AudioProcessor):
                 default="viridis",
                 choices=["viridis", "plasma", "inferno", "magma", "cividis", "hot", "cool"],
             ),
+            ParameterSpec(
+                name="axes",
+                type="boolean",
+                description="Draw axes, labels and colorbar (spectrogram and mel images without them are rendered directly)",
+                required=False,
+                default=True,
+            ),
         ]
     
     def _check_dependencies(self) -> None:
@@ -129,19 +255,291 @@ class AudioVisualizer(AudioProcessor):
             )
     
     def _audio_to_samples(self, audio: "AudioSegment") -> "np.ndarray":
-        """Convert AudioSegment to numpy array of samples."""
-        samples = np.array(audio.get_array_of_samples())
-        
-        # Handle stereo by taking mean
-        if audio.channels == 2:
-            samples = samples.reshape((-1, 2))
-            samples = samples.mean(axis=1)
+        """Convert AudioSegment to a normalized float32 array of samples."""
+        if audio.sample_width not in SAMPLE_WIDTH_DTYPES:
+            raise ProcessingError(f"Unsupported sample width: {audio.sample_width} bytes")
         
-        # Normalize to -1.0 to 1.0
+        # View pydub's raw bytes instead of copying its sample array
+        samples = np.frombuffer(audio.raw_data, dtype=SAMPLE_WIDTH_DTYPES[audio.sample_width])
         max_val = float(2 ** (audio.sample_width * 8 - 1))
-        samples = samples.astype(np.float64) / max_val
         
-        return samples
+        use_kernel = HAS_NUMBA and (
+            len(samples) >= NUMBA_MIN_SAMPLES
+            or _get_mix_kernel.cache_info().currsize > 0
+        )
+        if use_kernel:
+            frames = samples.reshape((-1, audio.channels))
+            mixed = np.empty(len(frames), dtype=np.float32)
+            _get_mix_kernel()(frames, np.float32(1.0 / (max_val * audio.channels)), mixed)
+            return mixed
+        
+        # Handle multichannel audio by taking mean, normalizing to -1.0 to 1.0
+        if audio.channels > 1:
+            frames = samples.reshape((-1, audio.channels))
+            mixed = frames[:, 0].astype(np.float32)
+            for channel in range(1, audio.channels):
+                # In float32: adding int32 samples would otherwise go through float64
+                np.add(mixed, frames[:, channel], out=mixed, dtype=np.float32)
+            mixed *= np.float32(1.0 / (max_val * audio.channels))
+            return mixed
+        
+        normalized = samples.astype(np.float32)
+        normalized *= np.float32(1.0 / max_val)
+        return normalized
+    
+    def _load_samples(self, input_path: Path) -> Tuple["np.ndarray", int, float]:
+        """
+        Load a file as mono float32 samples normalized to -1.0 to 1.0.
+        
+        Files soundfile can decode (WAV, FLAC, OGG, and MP3 with recent
+        libsndfile) are read directly as float32; anything else goes
+        through pydub.
+        
+        Returns:
+            Tuple of (samples, sample rate, duration in seconds)
+        """
+        if HAS_SOUNDFILE:
+            try:
+                data, sample_rate = sf.read(str(input_path), dtype="float32", always_2d=True)
+            except RuntimeError:
+                logger.debug(f"soundfile cannot decode {input_path}, using pydub")
+            else:
+                samples = data[:, 0] if data.shape[1] == 1 else data.mean(axis=1, dtype=np.float32)
+                # Rounded to the millisecond like len() of an AudioSegment
+                duration_ms = round(1000 * len(samples) / sample_rate)
+                return samples, sample_rate, duration_ms / 1000
+        
+        audio = AudioSegment.from_file(input_path)
+        return self._audio_to_samples(audio), audio.frame_rate, len(audio) / 1000
+    
+    def _cached_samples(self, input_path: Path) -> Tuple["np.ndarray", int, float]:
+        """
+        Load samples through the decoded-sample cache.
+        
+        Entries are keyed by the file's modification time and size as well
+        as its path, so an edited file is decoded again. Cached samples are
+        read-only; the oldest entries are evicted past SAMPLE_CACHE_BYTES.
+        
+        Returns:
+            Tuple of (samples, sample rate, duration in seconds)
+        """
+        stat = input_path.stat()
+        key = (str(input_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        
+        with _SAMPLE_CACHE_LOCK:
+            entry = _SAMPLE_CACHE.get(key)
+            if entry is not None:
+                _SAMPLE_CACHE.move_to_end(key)
+                return entry
+        
+        entry = self._load_samples(input_path)
+        entry[0].flags.writeable = False
+        if entry[0].nbytes > SAMPLE_CACHE_BYTES:
+            return entry
+        
+        with _SAMPLE_CACHE_LOCK:
+            _SAMPLE_CACHE[key] = entry
+            cached_bytes = sum(samples.nbytes for samples, _, _ in _SAMPLE_CACHE.values())
+            while cached_bytes > SAMPLE_CACHE_BYTES:
+                _, (evicted, _, _) = _SAMPLE_CACHE.popitem(last=False)
+                cached_bytes -= evicted.nbytes
+        
+        return entry
+    
+    def _spectrogram_db(
+        self,
+        samples: "np.ndarray",
+        sample_rate: int,
+    ) -> Tuple["np.ndarray", Tuple[float, float, float, float]]:
+        """
+        Compute a power spectrogram in dB, as ax.specgram would.
+        
+        Frames are transformed in batched float32 rffts instead of
+        matplotlib's float64 complex FFT. Scaling, frame times and extent
+        follow matplotlib, so the picture is the same.
+        
+        Returns:
+            Tuple of ((frames, bins) dB array, image extent in seconds and Hz)
+        """
+        nfft = min(2048, len(samples))
+        hop = nfft - nfft // 2
+        window = _get_window(nfft)
+        num_frames = (len(samples) - nfft) // hop + 1
+        
+        if HAS_TORCH and len(samples) >= GPU_MIN_SAMPLES and _get_cuda_device() is not None:
+            power = self._frame_power_gpu(samples, nfft, hop, window)
+        else:
+            power = self._frame_power(samples, nfft, hop, window)
+        
+        # One-sided power spectral density, scaled like matplotlib.mlab.psd
+        power /= sample_rate * float(np.dot(window, window))
+        power[:, 1:-1 if nfft % 2 == 0 else None] *= 2
+        with np.errstate(divide="ignore"):
+            np.log10(power, out=power)
+        power *= 10
+        
+        # Frame centers, padded by half a hop at either end
+        pad = hop / sample_rate / 2
+        extent = (
+            nfft / 2 / sample_rate - pad,
+            ((num_frames - 1) * hop + nfft / 2) / sample_rate + pad,
+            0.0,
+            (nfft // 2) * sample_rate / nfft,
+        )
+        return power, extent
+    
+    def _frame_power(
+        self,
+        samples: "np.ndarray",
+        nfft: int,
+        hop: int,
+        window: "np.ndarray",
+    ) -> "np.ndarray":
+        """
+        Return squared rfft magnitudes of the windowed frames, (frames, bins).
+        
+        Frames are strided views of the samples, windowed and transformed
+        STFT_BLOCK_FRAMES at a time straight into the output, so only the
+        output and one cache-sized block are ever held.
+        """
+        if HAS_SCIPY_FFT:
+            from scipy.fft import rfft
+            fft_kwargs = {"workers": -1}
+        else:
+            from numpy.fft import rfft
+            fft_kwargs = {}
+        
+        frames = np.lib.stride_tricks.sliding_window_view(samples, nfft)[::hop]
+        power = np.empty((len(frames), nfft // 2 + 1), dtype=np.float32)
+        for start in range(0, len(frames), STFT_BLOCK_FRAMES):
+            spectrum = rfft(frames[start:start + STFT_BLOCK_FRAMES] * window, axis=1, **fft_kwargs)
+            block = power[start:start + len(spectrum)]
+            np.multiply(spectrum.real, spectrum.real, out=block)
+            block += spectrum.imag ** 2
+        return power
+    
+    def _frame_power_gpu(
+        self,
+        samples: "np.ndarray",
+        nfft: int,
+        hop: int,
+        window: "np.ndarray",
+    ) -> "np.ndarray":
+        """
+        Return squared rfft magnitudes of the windowed frames, computed with cuFFT.
+        
+        The signal is copied to the GPU once and framed there; batches of
+        GPU_BLOCK_FRAMES frames are transformed and only their magnitudes
+        come back to the host.
+        """
+        import torch
+        
+        device = _get_cuda_device()
+        signal = torch.tensor(samples, device=device)
+        gpu_window = torch.tensor(window, device=device)
+        frames = signal.unfold(0, nfft, hop)
+        
+        power = np.empty((frames.shape[0], nfft // 2 + 1), dtype=np.float32)
+        for start in range(0, frames.shape[0], GPU_BLOCK_FRAMES):
+            spectrum = torch.fft.rfft(frames[start:start + GPU_BLOCK_FRAMES] * gpu_window, dim=1)
+            block = torch.view_as_real(spectrum).square().sum(dim=-1)
+            power[start:start + len(block)] = block.cpu().numpy()
+        return power
+    
+    def _draw_spectrogram(
+        self,
+        ax: "plt.Axes",
+        samples: "np.ndarray",
+        sample_rate: int,
+        colormap: str,
+    ) -> "matplotlib.image.AxesImage":
+        """
+        Draw a power spectrogram in dB on an axis.
+        
+        Returns:
+            The spectrogram image (for a colorbar)
+        """
+        power, extent = self._spectrogram_db(samples, sample_rate)
+        im = ax.imshow(power.T, cmap=colormap, extent=extent, origin='lower')
+        ax.axis('auto')
+        return im
+    
+    def _write_spectrogram_image(
+        self,
+        samples: "np.ndarray",
+        sample_rate: int,
+        output_path: Path,
+        width: int,
+        height: int,
+        colormap: str,
+        mel: bool = False,
+    ) -> None:
+        """
+        Write a spectrogram straight to an image, without axes or colorbar.
+        
+        dB values are scaled to their own range (as imshow does by default)
+        and looked up in the colormap's RGB table. Each image row takes the
+        nearest frequency bin on a linear axis, or on the symlog axis the
+        mel view plots with; columns are resized to the image width.
+        """
+        power, extent = self._spectrogram_db(samples, sample_rate)
+        num_bins = power.shape[1]
+        max_freq = extent[3] or 1.0
+        
+        finite = power[np.isfinite(power)]
+        low, high = (float(finite.min()), float(finite.max())) if finite.size else (0.0, 0.0)
+        scale = 255.0 / (high - low) if high > low else 0.0
+        levels = np.clip((power - low) * scale, 0, 255, out=power).astype(np.uint8)
+        
+        # Frequency bin for each image row, highest frequency on top
+        if mel:
+            from matplotlib.scale import SymmetricalLogTransform
+            
+            transform = SymmetricalLogTransform(10, 1000, 1)
+            top = transform.transform(np.array([max_freq]))[0]
+            positions = np.linspace(top, 0.0, height)
+            fraction = transform.inverted().transform(positions) / max_freq
+        else:
+            fraction = np.linspace(1.0, 0.0, height)
+        rows = np.rint(fraction * (num_bins - 1)).astype(np.intp)
+        
+        rgb = _get_colormap_lut(colormap)[levels.T[rows]]
+        Image.fromarray(rgb).resize((width, height), Image.BILINEAR).save(output_path)
+    
+    def _waveform_envelope(
+        self,
+        samples: "np.ndarray",
+        sample_rate: int,
+        num_columns: int,
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """
+        Reduce samples to a (min, max) envelope, one pair per image column.
+        
+        Unlike keeping every Nth sample, every peak survives. Signals with
+        fewer than two samples per column are returned unreduced.
+        
+        Returns:
+            Tuple of (column times in seconds, minimums, maximums)
+        """
+        if len(samples) < 2 * num_columns:
+            times = np.arange(len(samples)) / sample_rate
+            return times, samples, samples
+        
+        edges = np.arange(num_columns) * len(samples) // num_columns
+        mins = np.minimum.reduceat(samples, edges)
+        maxs = np.maximum.reduceat(samples, edges)
+        
+        # Each column is plotted at the middle of its samples
+        centers = (edges + np.append(edges[1:], len(samples))) / 2
+        return centers / sample_rate, mins, maxs
+    
+    def _plot_waveform(self, ax: "plt.Axes", samples: "np.ndarray", sample_rate: int, width: int) -> None:
+        """Plot the waveform envelope on an axis."""
+        times, mins, maxs = self._waveform_envelope(samples, sample_rate, width)
+        
+        ax.plot(times, maxs, color='#2196F3', linewidth=0.5)
+        ax.plot(times, mins, color='#2196F3', linewidth=0.5)
+        ax.fill_between(times, mins, maxs, alpha=0.3, color='#2196F3')
     
     def _generate_waveform(
         self,
@@ -154,18 +552,10 @@ class AudioVisualizer(AudioProcessor):
     ) -> None:
         """Generate waveform visualization."""
         duration = len(samples) / sample_rate
-        time_axis = np.linspace(0, duration, len(samples))
         
         fig, ax = plt.subplots(figsize=(width / dpi, height / dpi), dpi=dpi)
         
-        # Downsample for performance if needed
-        if len(samples) > 10000:
-            step = len(samples) // 10000
-            samples = samples[::step]
-            time_axis = time_axis[::step]
-        
-        ax.plot(time_axis, samples, color='#2196F3', linewidth=0.5)
-        ax.fill_between(time_axis, samples, alpha=0.3, color='#2196F3')
+        self._plot_waveform(ax, samples, sample_rate, width)
         
         ax.set_xlabel('Time (seconds)')
         ax.set_ylabel('Amplitude')
@@ -192,31 +582,13 @@ class AudioVisualizer(AudioProcessor):
         """Generate spectrogram visualization."""
         fig, ax = plt.subplots(figsize=(width / dpi, height / dpi), dpi=dpi)
         
-        # Use matplotlib's specgram which doesn't require scipy
-        nfft = min(2048, len(samples))
-        noverlap = nfft // 2
+        im = self._draw_spectrogram(ax, samples, sample_rate, colormap)
         
         if mel:
             # Simplified mel-scale approximation using log frequency scaling
-            spec, freqs, times, im = ax.specgram(
-                samples,
-                Fs=sample_rate,
-                NFFT=nfft,
-                noverlap=noverlap,
-                cmap=colormap,
-                scale='dB',
-            )
             ax.set_yscale('symlog', linthresh=1000)
             ax.set_title('Mel Spectrogram (Approximated)')
         else:
-            spec, freqs, times, im = ax.specgram(
-                samples,
-                Fs=sample_rate,
-                NFFT=nfft,
-                noverlap=noverlap,
-                cmap=colormap,
-                scale='dB',
-            )
             ax.set_title('Spectrogram')
         
         ax.set_xlabel('Time (seconds)')
@@ -242,7 +614,6 @@ class AudioVisualizer(AudioProcessor):
     ) -> None:
         """Generate combined waveform and spectrogram visualization."""
         duration = len(samples) / sample_rate
-        time_axis = np.linspace(0, duration, len(samples))
         
         fig, (ax1, ax2) = plt.subplots(
             2, 1,
@@ -252,15 +623,7 @@ class AudioVisualizer(AudioProcessor):
         )
         
         # Waveform
-        plot_samples = samples
-        plot_time = time_axis
-        if len(samples) > 10000:
-            step = len(samples) // 10000
-            plot_samples = samples[::step]
-            plot_time = time_axis[::step]
-        
-        ax1.plot(plot_time, plot_samples, color='#2196F3', linewidth=0.5)
-        ax1.fill_between(plot_time, plot_samples, alpha=0.3, color='#2196F3')
+        self._plot_waveform(ax1, samples, sample_rate, width)
         ax1.set_ylabel('Amplitude')
         ax1.set_xlim(0, duration)
         ax1.set_ylim(-1.1, 1.1)
@@ -268,16 +631,7 @@ class AudioVisualizer(AudioProcessor):
         ax1.set_title('Audio Waveform & Spectrogram')
         
         # Spectrogram
-        nfft = min(2048, len(samples))
-        noverlap = nfft // 2
-        spec, freqs, times, im = ax2.specgram(
-            samples,
-            Fs=sample_rate,
-            NFFT=nfft,
-            noverlap=noverlap,
-            cmap=colormap,
-            scale='dB',
-        )
+        self._draw_spectrogram(ax2, samples, sample_rate, colormap)
         ax2.set_xlabel('Time (seconds)')
         ax2.set_ylabel('Frequency (Hz)')
         
@@ -294,6 +648,7 @@ class AudioVisualizer(AudioProcessor):
         height: int = 400,
         dpi: int = 100,
         colormap: str = "viridis",
+        axes: bool = True,
         **kwargs
     ) -> ProcessResult:
         """
@@ -307,6 +662,8 @@ class AudioVisualizer(AudioProcessor):
             height: Image height in pixels
             dpi: Image DPI
             colormap: Colormap for spectrograms
+            axes: Draw axes, labels and colorbar (without them, spectrogram
+                and mel images are rendered directly)
             
         Returns:
             ProcessResult with success status and output path
@@ -323,9 +680,7 @@ class AudioVisualizer(AudioProcessor):
             
             # Load audio
             logger.info(f"Loading audio: {input_path}")
-            audio = AudioSegment.from_file(input_path)
-            samples = self._audio_to_samples(audio)
-            sample_rate = audio.frame_rate
+            samples, sample_rate, duration_seconds = self._cached_samples(input_path)
             
             # Generate output path
             suffix = f"_{viz_type}" if viz_type != "waveform" else ""
@@ -336,6 +691,10 @@ class AudioVisualizer(AudioProcessor):
             
             if viz_type == "waveform":
                 self._generate_waveform(samples, sample_rate, output_path, width, height, dpi)
+            elif viz_type in ("spectrogram", "mel") and not axes and HAS_PIL:
+                self._write_spectrogram_image(
+                    samples, sample_rate, output_path, width, height, colormap, mel=viz_type == "mel"
+                )
             elif viz_type == "spectrogram":
                 self._generate_spectrogram(samples, sample_rate, output_path, width, height, dpi, colormap, mel=False)
             elif viz_type == "mel":
@@ -357,7 +716,8 @@ class AudioVisualizer(AudioProcessor):
                     "width": width,
                     "height": height,
                     "dpi": dpi,
-                    "duration_seconds": len(audio) / 1000,
+                    "axes": axes,
+                    "duration_seconds": duration_seconds,
                     "sample_rate": sample_rate,
                     "processor": self.name,
                     "version": self.version,
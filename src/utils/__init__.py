@@ -13,8 +13,10 @@ from .file_ops import (
 )
 from .audio import (
     load_audio,
+    read_pcm_audio,
     get_audio_info,
     export_audio,
+    write_flac,
     get_duration_ms,
     split_audio,
     calculate_segments,
@@ -58,8 +60,10 @@ __all__ = [
     "SUPPORTED_FORMATS",
     # Audio
     "load_audio",
+    "read_pcm_audio",
     "get_audio_info",
     "export_audio",
+    "write_flac",
     "get_duration_ms",
     "split_audio",
     "calculate_segments",
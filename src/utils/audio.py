@@ -1,5 +1,6 @@
 """Audio utilities using pydub."""
 
+import math
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -12,6 +13,22 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Optional soundfile import (numpy is one of its dependencies)
+try:
+    import numpy as np
+    import soundfile as sf
+    HAS_SOUNDFILE = True
+except ImportError:
+    HAS_SOUNDFILE = False
+
+# PCM subtypes read_pcm_audio decodes, by the sample width pydub gives them
+# (pydub widens 24-bit audio to 32-bit)
+PCM_SUBTYPE_WIDTHS = {"PCM_16": 2, "PCM_24": 4, "PCM_32": 4}
+
+# soundfile subtypes write_flac uses, by sample width (ffmpeg also stores
+# 32-bit audio as 24-bit FLAC)
+FLAC_SUBTYPES = {2: "PCM_16", 4: "PCM_24"}
+
 
 def load_audio(path: Path) -> AudioSegment:
     """
@@ -38,6 +55,45 @@ def load_audio(path: Path) -> AudioSegment:
         raise CorruptedFileError(f"Failed to load {path}: {e}")
 
 
+def read_pcm_audio(path: Path) -> Optional[AudioSegment]:
+    """
+    Decode a PCM file (WAV, FLAC, AIFF, ...) with soundfile.
+    
+    Produces the same AudioSegment as pydub, without an ffmpeg process for
+    FLAC or pydub's per-sample Python loop for 24-bit audio.
+    
+    Args:
+        path: Path to audio file
+        
+    Returns:
+        AudioSegment, or None if soundfile is unavailable or the file
+        is not 16/24/32-bit PCM
+    """
+    if not HAS_SOUNDFILE:
+        return None
+    
+    try:
+        info = sf.info(str(path))
+    except RuntimeError:
+        return None
+    
+    sample_width = PCM_SUBTYPE_WIDTHS.get(info.subtype)
+    if sample_width is None:
+        return None
+    
+    samples, frame_rate = sf.read(str(path), dtype=f"int{sample_width * 8}", always_2d=True)
+    if info.subtype == "PCM_24":
+        # pydub fills the low byte of negative 24-bit samples with ones
+        np.add(samples, 255, out=samples, where=samples < 0)
+    
+    return AudioSegment(
+        samples.tobytes(),
+        frame_rate=frame_rate,
+        sample_width=sample_width,
+        channels=info.channels,
+    )
+
+
 def get_audio_info(path: Path) -> AudioFile:
     """
     Get audio file information.
@@ -98,6 +154,39 @@ def export_audio(
     return output_path
 
 
+def write_flac(audio: AudioSegment, output_path: Path) -> bool:
+    """
+    Write an AudioSegment as FLAC with soundfile, without ffmpeg.
+    
+    Stores the same samples as pydub's ffmpeg export, minus the cost of
+    starting an ffmpeg process and piping the audio to it.
+    
+    Args:
+        audio: AudioSegment to export
+        output_path: Output file path
+        
+    Returns:
+        True if written, False if soundfile is unavailable or the sample
+        width is not supported
+    """
+    subtype = FLAC_SUBTYPES.get(audio.sample_width)
+    if not HAS_SOUNDFILE or subtype is None:
+        return False
+    
+    samples = np.frombuffer(audio.raw_data, dtype=f"int{audio.sample_width * 8}")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    sf.write(
+        str(output_path),
+        samples.reshape(-1, audio.channels),
+        audio.frame_rate,
+        format="FLAC",
+        subtype=subtype,
+    )
+    
+    logger.debug(f"Exported audio to {output_path}")
+    return True
+
+
 def get_duration_ms(path: Path) -> float:
     """Get audio duration in milliseconds."""
     audio = load_audio(path)
@@ -139,19 +228,17 @@ def calculate_segments(
     Returns:
         List of (start_ms, end_ms) tuples
     """
-    segments = []
-    start = 0.0
+    if duration_ms <= 0:
+        return []
     
-    while start < duration_ms:
-        end = min(start + segment_duration_ms, duration_ms)
-        
-        # Handle cleanup of short last segment
-        remaining = duration_ms - end
-        if 0 < remaining < min_last_segment_ms:
-            # Extend this segment to include the remainder
-            end = duration_ms
-        
-        segments.append((start, end))
-        start = end
+    # Boundaries are computed directly rather than stepped through: a short
+    # remainder is merged into the first segment after which less than
+    # min_last_segment_ms (but more than nothing) would be left
+    full_segments = math.ceil(duration_ms / segment_duration_ms)
+    first_short = max(1, math.floor((duration_ms - min_last_segment_ms) / segment_duration_ms) + 1)
+    segment_count = min(full_segments, first_short)
+    
+    starts = [i * segment_duration_ms for i in range(segment_count)]
+    ends = starts[1:] + [float(duration_ms)]
     
-    return segments
+    return list(zip(starts, ends))
@@ -8,8 +8,10 @@ from pydub.generators import Sine
 
 from src.utils.audio import (
     load_audio,
+    read_pcm_audio,
     get_audio_info,
     export_audio,
+    write_flac,
     get_duration_ms,
     split_audio,
     calculate_segments,
@@ -44,6 +46,42 @@ class TestLoadAudio:
             load_audio(corrupted)
 
 
+class TestReadPcmAudio:
+    """Tests for read_pcm_audio function."""
+    
+    @pytest.mark.parametrize("subtype", ["PCM_16", "PCM_24", "PCM_32"])
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_read_pcm_audio_matches_pydub(self, temp_dir, subtype, channels):
+        """Test PCM WAVs decode to the same AudioSegment as pydub."""
+        np = pytest.importorskip("numpy")
+        sf = pytest.importorskip("soundfile")
+        
+        rng = np.random.default_rng(channels)
+        samples = (rng.standard_normal((4410, channels)) * 2 ** 28).astype(np.int32)
+        path = temp_dir / "noise.wav"
+        sf.write(str(path), samples, 44100, subtype=subtype)
+        
+        audio = read_pcm_audio(path)
+        expected = AudioSegment.from_file(path)
+        
+        assert audio.raw_data == expected.raw_data
+        assert audio.sample_width == expected.sample_width
+        assert audio.channels == expected.channels
+        assert audio.frame_rate == expected.frame_rate
+    
+    def test_read_pcm_audio_not_pcm(self, temp_dir):
+        """Test unreadable and non-PCM files return None."""
+        sf = pytest.importorskip("soundfile")
+        
+        corrupted = temp_dir / "corrupted.wav"
+        corrupted.write_text("not a real wav file")
+        assert read_pcm_audio(corrupted) is None
+        
+        float_wav = temp_dir / "float.wav"
+        sf.write(str(float_wav), [0.0, 0.5, -0.5], 8000, subtype="FLOAT")
+        assert read_pcm_audio(float_wav) is None
+
+
 class TestGetAudioInfo:
     """Tests for get_audio_info function."""
     
@@ -112,6 +150,38 @@ class TestExportAudio:
         assert output_path.exists()
 
 
+class TestWriteFlac:
+    """Tests for write_flac function."""
+    
+    @pytest.mark.parametrize("sample_width", [2, 4])
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_write_flac_matches_ffmpeg_export(self, temp_dir, sample_width, channels):
+        """Test FLAC written in-process holds the same samples as pydub's export."""
+        sf = pytest.importorskip("soundfile")
+        
+        audio = Sine(440).to_audio_segment(duration=300)
+        audio = audio.set_channels(channels).set_sample_width(sample_width)
+        output_path = temp_dir / "nested" / "output.flac"
+        expected_path = temp_dir / "expected.flac"
+        
+        assert write_flac(audio, output_path)
+        audio.export(expected_path, format="flac")
+        
+        written, frame_rate = sf.read(str(output_path), dtype="int32")
+        expected, _ = sf.read(str(expected_path), dtype="int32")
+        assert frame_rate == audio.frame_rate
+        assert sf.info(str(output_path)).subtype == sf.info(str(expected_path)).subtype
+        assert (written == expected).all()
+    
+    def test_write_flac_unsupported_width(self, temp_dir):
+        """Test 8-bit audio is left to pydub."""
+        audio = Sine(440).to_audio_segment(duration=300).set_sample_width(1)
+        output_path = temp_dir / "output.flac"
+        
+        assert not write_flac(audio, output_path)
+        assert not output_path.exists()
+
+
 class TestGetDurationMs:
     """Tests for get_duration_ms function."""
     
@@ -142,6 +142,53 @@ class TestSplitFixedCommand:
             assert "Files processed" in result.stdout
             assert "Segments created" in result.stdout
     
+    def test_max_concurrent_passed_to_batch(self, mock_audio_file, tmp_path):
+        """Test --max-concurrent reaches the session manager."""
+        mock_session = Mock(processed_count=1, failed_count=0, session_id="test-session-123", files=[])
+        
+        mock_manager = Mock()
+        mock_manager.run_batch.return_value = mock_session
+        
+        with patch("src.presentation.cli.split_cmd.get_processor", return_value=Mock()), \
+             patch("src.presentation.cli.split_cmd.ensure_directory"), \
+             patch("src.presentation.cli.split_cmd.SQLiteSessionStore"), \
+             patch("src.presentation.cli.split_cmd.SessionManager", return_value=mock_manager), \
+             patch("src.presentation.cli.split_cmd.os.cpu_count", return_value=8):
+            
+            result = runner.invoke(app, [
+                "fixed",
+                str(mock_audio_file),
+                "-d", "30",
+                "-o", str(tmp_path / "output"),
+                "--max-concurrent", "4",
+            ])
+            
+            assert result.exit_code == 0
+            assert mock_manager.run_batch.call_args.kwargs["max_concurrent"] == 4
+            assert mock_manager.run_batch.call_args.kwargs["config"]["max_workers"] == 2
+    
+    def test_sequential_split_keeps_default_export_workers(self, mock_audio_file, tmp_path):
+        """Test one file at a time leaves segment exports on every core."""
+        mock_session = Mock(processed_count=1, failed_count=0, session_id="test-session-123", files=[])
+        
+        mock_manager = Mock()
+        mock_manager.run_batch.return_value = mock_session
+        
+        with patch("src.presentation.cli.split_cmd.get_processor", return_value=Mock()), \
+             patch("src.presentation.cli.split_cmd.ensure_directory"), \
+             patch("src.presentation.cli.split_cmd.SQLiteSessionStore"), \
+             patch("src.presentation.cli.split_cmd.SessionManager", return_value=mock_manager):
+            
+            result = runner.invoke(app, [
+                "fixed",
+                str(mock_audio_file),
+                "-d", "30",
+                "-o", str(tmp_path / "output"),
+            ])
+            
+            assert result.exit_code == 0
+            assert "max_workers" not in mock_manager.run_batch.call_args.kwargs["config"]
+    
     def test_processing_failure_logged(self, mock_audio_file, tmp_path):
         """Test failed file processing shows error."""
         output_dir = tmp_path / "output"
@@ -201,11 +201,53 @@ class TestFormatConverterSampleRate:
         
         assert result.success is True
         assert result.metadata["input_sample_rate"] == result.metadata["output_sample_rate"]
+    
+    @pytest.mark.parametrize("has_soxr", [True, False])
+    def test_resample_keeps_duration_and_format(self, has_soxr):
+        """Test resampling changes the rate but not duration, width or channels."""
+        from unittest.mock import patch
+        from pydub.generators import Sine
+        from src.processors.converter import HAS_SOXR
+        
+        if has_soxr and not HAS_SOXR:
+            pytest.skip("soxr not installed")
+        
+        audio = Sine(440).to_audio_segment(duration=1000).set_channels(2)
+        converter = FormatConverter()
+        
+        with patch("src.processors.converter.HAS_SOXR", has_soxr):
+            resampled = converter._convert_samples(audio, 16000, None, False, False, -50.0)
+        
+        assert resampled.frame_rate == 16000
+        assert resampled.frame_count() == pytest.approx(16000, abs=1)
+        assert resampled.sample_width == audio.sample_width
+        assert resampled.channels == 2
+        assert resampled.dBFS == pytest.approx(audio.dBFS, abs=0.5)
 
 
 class TestFormatConverterChannels:
     """Test channel conversion."""
     
+    @pytest.mark.parametrize("source_channels,target_channels", [(2, 1), (1, 2)])
+    def test_set_channels_matches_pydub(self, source_channels, target_channels):
+        """Test numpy channel conversion produces the same samples as pydub."""
+        from pydub import AudioSegment
+        from pydub.generators import Sine, WhiteNoise
+        
+        left = Sine(440).to_audio_segment(duration=200)
+        right = WhiteNoise().to_audio_segment(duration=200) - 6
+        if source_channels == 1:
+            audio = left
+        else:
+            audio = AudioSegment.from_mono_audiosegments(left, right)
+        converter = FormatConverter()
+        
+        converted = converter._convert_samples(audio, None, target_channels, False, False, -50.0)
+        expected = converter._convert_segment(audio, None, target_channels, False, False, -50.0)
+        
+        assert converted.channels == target_channels
+        assert converted.raw_data == expected.raw_data
+    
     def test_convert_to_mono(self, sample_audio_5sec, output_dir):
         """Test conversion to mono."""
         converter = FormatConverter()
@@ -312,6 +354,34 @@ class TestFormatConverterPureFunction:
         assert result2.metadata["normalized"] is False
 
 
+class TestFormatConverterNormalize:
+    """Test peak normalization."""
+    
+    @pytest.mark.parametrize("sample_width", [1, 2, 4])
+    def test_normalize_matches_pydub(self, sample_width):
+        """Test numpy normalization produces the same samples as pydub."""
+        from pydub.effects import normalize
+        from pydub.generators import Sine
+        
+        audio = (Sine(440).to_audio_segment(duration=200) - 12).set_sample_width(sample_width)
+        converter = FormatConverter()
+        
+        normalized = converter._convert_samples(audio, None, None, True, False, -50.0)
+        
+        assert normalized.raw_data == normalize(audio).raw_data
+    
+    def test_normalize_silent_audio_unchanged(self):
+        """Test digital silence is returned untouched."""
+        from pydub import AudioSegment
+        
+        audio = AudioSegment.silent(100)
+        converter = FormatConverter()
+        
+        normalized = converter._convert_samples(audio, None, None, True, False, -50.0)
+        
+        assert normalized.raw_data == audio.raw_data
+
+
 class TestFormatConverterRemoveSilence:
     """Test silence removal functionality."""
     
@@ -359,6 +429,57 @@ class TestFormatConverterRemoveSilence:
         # Should still succeed, even if output is very short
         assert result.success is True
         assert result.metadata["silence_removed"] is True
+    
+    @pytest.mark.parametrize("frame_rate,channels", [(44100, 1), (22050, 2), (8000, 1)])
+    def test_remove_silence_matches_pydub_scan(self, frame_rate, channels):
+        """Test vectorized silence detection trims the same as pydub slicing."""
+        from pydub import AudioSegment
+        from pydub.generators import Sine
+        
+        tone = Sine(440).to_audio_segment(duration=1000).set_frame_rate(frame_rate) - 30
+        audio = (
+            AudioSegment.silent(333, frame_rate=frame_rate)
+            + tone
+            + AudioSegment.silent(517, frame_rate=frame_rate)
+        ).set_channels(channels)
+        converter = FormatConverter()
+        
+        trimmed = converter._convert_samples(audio, None, None, False, True, -50.0)
+        expected = converter._convert_segment(audio, None, None, False, True, -50.0)
+        
+        assert len(trimmed) == len(expected)
+        assert trimmed.raw_data == expected.raw_data
+    
+    @pytest.mark.parametrize("frame_rate", [22050, 11025])
+    def test_remove_silence_off_millisecond_grid_matches_pydub(self, frame_rate):
+        """Test late onsets at rates off pydub's chunk grid trim where pydub does."""
+        import numpy as np
+        from pydub import AudioSegment
+        
+        onset = int(20.003 * frame_rate)
+        samples = np.zeros(30 * frame_rate, dtype=np.int16)
+        samples[onset:] = 8000
+        audio = AudioSegment(
+            samples.tobytes(), frame_rate=frame_rate, sample_width=2, channels=1
+        )
+        converter = FormatConverter()
+        
+        trimmed = converter._convert_samples(audio, None, None, False, True, -50.0)
+        expected = converter._convert_segment(audio, None, None, False, True, -50.0)
+        
+        assert trimmed.frame_count() == expected.frame_count()
+        assert trimmed.raw_data == expected.raw_data
+    
+    def test_remove_silence_all_silent_is_empty(self):
+        """Test fully silent audio is trimmed to nothing."""
+        from pydub import AudioSegment
+        
+        converter = FormatConverter()
+        trimmed = converter._convert_samples(
+            AudioSegment.silent(500), None, None, False, True, -50.0
+        )
+        
+        assert len(trimmed) == 0
 
 
 class TestFormatConverterExceptionHandling:
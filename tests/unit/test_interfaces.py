@@ -95,3 +95,27 @@ class TestAudioProcessorValidateParams:
         errors = processor.validate_params(optional_param=0)
         
         assert len(errors) == 2
+
+
+class TestAudioProcessorProcessBatch:
+    """Tests for AudioProcessor.process_batch method."""
+    
+    def test_process_batch_runs_inline_for_one_worker(self, tmp_path):
+        """Test a single worker processes files in order without a pool."""
+        processor = ConcreteProcessor()
+        paths = [tmp_path / "a.wav", tmp_path / "b.wav"]
+        
+        results = processor.process_batch(paths, tmp_path, max_workers=1)
+        
+        assert [r.input_path for r in results] == paths
+        assert all(r.success for r in results)
+    
+    def test_process_batch_parallel_preserves_order(self, tmp_path):
+        """Test pooled processing returns one result per input in order."""
+        processor = ConcreteProcessor()
+        paths = [tmp_path / f"{i}.wav" for i in range(4)]
+        
+        results = processor.process_batch(paths, tmp_path, max_workers=2)
+        
+        assert [r.input_path for r in results] == paths
+        assert all(r.success for r in results)
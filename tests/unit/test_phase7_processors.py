@@ -1,10 +1,16 @@
 """Tests for Phase 7 advanced processors."""
 
 import json
+import os
+import subprocess
+import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from src.processors import (
@@ -103,6 +109,248 @@ class TestAudioVisualizer:
         )
         assert not result.success
         assert "numpy" in result.error_message.lower()
+    
+    @pytest.mark.parametrize("sample_width", [1, 2, 4])
+    @pytest.mark.parametrize("channels", [1, 2, 6])
+    def test_audio_to_samples_matches_array_of_samples(self, sample_width, channels):
+        """Test raw-buffer samples match pydub's sample array, normalized."""
+        from pydub import AudioSegment
+        
+        rng = np.random.default_rng(2)
+        max_val = 2 ** (sample_width * 8 - 1)
+        raw = rng.integers(-max_val, max_val, size=2000 * channels)
+        audio = AudioSegment(
+            raw.astype(f"int{sample_width * 8}").tobytes(),
+            frame_rate=8000,
+            sample_width=sample_width,
+            channels=channels,
+        )
+        
+        expected = np.array(audio.get_array_of_samples()).reshape((-1, channels)).mean(axis=1) / max_val
+        samples = AudioVisualizer()._audio_to_samples(audio)
+        
+        assert samples.dtype == np.float32
+        np.testing.assert_allclose(samples, expected, rtol=1e-6, atol=1e-7)
+    
+    def test_cached_samples_decode_once(self, tmp_path):
+        """Test repeated loads of an unchanged file reuse the decoded samples."""
+        from pydub import AudioSegment
+        from src.processors.visualizer import _SAMPLE_CACHE
+        
+        input_path = tmp_path / "tone.wav"
+        AudioSegment.silent(duration=100, frame_rate=8000).export(input_path, format="wav")
+        processor = AudioVisualizer()
+        
+        _SAMPLE_CACHE.clear()
+        try:
+            with patch.object(processor, "_load_samples", wraps=processor._load_samples) as load:
+                first = processor._cached_samples(input_path)
+                second = processor._cached_samples(input_path)
+                assert load.call_count == 1
+                assert second[0] is first[0]
+                assert not first[0].flags.writeable
+                
+                stat = input_path.stat()
+                os.utime(input_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+                processor._cached_samples(input_path)
+                assert load.call_count == 2
+        finally:
+            _SAMPLE_CACHE.clear()
+    
+    def test_cached_samples_evicts_oldest(self, tmp_path):
+        """Test the sample cache stays within its byte budget."""
+        from pydub import AudioSegment
+        from src.processors.visualizer import _SAMPLE_CACHE
+        
+        paths = []
+        for name in ["a", "b", "c"]:
+            path = tmp_path / f"{name}.wav"
+            AudioSegment.silent(duration=100, frame_rate=8000).export(path, format="wav")
+            paths.append(path)
+        
+        processor = AudioVisualizer()
+        _SAMPLE_CACHE.clear()
+        try:
+            # 800 float32 samples per file: room for two
+            with patch("src.processors.visualizer.SAMPLE_CACHE_BYTES", 6400):
+                for path in paths:
+                    processor._cached_samples(path)
+            assert [key[0] for key in _SAMPLE_CACHE] == [str(p.resolve()) for p in paths[1:]]
+        finally:
+            _SAMPLE_CACHE.clear()
+    
+    @patch("src.processors.visualizer.STFT_BLOCK_FRAMES", 4)
+    def test_frame_power_in_blocks_matches_whole(self):
+        """Test the blocked STFT covers every frame, including a partial last block."""
+        samples = np.random.default_rng(7).uniform(-1, 1, 12000).astype(np.float32)
+        window = np.hanning(2048).astype(np.float32)
+        
+        power = AudioVisualizer()._frame_power(samples, 2048, 1024, window)
+        
+        frames = np.lib.stride_tricks.sliding_window_view(samples, 2048)[::1024]
+        expected = np.abs(np.fft.rfft(frames * window, axis=1)) ** 2
+        assert power.shape == (10, 1025)
+        np.testing.assert_allclose(power, expected, rtol=1e-3, atol=1e-6)
+    
+    @pytest.mark.parametrize("has_gpu", [False, True])
+    @patch("src.processors.visualizer.GPU_MIN_SAMPLES", 0)
+    @patch("src.processors.visualizer.HAS_TORCH", True)
+    def test_spectrogram_on_gpu_when_available(self, has_gpu):
+        """Test long spectrograms go to the GPU only when CUDA is available."""
+        samples = np.random.default_rng(6).uniform(-1, 1, 8000).astype(np.float32)
+        processor = AudioVisualizer()
+        expected = processor._frame_power(samples, 2048, 1024, np.hanning(2048).astype(np.float32))
+        
+        device = MagicMock() if has_gpu else None
+        with patch("src.processors.visualizer._get_cuda_device", return_value=device), \
+                patch.object(processor, "_frame_power_gpu", return_value=expected.copy()) as gpu:
+            power, extent = processor._spectrogram_db(samples, 8000)
+        
+        assert gpu.called == has_gpu
+        assert power.shape == (6, 1025)
+        assert extent[3] == 4000.0
+    
+    @pytest.mark.parametrize("viz_type", ["spectrogram", "mel"])
+    def test_spectrogram_without_axes_written_directly(self, viz_type, tmp_path):
+        """Test axes=False renders spectrograms to an image of the requested size."""
+        from PIL import Image
+        from pydub.generators import Sine
+        
+        input_path = tmp_path / "tone.wav"
+        Sine(440).to_audio_segment(duration=500).set_frame_rate(8000).export(input_path, format="wav")
+        
+        processor = AudioVisualizer()
+        with patch.object(processor, "_generate_spectrogram") as generate:
+            result = processor.process(
+                input_path, tmp_path / "out", viz_type=viz_type, width=640, height=240, axes=False
+            )
+        
+        assert result.success
+        assert result.metadata["axes"] is False
+        generate.assert_not_called()
+        with Image.open(result.output_paths[0]) as image:
+            assert image.size == (640, 240)
+            assert image.mode == "RGB"
+    
+    def test_spectrogram_image_puts_high_frequencies_on_top(self, tmp_path):
+        """Test the raster spectrogram is drawn with frequency increasing upwards."""
+        from PIL import Image
+        
+        samples = np.sin(2 * np.pi * 3500 * np.arange(8000) / 8000).astype(np.float32)
+        output_path = tmp_path / "tone.png"
+        
+        AudioVisualizer()._write_spectrogram_image(samples, 8000, output_path, 400, 200, "gray")
+        
+        with Image.open(output_path) as image:
+            brightness = np.asarray(image)[:, :, 0].mean(axis=1)
+        # 3.5 kHz of a 4 kHz range: the brightest row is near the top
+        assert brightness.argmax() == pytest.approx(25, abs=3)
+    
+    def test_waveform_envelope_keeps_peaks(self):
+        """Test the waveform envelope keeps every column's extremes."""
+        samples = np.zeros(10007, dtype=np.float32)
+        samples[[5, 2001, 10006]] = [0.9, -0.8, 0.7]
+        
+        times, mins, maxs = AudioVisualizer()._waveform_envelope(samples, 1000, 100)
+        
+        assert len(times) == len(mins) == len(maxs) == 100
+        assert maxs.max() == pytest.approx(0.9)
+        assert mins.min() == pytest.approx(-0.8)
+        assert maxs[-1] == pytest.approx(0.7)
+        assert np.all(np.diff(times) > 0)
+        assert 0 < times[0] < times[-1] < 10.007
+    
+    def test_waveform_envelope_short_signal_unreduced(self):
+        """Test signals shorter than two samples per column are plotted as-is."""
+        samples = np.linspace(-1, 1, 150, dtype=np.float32)
+        
+        times, mins, maxs = AudioVisualizer()._waveform_envelope(samples, 100, 100)
+        
+        assert mins is samples and maxs is samples
+        assert times[-1] == pytest.approx(1.49)
+    
+    @pytest.mark.filterwarnings("ignore:Only one segment is calculated")
+    @pytest.mark.parametrize("num_samples", [1001, 20000])
+    def test_draw_spectrogram_matches_specgram(self, num_samples):
+        """Test the batched STFT draws the same image as matplotlib's specgram."""
+        import matplotlib.pyplot as plt
+        
+        samples = np.random.default_rng(4).uniform(-1, 1, num_samples).astype(np.float32)
+        nfft = min(2048, num_samples)
+        
+        fig, (ax1, ax2) = plt.subplots(2, 1)
+        try:
+            _, _, _, expected = ax1.specgram(
+                samples, Fs=8000, NFFT=nfft, noverlap=nfft // 2, scale='dB'
+            )
+            im = AudioVisualizer()._draw_spectrogram(ax2, samples, 8000, "viridis")
+            
+            np.testing.assert_allclose(im.get_array(), np.flipud(expected.get_array()), atol=1e-3)
+            np.testing.assert_allclose(im.get_extent(), expected.get_extent())
+            assert ax2.get_xlim() == ax1.get_xlim()
+            assert ax2.get_ylim() == ax1.get_ylim()
+        finally:
+            plt.close(fig)
+    
+    @pytest.mark.parametrize("sample_width", [1, 2, 4])
+    @pytest.mark.parametrize("channels", [1, 2, 6])
+    def test_audio_to_samples_kernel_matches_numpy(self, sample_width, channels):
+        """Test the compiled mixdown gives the same float32 samples as NumPy."""
+        pytest.importorskip("numba")
+        from pydub import AudioSegment
+        
+        rng = np.random.default_rng(5)
+        max_val = 2 ** (sample_width * 8 - 1)
+        raw = rng.integers(-max_val, max_val, size=3000 * channels)
+        audio = AudioSegment(
+            raw.astype(f"int{sample_width * 8}").tobytes(),
+            frame_rate=8000,
+            sample_width=sample_width,
+            channels=channels,
+        )
+        
+        processor = AudioVisualizer()
+        with patch("src.processors.visualizer.HAS_NUMBA", False):
+            expected = processor._audio_to_samples(audio)
+        with patch("src.processors.visualizer.NUMBA_MIN_SAMPLES", 0):
+            samples = processor._audio_to_samples(audio)
+        
+        assert samples.dtype == np.float32
+        np.testing.assert_array_equal(samples, expected)
+    
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_load_samples_with_soundfile_matches_pydub(self, channels, tmp_path):
+        """Test soundfile's float32 read matches the pydub decode path."""
+        sf = pytest.importorskip("soundfile")
+        from pydub import AudioSegment
+        
+        rng = np.random.default_rng(3)
+        input_path = tmp_path / "tone.wav"
+        sf.write(str(input_path), rng.uniform(-1, 1, (4001, channels)), 8000, subtype="PCM_16")
+        
+        processor = AudioVisualizer()
+        samples, sample_rate, duration = processor._load_samples(input_path)
+        
+        audio = AudioSegment.from_file(input_path)
+        assert samples.dtype == np.float32
+        assert sample_rate == audio.frame_rate
+        assert duration == len(audio) / 1000
+        np.testing.assert_allclose(samples, processor._audio_to_samples(audio), rtol=1e-6, atol=1e-7)
+    
+    @patch("src.processors.visualizer.HAS_SOUNDFILE", False)
+    def test_load_samples_falls_back_to_pydub(self, tmp_path):
+        """Test files are decoded with pydub when soundfile is unavailable."""
+        from pydub import AudioSegment
+        
+        audio = AudioSegment.silent(duration=250, frame_rate=8000)
+        input_path = tmp_path / "silence.wav"
+        audio.export(input_path, format="wav")
+        
+        samples, sample_rate, duration = AudioVisualizer()._load_samples(input_path)
+        
+        assert len(samples) == 2000
+        assert sample_rate == 8000
+        assert duration == 0.25
 
 
 class TestAudioStatistics:
@@ -142,6 +390,160 @@ class TestAudioStatistics:
         assert not result.success
         assert "numpy" in result.error_message.lower()
 
+    
+    def _measure_audio(self, processor, audio, chunk_size_ms):
+        return processor._measure_levels(
+            processor._audio_blocks(audio),
+            audio.frame_rate,
+            audio.channels,
+            audio.sample_width,
+            int(audio.frame_count()),
+            chunk_size_ms,
+        )
+    
+    @pytest.mark.parametrize("frame_rate", [8000, 22050, 44100])
+    @pytest.mark.parametrize("chunk_size_ms", [10, 33, 100])
+    def test_chunk_dbfs_matches_pydub(self, frame_rate, chunk_size_ms):
+        """Test vectorized chunk levels equal pydub's per-chunk dBFS."""
+        from pydub import AudioSegment
+        
+        processor = AudioStatistics()
+        rng = np.random.default_rng(7)
+        envelope = np.repeat(rng.choice([0.0, 1e-3, 0.3], size=40), frame_rate // 20)
+        samples = (rng.standard_normal((len(envelope), 2)) * envelope[:, None] * 32767)
+        audio = AudioSegment(
+            samples.clip(-32768, 32767).astype(np.int16).tobytes(),
+            frame_rate=frame_rate,
+            sample_width=2,
+            channels=2,
+        )
+        
+        expected = [
+            audio[i:i + chunk_size_ms].dBFS
+            for i in range(0, len(audio), chunk_size_ms)
+            if len(audio[i:i + chunk_size_ms]) >= chunk_size_ms // 2
+        ]
+        
+        levels = self._measure_audio(processor, audio, chunk_size_ms)
+        
+        np.testing.assert_allclose(levels["chunk_dbfs"], expected, rtol=1e-12)
+        assert levels["overall_dbfs"] == pytest.approx(audio.dBFS, rel=1e-12)
+        assert levels["duration_ms"] == len(audio)
+    
+    @pytest.mark.parametrize("subtype", ["PCM_16", "PCM_24", "PCM_32"])
+    def test_streamed_levels_match_pydub(self, tmp_path, subtype):
+        """Test levels read block by block with soundfile equal pydub's."""
+        sf = pytest.importorskip("soundfile")
+        from pydub import AudioSegment
+        
+        rng = np.random.default_rng(3)
+        input_path = tmp_path / "noise.wav"
+        envelope = np.repeat(rng.choice([0.0, 1e-3, 0.3], size=30), 1600)
+        samples = rng.standard_normal((len(envelope), 2)) * envelope[:, None] * 0.5
+        sf.write(input_path, samples, 16000, subtype=subtype)
+        processor = AudioStatistics()
+        
+        with processor._open_stream(input_path) as stream:
+            sample_width = 2 if subtype == "PCM_16" else 4
+            streamed = processor._measure_levels(
+                processor._stream_blocks(stream), 16000, 2, sample_width, stream.frames, 100,
+            )
+        expected = self._measure_audio(processor, AudioSegment.from_file(input_path), 100)
+        
+        np.testing.assert_allclose(streamed["chunk_dbfs"], expected["chunk_dbfs"], rtol=1e-12)
+        np.testing.assert_allclose(streamed["window_rms"], expected["window_rms"], rtol=1e-12)
+        assert streamed["rms"] == pytest.approx(expected["rms"], rel=1e-12)
+        assert streamed["peak"] == expected["peak"]
+    
+    @pytest.mark.parametrize("channels", [1, 2, 3])
+    def test_numba_levels_match_numpy(self, channels):
+        """Test the fused numba kernel matches the vectorized numpy sums."""
+        from src.processors.statistics import HAS_NUMBA
+        
+        if not HAS_NUMBA:
+            pytest.skip("numba not installed")
+        
+        processor = AudioStatistics()
+        rng = np.random.default_rng(5)
+        envelope = np.repeat(rng.choice([0.0, 1e-3, 0.3], size=60), 2205)
+        samples = rng.standard_normal((len(envelope), channels)) * envelope[:, None] * 32767
+        raw = samples.clip(-32768, 32767).astype(np.int16)
+        
+        def measure():
+            # Blocks that split chunks and windows mid-way
+            blocks = (raw[i:i + 1000] for i in range(0, len(raw), 1000))
+            return processor._measure_levels(blocks, 22050, channels, 2, len(raw), 33)
+        
+        with patch("src.processors.statistics.NUMBA_MIN_SAMPLES", 0):
+            levels = measure()
+        with patch("src.processors.statistics.HAS_NUMBA", False):
+            expected = measure()
+        
+        np.testing.assert_array_equal(levels["chunk_dbfs"], expected["chunk_dbfs"])
+        np.testing.assert_allclose(levels["window_rms"], expected["window_rms"], rtol=1e-6)
+        assert levels["overall_dbfs"] == expected["overall_dbfs"]
+        assert levels["rms"] == pytest.approx(expected["rms"], rel=1e-6)
+        assert levels["peak"] == pytest.approx(expected["peak"], rel=1e-6)
+    
+    def test_open_stream_skips_non_pcm(self, tmp_path):
+        """Test 8-bit and float files are left to pydub."""
+        sf = pytest.importorskip("soundfile")
+        
+        processor = AudioStatistics()
+        for subtype in ["PCM_U8", "FLOAT"]:
+            input_path = tmp_path / f"{subtype}.wav"
+            sf.write(input_path, np.zeros(100), 8000, subtype=subtype)
+            assert processor._open_stream(input_path) is None
+        assert processor._open_stream(tmp_path / "missing.wav") is None
+    
+    def test_vad_counts_voice_segments(self):
+        """Test VAD counts runs of loud chunks as segments."""
+        from pydub import AudioSegment
+        from pydub.generators import Sine
+        
+        tone = Sine(440).to_audio_segment(duration=300)
+        gap = AudioSegment.silent(duration=200)
+        audio = gap + tone + gap + tone + tone + gap
+        processor = AudioStatistics()
+        levels = self._measure_audio(processor, audio, 100)
+        
+        vad = processor._calculate_vad(levels, -30.0, 100)
+        
+        assert vad["voice_segments"] == 2
+        assert vad["total_voice_duration_ms"] == 900
+        assert vad["avg_segment_duration_ms"] == 450
+        assert vad["voice_ratio"] == pytest.approx(9 / 15)
+        assert processor._calculate_silence_ratio(levels, -40.0, 100) == pytest.approx(6 / 15)
+    
+    def test_dynamic_range_ignores_silent_chunks(self):
+        """Test dynamic range compares loud and quiet chunks, skipping silence."""
+        processor = AudioStatistics()
+        window_rms = np.array([0.5] * 10 + [0.005] * 10 + [0.0])
+        
+        assert processor._calculate_dynamic_range(window_rms) == pytest.approx(40.0)
+        assert processor._calculate_dynamic_range(np.array([0.5, 0.0])) == 0.0
+    
+    def test_process_streams_wav(self, tmp_path):
+        """Test a PCM WAV is analyzed without decoding it through pydub."""
+        sf = pytest.importorskip("soundfile")
+        
+        input_path = tmp_path / "tone.wav"
+        t = np.arange(16000) / 16000
+        sf.write(input_path, 0.5 * np.sin(2 * np.pi * 440 * t), 16000, subtype="PCM_16")
+        
+        with patch("src.processors.statistics.AudioSegment.from_file") as from_file:
+            result = AudioStatistics().process(input_path=input_path, output_dir=tmp_path / "out")
+        
+        from_file.assert_not_called()
+        assert result.success is True
+        assert result.metadata["file"]["duration_ms"] == 1000
+        assert result.metadata["levels"]["rms"] == pytest.approx(0.5 / np.sqrt(2), rel=1e-3)
+        assert result.metadata["levels"]["peak"] == pytest.approx(0.5, rel=1e-3)
+        assert result.metadata["vad"]["voice_ratio"] == 1.0
+        
+        written = json.loads(result.output_paths[0].read_text(encoding="utf-8"))
+        assert written["analysis"]["processing_time_ms"] == result.processing_time_ms
+
 
 class TestNoiseReducer:
     """Tests for NoiseReducer processor."""
@@ -170,6 +572,137 @@ class TestNoiseReducer:
         assert param.min_value == 0.0
         assert param.max_value == 40.0
     
+    def test_noise_profile_has_rfft_bins(self):
+        """Test the noise profile covers only the non-negative frequencies."""
+        processor = NoiseReducer()
+        samples = np.random.default_rng(0).standard_normal(8192)
+        
+        profile = processor._estimate_noise_profile(samples, 4096, 2048)
+        
+        assert profile.shape == (1025,)
+        assert np.all(profile > 0)
+    
+    @pytest.mark.parametrize("smoothing_factor", [0.0, 0.5, 1.0])
+    def test_smooth_frames_matches_recursion(self, smoothing_factor):
+        """Test lfilter smoothing equals the frame-by-frame recursion."""
+        processor = NoiseReducer()
+        magnitudes = np.abs(np.random.default_rng(1).standard_normal((50, 9)))
+        
+        smoothed = processor._smooth_frames(magnitudes, smoothing_factor)
+        with patch("src.processors.noise_reduce.HAS_SCIPY", False):
+            expected = processor._smooth_frames(magnitudes, smoothing_factor)
+        
+        np.testing.assert_allclose(smoothed, expected, rtol=1e-12, atol=1e-15)
+        np.testing.assert_array_equal(smoothed[0], magnitudes[0])
+    
+    def test_smooth_frames_without_smoothing_is_identity(self):
+        """Test a zero smoothing factor skips the filter pass."""
+        processor = NoiseReducer()
+        magnitudes = np.abs(np.random.default_rng(1).standard_normal((50, 9)))
+        
+        assert processor._smooth_frames(magnitudes, 0.0) is magnitudes
+    
+    def test_spectral_subtraction_reduces_noise(self):
+        """Test noise-only audio is attenuated while a tone passes through."""
+        processor = NoiseReducer()
+        rng = np.random.default_rng(0)
+        t = np.arange(44100) / 44100
+        noise = 0.05 * rng.standard_normal(len(t))
+        tone = 0.5 * np.sin(2 * np.pi * 440 * t) * (t >= 0.5)
+        
+        processed = processor._process_channel(noise + tone, 11025, 2048, 10 ** (12 / 20), 0.5)
+        
+        def rms_db(x):
+            return 20 * np.log10(np.sqrt(np.mean(x ** 2)))
+        
+        assert processed.shape == noise.shape
+        assert rms_db(processed[4096:20000]) < rms_db(noise[4096:20000]) - 20
+        assert rms_db(processed[26000:40000]) == pytest.approx(rms_db(tone[26000:40000]), abs=1.0)
+    
+    def test_spectral_subtraction_reconstructs_without_noise(self):
+        """Test overlap-add is an exact identity when nothing is subtracted."""
+        processor = NoiseReducer()
+        samples = np.random.default_rng(1).standard_normal(20000)
+        
+        processed = processor._spectral_subtraction(samples, np.zeros(1025), 1.0, 0.0)
+        
+        # Every sample covered by a frame comes back, including the first hop
+        # and the last frame's tail (the first sample sits on a window zero)
+        np.testing.assert_allclose(processed[1:19456], samples[1:19456], atol=1e-9)
+        assert not processed[19456:].any()
+    
+    def test_numba_subtraction_matches_numpy(self):
+        """Test the fused numba kernel matches the vectorized numpy steps."""
+        from src.processors.noise_reduce import HAS_NUMBA
+        
+        if not HAS_NUMBA:
+            pytest.skip("numba not installed")
+        
+        processor = NoiseReducer()
+        samples = 0.1 * np.random.default_rng(6).standard_normal(30000)
+        
+        processed = processor._process_channel(samples, 8000, 2048, 4.0, 0.5)
+        with patch("src.processors.noise_reduce.HAS_NUMBA", False):
+            expected = processor._process_channel(samples, 8000, 2048, 4.0, 0.5)
+        
+        np.testing.assert_allclose(processed, expected, rtol=1e-9, atol=1e-12)
+    
+    def test_numba_subtraction_releases_gil(self):
+        """Test the kernel is compiled nogil so channel threads run in parallel."""
+        from src.processors.noise_reduce import HAS_NUMBA, _get_subtraction_kernel
+        
+        if not HAS_NUMBA:
+            pytest.skip("numba not installed")
+        
+        assert _get_subtraction_kernel().targetoptions["nogil"] is True
+    
+    def test_process_channel_keeps_float32(self):
+        """Test float32 input is processed without upcasting."""
+        processor = NoiseReducer()
+        samples = (0.1 * np.random.default_rng(2).standard_normal(20000)).astype(np.float32)
+        
+        processed = processor._process_channel(samples, 8000, 2048, 4.0, 0.5)
+        
+        assert processed.dtype == np.float32
+    
+    @pytest.mark.parametrize("sample_width", [1, 2, 4])
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_samples_round_trip_by_channel(self, sample_width, channels):
+        """Test audio is split into contiguous channel rows and interleaved back."""
+        from pydub import AudioSegment
+        
+        processor = NoiseReducer()
+        raw = np.random.default_rng(5).integers(0, 256, size=1200, dtype=np.uint8).tobytes()
+        audio = AudioSegment(raw, frame_rate=8000, sample_width=sample_width, channels=channels)
+        
+        samples = processor._audio_to_samples(audio)
+        expected = np.array(audio.get_array_of_samples()) / float(2 ** (sample_width * 8 - 1))
+        
+        assert samples.dtype == np.float32
+        assert samples.shape == (channels, len(expected) // channels)
+        assert samples.flags.c_contiguous
+        np.testing.assert_allclose(samples.T.ravel(), expected, rtol=1e-6)
+        
+        # Exact up to float32 precision, which only matters for 32-bit audio
+        restored = processor._samples_to_audio(list(samples), 8000, sample_width, channels)
+        np.testing.assert_allclose(
+            np.array(restored.get_array_of_samples()),
+            np.array(audio.get_array_of_samples()),
+            atol=2 ** 8 if sample_width == 4 else 0,
+        )
+    
+    def test_silent_noise_profile_skips_processing(self):
+        """Test a silent noise section leaves the channel untouched."""
+        processor = NoiseReducer()
+        samples = np.zeros(20000, dtype=np.float32)
+        samples[10000:] = np.random.default_rng(3).uniform(-0.5, 0.5, 10000)
+        
+        with patch.object(processor, "_spectral_subtraction") as subtraction:
+            processed = processor._process_channel(samples, 8000, 2048, 4.0, 0.5)
+        
+        subtraction.assert_not_called()
+        np.testing.assert_array_equal(processed, samples)
+    
     @patch("src.processors.noise_reduce.HAS_NUMPY", False)
     def test_missing_numpy_dependency(self, tmp_path):
         """Test error when numpy is missing."""
@@ -209,6 +742,18 @@ class TestDynamicsProcessor:
         assert "output_gain" in param_names
         assert "output_format" in param_names
     
+    def test_import_defers_scipy_and_numba(self):
+        """Test importing the module leaves scipy and numba unloaded until used."""
+        code = (
+            "import sys, src.processors.dynamics; "
+            "print(sorted(m for m in ('numba', 'scipy.signal', 'scipy.fft') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        
+        assert result.stdout.strip() == "[]"
+    
     def test_compressor_ratio_range(self):
         """Test compressor ratio parameter has correct range."""
         processor = DynamicsProcessor()
@@ -225,6 +770,178 @@ class TestDynamicsProcessor:
             assert param.min_value == -12.0
             assert param.max_value == 12.0
     
+    @pytest.mark.parametrize("sample_width", [1, 2, 4])
+    def test_audio_to_samples_matches_array_of_samples(self, sample_width):
+        """Test raw buffer decoding matches pydub's own sample array."""
+        from pydub import AudioSegment
+        
+        processor = DynamicsProcessor()
+        raw = np.random.default_rng(4).integers(0, 256, size=600, dtype=np.uint8).tobytes()
+        audio = AudioSegment(raw, frame_rate=8000, sample_width=sample_width, channels=2)
+        
+        samples = processor._audio_to_samples(audio)
+        expected = np.array(audio.get_array_of_samples()) / float(2 ** (sample_width * 8 - 1))
+        
+        assert samples.dtype == np.float32
+        assert samples.shape == (len(expected) // 2, 2)
+        np.testing.assert_allclose(samples.ravel(), expected, rtol=1e-6)
+    
+    @pytest.mark.parametrize("has_numba", [True, False])
+    @pytest.mark.parametrize("sample_width", [1, 2, 4])
+    def test_samples_to_audio_round_trip(self, sample_width, has_numba):
+        """Test samples are quantized at the original width and clipped at full scale."""
+        from src.processors.dynamics import HAS_NUMBA
+        
+        if has_numba and not HAS_NUMBA:
+            pytest.skip("numba not installed")
+        
+        processor = DynamicsProcessor()
+        samples = np.array([[-2.0, -1.0], [-0.5, 0.0], [0.5, 1.0]], dtype=np.float32)
+        max_val = 2 ** (sample_width * 8 - 1)
+        
+        with patch("src.processors.dynamics.HAS_NUMBA", has_numba):
+            audio = processor._samples_to_audio(samples, 8000, sample_width, 2)
+        
+        assert audio.sample_width == sample_width
+        assert list(audio.get_array_of_samples()) == [
+            -max_val, -max_val, -max_val // 2, 0, max_val // 2, max_val - 1
+        ]
+    
+    def test_smooth_envelope_symmetric_matches_recursion(self):
+        """Test equal attack/release uses a one-pole filter with the same output."""
+        from src.processors.dynamics import _smooth_envelope_asymmetric
+        
+        processor = DynamicsProcessor()
+        envelope = np.abs(np.random.default_rng(0).standard_normal(2000))
+        
+        smoothed = processor._smooth_envelope(envelope, 0.01, 0.01)
+        expected = _smooth_envelope_asymmetric(envelope[:, None], 0.01, 0.01)[:, 0]
+        np.testing.assert_allclose(smoothed, expected, rtol=1e-9, atol=1e-12)
+    
+    def test_smooth_envelope_asymmetric(self):
+        """Test attack is applied on rising and release on falling signal."""
+        processor = DynamicsProcessor()
+        envelope = np.array([1.0, 1.0, 0.0, 0.0])
+        
+        smoothed = processor._smooth_envelope(envelope, 0.5, 0.25)
+        np.testing.assert_allclose(smoothed, [0.5, 0.75, 0.5625, 0.421875])
+    
+    def test_process_samples_stereo_matches_per_channel(self):
+        """Test batched stereo processing equals processing each channel alone."""
+        processor = DynamicsProcessor()
+        stereo = np.random.default_rng(2).uniform(-0.8, 0.8, size=(4000, 2))
+        args = (44100, -20.0, 4.0, 441, 4410, -3.0, 2.0, 1.0, 3.0)
+        
+        batched = processor._process_samples(stereo, *args)
+        for ch in range(2):
+            single = processor._process_samples(stereo[:, ch:ch + 1], *args)
+            np.testing.assert_allclose(batched[:, ch], single[:, 0])
+    
+    @pytest.mark.parametrize("has_scipy", [True, False])
+    def test_process_samples_keeps_float32(self, has_scipy):
+        """Test the whole chain stays in float32 without upcasting."""
+        processor = DynamicsProcessor()
+        stereo = np.random.default_rng(3).uniform(-0.8, 0.8, size=(4000, 2)).astype(np.float32)
+        args = (44100, -20.0, 4.0, 441, 441, -3.0, 2.0, 1.0, 3.0)
+        
+        with patch("src.processors.dynamics.HAS_SCIPY", has_scipy):
+            processed = processor._process_samples(stereo, *args)
+        
+        assert processed.dtype == np.float32
+    
+    def test_compressor_kernel_matches_numpy(self):
+        """Test the numba compressor kernel matches the numpy passes."""
+        from src.processors.dynamics import HAS_NUMBA
+        
+        if not HAS_NUMBA:
+            pytest.skip("numba not installed")
+        
+        processor = DynamicsProcessor()
+        stereo = np.random.default_rng(5).uniform(-0.9, 0.9, size=(4000, 2))
+        
+        compiled = processor._apply_compression(stereo, -20.0, 4.0, 441, 4410)
+        with patch("src.processors.dynamics.HAS_NUMBA", False):
+            expected = processor._apply_compression(stereo, -20.0, 4.0, 441, 4410)
+        
+        np.testing.assert_allclose(compiled, expected, rtol=1e-9)
+    
+    def test_compressor_kernel_compiles_once_for_all_settings(self):
+        """Test new compressor settings reuse the compiled kernel."""
+        from src.processors.dynamics import HAS_NUMBA, _get_compressor_kernel
+        
+        if not HAS_NUMBA:
+            pytest.skip("numba not installed")
+        
+        processor = DynamicsProcessor()
+        stereo = np.random.default_rng(6).uniform(-0.9, 0.9, size=(1000, 2))
+        
+        processor._apply_compression(stereo, -20.0, 4.0, 441, 4410)
+        compiled = len(_get_compressor_kernel().signatures)
+        processor._apply_compression(stereo, -12.0, 2.5, 100, 1000)
+        
+        assert len(_get_compressor_kernel().signatures) == compiled
+    
+    def test_apply_gain_in_place(self):
+        """Test output gain can scale the buffer in place."""
+        processor = DynamicsProcessor()
+        samples = np.full((4, 2), 0.25, dtype=np.float32)
+        
+        result = processor._apply_gain(samples, 6.0206, out=samples)
+        
+        assert result is samples
+        np.testing.assert_allclose(samples, 0.5, rtol=1e-4)
+    
+    def test_eq_response_bands(self):
+        """Test EQ response holds each band gain and crossfades at the edges."""
+        from src.processors.dynamics import _build_eq_response
+        
+        response = _build_eq_response(44100, 44100, -6.0, 0.0, 6.0)
+        freqs = np.fft.rfftfreq(44100, 1 / 44100)
+        low, mid, high = 10 ** (-6 / 20), 1.0, 10 ** (6 / 20)
+        
+        np.testing.assert_allclose(response[freqs < 150], low)
+        np.testing.assert_allclose(response[(freqs >= 250) & (freqs < 3950)], mid)
+        np.testing.assert_allclose(response[freqs >= 4050], high)
+        assert response[freqs == 200][0] == pytest.approx((low + mid) / 2)
+        assert response[freqs == 4000][0] == pytest.approx((mid + high) / 2)
+        assert np.all(np.diff(response) >= 0)
+    
+    def test_eq_response_is_cached(self):
+        """Test EQ response is shared across calls with identical parameters."""
+        from src.processors.dynamics import _build_eq_response
+        
+        first = _build_eq_response(4096, 44100, -3.0, 2.0, 1.0)
+        second = _build_eq_response(4096, 44100, -3.0, 2.0, 1.0)
+        
+        assert first is second
+        assert not first.flags.writeable
+    
+    @pytest.mark.parametrize("has_scipy,has_numba", [(True, False), (False, True), (False, False)])
+    def test_apply_eq_band_gains(self, has_scipy, has_numba):
+        """Test EQ applies the requested gain to a tone in each band."""
+        from src.processors.dynamics import HAS_NUMBA
+        
+        if has_numba and not HAS_NUMBA:
+            pytest.skip("numba not installed")
+        
+        processor = DynamicsProcessor()
+        t = np.arange(44100) / 44100
+        
+        with patch("src.processors.dynamics.HAS_SCIPY", has_scipy), \
+                patch("src.processors.dynamics.HAS_NUMBA", has_numba):
+            for freq, expected_db in ((60, -6.0), (1000, 2.0), (10000, 3.0)):
+                tone = np.sin(2 * np.pi * freq * t)
+                filtered = processor._apply_eq(tone, 44100, -6.0, 2.0, 3.0)
+                peak_db = 20 * np.log10(np.abs(filtered[5000:-5000]).max())
+                assert peak_db == pytest.approx(expected_db, abs=0.1)
+    
+    def test_eq_sos_skips_high_shelf_above_nyquist(self):
+        """Test no high shelf is designed when 4kHz is at or above Nyquist."""
+        from src.processors.dynamics import _design_eq_sos
+        
+        assert _design_eq_sos(44100, 1.0, 2.0, 3.0).shape == (2, 6)
+        assert _design_eq_sos(8000, 1.0, 2.0, 3.0).shape == (1, 6)
+    
     @patch("src.processors.dynamics.HAS_NUMPY", False)
     def test_missing_numpy_dependency(self, tmp_path):
         """Test error when numpy is missing."""
@@ -275,6 +992,110 @@ class TestAudioTrimmer:
         )
         assert not result.success
         assert "pydub" in result.error_message.lower()
+    
+    @pytest.mark.parametrize("sample_width,channels,frame_rate", [
+        (1, 1, 8000),
+        (2, 2, 44100),
+        (4, 1, 22050),
+        (2, 3, 11025),
+    ])
+    def test_detect_nonsilent_matches_pydub(self, sample_width, channels, frame_rate):
+        """Test the vectorized silence scan finds pydub's ranges."""
+        from pydub import AudioSegment
+        from pydub.silence import detect_nonsilent
+        
+        rng = np.random.default_rng(sample_width * channels)
+        max_val = 2 ** (sample_width * 8 - 1)
+        frame_count = int(frame_rate * 2.3)
+        # Alternate loud and near-silent stretches of uneven length
+        loud = (np.arange(frame_count) // (frame_rate // 3)) % 3 != 1
+        amplitude = np.where(loud, 0.2, 0.0005)[:, None]
+        samples = rng.standard_normal((frame_count, channels)) * amplitude * max_val
+        samples = samples.clip(-max_val, max_val - 1).astype(f"int{sample_width * 8}")
+        audio = AudioSegment(
+            samples.tobytes(),
+            frame_rate=frame_rate,
+            sample_width=sample_width,
+            channels=channels,
+        )
+        
+        processor = AudioTrimmer()
+        for min_silence_len, silence_thresh in [(100, -40.0), (250, -50.0), (3000, -40.0)]:
+            expected = detect_nonsilent(
+                audio,
+                min_silence_len=min_silence_len,
+                silence_thresh=silence_thresh,
+            )
+            assert processor._detect_nonsilent(audio, min_silence_len, silence_thresh) == expected
+        
+        silent = AudioSegment.silent(duration=1200, frame_rate=frame_rate)
+        assert processor._detect_nonsilent(silent, 100, -40.0) == []
+    
+    @pytest.mark.parametrize("sample_width", [1, 2])
+    def test_remove_all_silence_shortens_gaps(self, sample_width):
+        """Test long gaps are cut to max_silence_ms and short ones kept."""
+        from pydub.generators import Sine
+        
+        tone = Sine(440).to_audio_segment(duration=400).set_frame_rate(8000)
+        tone = tone.set_channels(2).set_sample_width(sample_width)
+        gap = tone._spawn(bytes(tone.frame_width * 8000))
+        short_gap = gap[:150]
+        audio = tone + gap + tone + short_gap + tone
+        
+        processor = AudioTrimmer()
+        processed, info = processor._remove_all_silence(audio, -40.0, 100, 200)
+        
+        assert info["sections_found"] == 3
+        assert info["silence_removed_ms"] == 800
+        assert len(processed) == len(audio) - 800
+        assert processed.sample_width == sample_width
+        assert processed.channels == 2
+        assert processed[400:600].rms == 0
+    
+    def test_join_sections_matches_pydub_slicing(self):
+        """Test the NumPy join gives the same bytes as slicing with pydub."""
+        from pydub import AudioSegment
+        
+        audio = AudioSegment(
+            data=bytes(range(256)) * 1378, sample_width=2, frame_rate=11025, channels=2
+        )
+        ranges = [[3, 250], [260, 400], [900, 1200], [1230, 1500], [2600, len(audio)]]
+        
+        processor = AudioTrimmer()
+        for max_silence_ms in [0, 25, 200]:
+            processed, info = processor._remove_all_silence(audio, -40.0, 100, max_silence_ms, ranges)
+            with patch("src.processors.trimmer.HAS_NUMPY", False):
+                expected, expected_info = processor._remove_all_silence(
+                    audio, -40.0, 100, max_silence_ms, ranges
+                )
+            assert processed.raw_data == expected.raw_data
+            assert info == expected_info
+    
+    def test_all_mode_detects_silence_once(self, tmp_path):
+        """Test mode='all' trims edges and gaps from a single detection pass."""
+        from pydub import AudioSegment
+        from pydub.generators import Sine
+        
+        tone = Sine(440).to_audio_segment(duration=400).set_frame_rate(8000)
+        gap = AudioSegment.silent(duration=1000, frame_rate=8000)
+        input_path = tmp_path / "speech.wav"
+        (gap + tone + gap + tone + gap).export(input_path, format="wav")
+        
+        processor = AudioTrimmer()
+        with patch.object(
+            AudioTrimmer, "_detect_nonsilent", wraps=processor._detect_nonsilent
+        ) as detect:
+            result = processor.process(
+                input_path=input_path,
+                output_dir=tmp_path / "out",
+                mode="all",
+                min_silence_ms=100,
+                max_silence_ms=200,
+            )
+        
+        assert result.success
+        assert detect.call_count == 1
+        assert result.metadata["processed_duration_ms"] == 1000
 
 
 class TestAudioTranscriber:
@@ -296,6 +1117,8 @@ class TestAudioTranscriber:
         assert "output_format" in param_names
         assert "word_timestamps" in param_names
         assert "task" in param_names
+        assert "compute_type" in param_names
+        assert "torch_compile" in param_names
     
     def test_model_choices(self):
         """Test model parameter has correct choices."""
@@ -334,6 +1157,342 @@ class TestAudioTranscriber:
         assert not result.success
         assert "whisper" in result.error_message.lower()
     
+    @pytest.mark.parametrize("output_format", ["srt", "vtt"])
+    @patch("src.processors.transcriber.HAS_WHISPER", True)
+    def test_subtitles_written_to_file(self, tmp_path, output_format):
+        """Test streamed subtitle output matches the formatted string."""
+        input_path = tmp_path / "talk.wav"
+        input_path.write_bytes(b"RIFF")
+        result = {
+            "text": " Hello World",
+            "language": "en",
+            "segments": [
+                {"id": 0, "start": 0.0, "end": 1.0, "text": " Hello"},
+                {"id": 1, "start": 1.5, "end": 2.5, "text": " World"},
+            ],
+        }
+        
+        processor = AudioTranscriber()
+        with patch.object(AudioTranscriber, "_load_model"), \
+             patch.object(AudioTranscriber, "_transcribe", return_value=result):
+            process_result = processor.process(
+                input_path=input_path,
+                output_dir=tmp_path / "out",
+                output_format=output_format,
+            )
+        
+        assert process_result.success
+        written = process_result.output_paths[0].read_text(encoding="utf-8")
+        formatter = processor._format_srt if output_format == "srt" else processor._format_vtt
+        assert written == formatter(result)
+        assert process_result.metadata["segment_count"] == 2
+    
+    @patch("src.processors.transcriber.HAS_FASTER_WHISPER", True)
+    @patch("src.processors.transcriber.HAS_WHISPER", True)
+    def test_process_batch_shares_model(self, tmp_path):
+        """Test batches share one faster-whisper model with a worker per thread."""
+        from src.processors.transcriber import _get_model
+        
+        paths = []
+        for name in ["a", "b", "c"]:
+            path = tmp_path / f"{name}.wav"
+            path.write_bytes(b"RIFF")
+            paths.append(path)
+        result = {"text": " Hi", "language": "en", "segments": []}
+        
+        faster_whisper = MagicMock()
+        processor = AudioTranscriber()
+        _get_model.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"faster_whisper": faster_whisper}), \
+                 patch.object(AudioTranscriber, "_transcribe", return_value=result) as transcribe:
+                results = processor.process_batch(paths, tmp_path / "out", max_workers=2)
+        finally:
+            _get_model.cache_clear()
+        
+        assert [r.input_path for r in results] == paths
+        assert all(r.success for r in results)
+        faster_whisper.WhisperModel.assert_called_once_with(
+            "base", device="auto", compute_type="int8", num_workers=2
+        )
+        assert {call.args[0] for call in transcribe.call_args_list} == {
+            faster_whisper.WhisperModel.return_value
+        }
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["a.txt", "b.txt", "c.txt"]
+    
+    @patch("src.processors.transcriber.HAS_FASTER_WHISPER", False)
+    @patch("src.processors.transcriber.HAS_WHISPER", True)
+    def test_process_batch_openai_whisper_one_at_a_time(self, tmp_path):
+        """Test openai-whisper batches never decode on the shared model concurrently."""
+        paths = []
+        for name in ["a", "b", "c", "d"]:
+            path = tmp_path / f"{name}.wav"
+            path.write_bytes(b"RIFF")
+            paths.append(path)
+        
+        lock = threading.Lock()
+        active = []
+        overlaps = []
+        
+        def transcribe(whisper_model, input_path, options):
+            with lock:
+                active.append(input_path)
+                overlaps.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(input_path)
+            return {"text": " Hi", "language": "en", "segments": []}
+        
+        processor = AudioTranscriber()
+        with patch("src.processors.transcriber._get_model", return_value=MagicMock()), \
+             patch.object(AudioTranscriber, "_transcribe", side_effect=transcribe):
+            results = processor.process_batch(paths, tmp_path / "out", max_workers=4)
+        
+        assert all(r.success for r in results)
+        assert overlaps == [1, 1, 1, 1]
+    
+    @pytest.mark.parametrize("has_orjson", [False, True])
+    def test_format_json(self, has_orjson):
+        """Test JSON output is indented, keeps non-ASCII text and strips segments."""
+        if has_orjson:
+            pytest.importorskip("orjson")
+        result = {
+            "text": " Grüße ",
+            "language": "de",
+            "segments": [{"id": 0, "start": 0.0, "end": 1.25, "text": " Grüße "}],
+        }
+        
+        processor = AudioTranscriber()
+        with patch("src.processors.transcriber.HAS_ORJSON", has_orjson):
+            formatted = processor._format_json(result, Path("talk.wav"))
+        
+        assert formatted.startswith('{\n  "file": "talk.wav"')
+        assert "Grüße" in formatted
+        assert json.loads(formatted) == {
+            "file": "talk.wav",
+            "language": "de",
+            "text": "Grüße",
+            "segments": [{"id": 0, "start": 0.0, "end": 1.25, "text": "Grüße"}],
+        }
+    
+    @pytest.mark.parametrize("output_format,expected", [("json", True), ("srt", False)])
+    @patch("src.processors.transcriber.HAS_WHISPER", True)
+    def test_word_timestamps_only_for_json(self, tmp_path, output_format, expected):
+        """Test words are only aligned when the output format can hold them."""
+        input_path = tmp_path / "talk.wav"
+        input_path.write_bytes(b"RIFF")
+        words = [{"word": " Hi", "start": 0.0, "end": 0.5, "probability": 0.9}]
+        result = {
+            "text": " Hi",
+            "language": "en",
+            "segments": [{"id": 0, "start": 0.0, "end": 0.5, "text": " Hi", "words": words}],
+        }
+        
+        processor = AudioTranscriber()
+        with patch.object(AudioTranscriber, "_load_model"), \
+             patch.object(AudioTranscriber, "_transcribe", return_value=result) as transcribe:
+            process_result = processor.process(
+                input_path=input_path,
+                output_dir=tmp_path,
+                output_format=output_format,
+                word_timestamps=True,
+            )
+        
+        assert process_result.success
+        assert transcribe.call_args.args[2]["word_timestamps"] is expected
+        assert process_result.metadata["word_timestamps"] is expected
+        if output_format == "json":
+            written = json.loads(process_result.output_paths[0].read_text(encoding="utf-8"))
+            assert written["segments"][0]["words"] == words
+    
+    def test_timestamps_round_to_millisecond(self):
+        """Test timestamps round rather than truncate float seconds."""
+        processor = AudioTranscriber()
+        assert processor._format_timestamp(5.72) == "00:00:05,720"
+        assert processor._format_vtt_timestamp(59.9996) == "00:01:00.000"
+        assert processor._format_timestamp(36000.0) == "10:00:00,000"
+    
+    @patch("src.processors.transcriber.HAS_FASTER_WHISPER", True)
+    def test_faster_whisper_segments_collected(self):
+        """Test faster-whisper output is collected into openai-whisper's result shape."""
+        word = MagicMock(word=" Hello", start=0.0, end=0.4, probability=0.9)
+        segments = [
+            MagicMock(start=0.0, end=1.0, text=" Hello", words=[word]),
+            MagicMock(start=1.5, end=2.5, text=" World", words=None),
+        ]
+        whisper_model = MagicMock()
+        whisper_model.transcribe.return_value = (iter(segments), MagicMock(language="en"))
+        
+        processor = AudioTranscriber()
+        result = processor._transcribe(whisper_model, Path("test.wav"), {"task": "transcribe"})
+        
+        whisper_model.transcribe.assert_called_once_with("test.wav", task="transcribe")
+        assert result["text"] == " Hello World"
+        assert result["language"] == "en"
+        assert [seg["id"] for seg in result["segments"]] == [0, 1]
+        assert result["segments"][0]["words"] == [
+            {"word": " Hello", "start": 0.0, "end": 0.4, "probability": 0.9}
+        ]
+        assert "words" not in result["segments"][1]
+        assert "2\n00:00:01,500 --> 00:00:02,500\nWorld" in processor._format_srt(result)
+    
+    @patch("src.processors.transcriber.HAS_FASTER_WHISPER", True)
+    def test_long_file_streamed_in_windows(self, tmp_path):
+        """Test long files are transcribed window by window with shifted timestamps."""
+        sf = pytest.importorskip("soundfile")
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("scipy")
+        
+        input_path = tmp_path / "long.wav"
+        sf.write(str(input_path), np.zeros((65 * 8000, 2), dtype=np.float32), 8000)
+        
+        def transcribe(audio, **options):
+            word = MagicMock(word=" Hi", start=1.0, end=1.5, probability=0.9)
+            segment = MagicMock(start=1.0, end=2.0, text=" Hi", words=[word])
+            return iter([segment]), MagicMock(language="en")
+        
+        whisper_model = MagicMock()
+        whisper_model.transcribe.side_effect = transcribe
+        
+        processor = AudioTranscriber()
+        result = processor._transcribe(whisper_model, input_path, {"task": "transcribe"})
+        
+        calls = whisper_model.transcribe.call_args_list
+        assert [len(call.args[0]) for call in calls] == [480000, 480000, 80000]
+        assert all(call.args[0].dtype == np.float32 for call in calls)
+        assert "language" not in calls[0].kwargs
+        assert calls[1].kwargs["language"] == "en"
+        assert result["text"] == " Hi Hi Hi"
+        assert [seg["id"] for seg in result["segments"]] == [0, 1, 2]
+        assert [seg["start"] for seg in result["segments"]] == [1.0, 31.0, 61.0]
+        assert result["segments"][2]["words"][0]["end"] == 61.5
+    
+    @patch("src.processors.transcriber.HAS_FASTER_WHISPER", True)
+    def test_long_file_windows_seek_past_complete_segments(self, tmp_path):
+        """Test speech cut at a window edge is dropped and transcribed whole next window."""
+        sf = pytest.importorskip("soundfile")
+        np = pytest.importorskip("numpy")
+        
+        input_path = tmp_path / "long.wav"
+        ramp = np.arange(65 * 16000, dtype=np.float32) / (65 * 16000)
+        sf.write(str(input_path), ramp, 16000, subtype="FLOAT")
+        
+        # Window-relative segments; the last one of each full window runs into the edge
+        windows = iter([
+            [(0.0, 12.0, " A"), (12.0, 30.0, " B")],
+            [(0.0, 16.0, " B"), (16.0, 30.0, " C")],
+            [(0.0, 20.0, " C"), (20.0, 30.0, " D")],
+            [(0.0, 10.0, " D"), (10.0, 17.0, " E")],
+        ])
+        
+        def transcribe(audio, **options):
+            segments = [
+                MagicMock(start=start, end=end, text=text, words=None)
+                for start, end, text in next(windows)
+            ]
+            return iter(segments), MagicMock(language="en")
+        
+        whisper_model = MagicMock()
+        whisper_model.transcribe.side_effect = transcribe
+        
+        processor = AudioTranscriber()
+        result = processor._transcribe(whisper_model, input_path, {"task": "transcribe"})
+        
+        calls = whisper_model.transcribe.call_args_list
+        assert [call.args[0][0] for call in calls] == [
+            ramp[start * 16000] for start in (0, 12, 28, 48)
+        ]
+        assert [len(call.args[0]) for call in calls] == [480000, 480000, 480000, 272000]
+        assert "initial_prompt" not in calls[0].kwargs
+        assert [call.kwargs["initial_prompt"] for call in calls[1:]] == ["A", "B", "C"]
+        assert result["text"] == " A B C D E"
+        assert [(seg["start"], seg["end"]) for seg in result["segments"]] == [
+            (0.0, 12.0), (12.0, 28.0), (28.0, 48.0), (48.0, 58.0), (58.0, 65.0)
+        ]
+    
+    @patch("src.processors.transcriber.HAS_FASTER_WHISPER", True)
+    def test_short_file_transcribed_whole(self, tmp_path):
+        """Test files under a minute are handed to the backend by path."""
+        sf = pytest.importorskip("soundfile")
+        np = pytest.importorskip("numpy")
+        
+        input_path = tmp_path / "short.wav"
+        sf.write(str(input_path), np.zeros(10 * 16000, dtype=np.float32), 16000)
+        whisper_model = MagicMock()
+        whisper_model.transcribe.return_value = (iter([]), MagicMock(language="en"))
+        
+        AudioTranscriber()._transcribe(whisper_model, input_path, {"task": "transcribe"})
+        
+        whisper_model.transcribe.assert_called_once_with(str(input_path), task="transcribe")
+    
+    @pytest.mark.parametrize("device", ["cpu", "cuda"])
+    @patch("src.processors.transcriber.HAS_FASTER_WHISPER", False)
+    def test_openai_whisper_audio_on_model_device(self, device):
+        """Test openai-whisper gets a path on CPU and a device tensor otherwise."""
+        whisper, torch = MagicMock(), MagicMock()
+        whisper_model = MagicMock()
+        whisper_model.device.type = device
+        whisper_model.transcribe.return_value = {"text": "", "segments": []}
+        
+        processor = AudioTranscriber()
+        with patch.dict("sys.modules", {"whisper": whisper, "torch": torch}):
+            processor._transcribe(whisper_model, Path("test.wav"), {"task": "transcribe"})
+        
+        audio = whisper_model.transcribe.call_args.args[0]
+        if device == "cpu":
+            assert audio == "test.wav"
+            whisper.load_audio.assert_not_called()
+        else:
+            whisper.load_audio.assert_called_once_with("test.wav")
+            torch.from_numpy.return_value.to.assert_called_once_with(whisper_model.device)
+            assert audio is torch.from_numpy.return_value.to.return_value
+    
+    @patch("src.processors.transcriber.HAS_FASTER_WHISPER", True)
+    def test_model_loaded_once_per_process(self):
+        """Test the model stays resident across processor instances."""
+        from src.processors.transcriber import _get_model
+        
+        faster_whisper = MagicMock()
+        _get_model.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"faster_whisper": faster_whisper}):
+                first = AudioTranscriber()._load_model("tiny", "int8")
+                second = AudioTranscriber()._load_model("tiny", "int8")
+                AudioTranscriber()._load_model("tiny", "float32")
+        finally:
+            _get_model.cache_clear()
+        
+        assert first is second
+        assert faster_whisper.WhisperModel.call_count == 2
+        faster_whisper.WhisperModel.assert_called_with(
+            "tiny", device="auto", compute_type="float32", num_workers=1
+        )
+    
+    @pytest.mark.parametrize("device", ["cpu", "cuda"])
+    @patch("src.processors.transcriber.HAS_FASTER_WHISPER", False)
+    def test_torch_compile_encoder_on_cuda(self, device):
+        """Test torch_compile compiles only the encoder, and only on CUDA."""
+        from src.processors.transcriber import _get_model
+        
+        whisper, torch = MagicMock(), MagicMock()
+        whisper_model = whisper.load_model.return_value
+        whisper_model.device.type = device
+        encoder = whisper_model.encoder
+        
+        _get_model.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"whisper": whisper, "torch": torch}):
+                model = AudioTranscriber()._load_model("tiny", torch_compile=True)
+        finally:
+            _get_model.cache_clear()
+        
+        assert model is whisper_model
+        if device == "cuda":
+            torch.compile.assert_called_once_with(encoder, mode="reduce-overhead")
+            assert model.encoder is torch.compile.return_value
+        else:
+            torch.compile.assert_not_called()
+    
     def test_model_info(self):
         """Test MODEL_INFO class attribute."""
         assert "tiny" in AudioTranscriber.MODEL_INFO
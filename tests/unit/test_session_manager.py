@@ -406,6 +406,68 @@ class TestSessionManager:
         )
         assert failed_file.status == FileStatus.FAILED
         assert "Unexpected error" in failed_file.error_message
+    
+    def test_run_batch_concurrent(self, manager, sample_files, output_dir):
+        """Concurrent batches record every file and its outputs."""
+        processor = MockProcessor(fail_on_files=[sample_files[2]])
+        
+        session = manager.run_batch(
+            processor=processor,
+            input_files=sample_files,
+            output_dir=output_dir,
+            config={},
+            max_concurrent=3
+        )
+        
+        assert session.status == SessionStatus.COMPLETED
+        assert session.processed_count == 4
+        assert session.failed_count == 1
+        assert sorted(processor._processed_files) == sorted(sample_files)
+        
+        for record in session.files:
+            if record.file_path == sample_files[2]:
+                assert record.status == FileStatus.FAILED
+                assert record.error_message == "Mock processing error"
+            else:
+                assert record.status == FileStatus.COMPLETED
+                assert record.output_paths == [
+                    output_dir / f"{record.file_path.stem}_processed.wav"
+                ]
+    
+    def test_run_batch_concurrent_limit(self, manager, sample_files, output_dir):
+        """No more than max_concurrent files are processed at once."""
+        import threading
+        import time
+        
+        lock = threading.Lock()
+        active = []
+        peak = []
+        
+        def slow_process(input_path, output_dir, **kwargs):
+            with lock:
+                active.append(input_path)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(input_path)
+            if input_path == sample_files[4]:
+                raise RuntimeError("Unexpected error")
+            return ProcessResult(success=True, input_path=input_path)
+        
+        processor = MockProcessor()
+        processor.process = slow_process
+        
+        session = manager.run_batch(
+            processor=processor,
+            input_files=sample_files,
+            output_dir=output_dir,
+            config={},
+            max_concurrent=2
+        )
+        
+        assert max(peak) == 2
+        assert session.processed_count == 4
+        assert session.failed_count == 1
 
 
 class TestSessionManagerSignalHandling:
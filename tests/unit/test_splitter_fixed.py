@@ -2,8 +2,13 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from pydub import AudioSegment
+from pydub.generators import Sine
 
 from src.processors import FixedSplitter, get_processor
+from src.core.exceptions import ProcessingError
 from src.core.types import ProcessorCategory
 
 
@@ -41,6 +46,7 @@ class TestFixedSplitterProperties:
         assert "output_format" in param_names
         assert "min_last_segment_ms" in param_names
         assert "crossfade_ms" in param_names
+        assert "max_workers" in param_names
         
         # Check duration_ms has proper constraints
         duration_param = next(p for p in params if p.name == "duration_ms")
@@ -243,6 +249,121 @@ class TestFixedSplitterSegmentFilenames:
         for i, path in enumerate(result.output_paths, 1):
             expected_name = f"{sample_audio_5sec.stem}_segment_{i:03d}.wav"
             assert path.name == expected_name
+    
+    @pytest.mark.parametrize("max_workers", [None, 1, 2])
+    def test_segments_exported_in_order(self, sample_audio_10sec, output_dir, max_workers):
+        """Test concurrently exported segments keep their positions."""
+        splitter = FixedSplitter()
+        
+        result = splitter.process(
+            input_path=sample_audio_10sec,
+            output_dir=output_dir,
+            duration_ms=3000.0,
+            output_format="wav",
+            min_last_segment_ms=0.0,
+            max_workers=max_workers,
+        )
+        
+        assert result.success is True
+        durations = [len(AudioSegment.from_file(str(p))) for p in result.output_paths]
+        assert durations == [3000, 3000, 3000, 1000]
+    
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_wav_segment_matches_pydub_export(self, temp_dir, channels):
+        """Test raw WAV segments are byte-identical to pydub's export."""
+        audio = Sine(440).to_audio_segment(duration=2500).set_channels(channels)
+        splitter = FixedSplitter()
+        
+        for start, end in [(0.0, 1000.0), (1000.0, 2500.0), (2000.0, 2600.0)]:
+            expected_path = temp_dir / "expected.wav"
+            audio[int(start):int(end)].export(str(expected_path), format="wav")
+            output_path = splitter._write_wav_segment(audio, start, end, temp_dir / "out.wav")
+            
+            assert output_path.read_bytes() == expected_path.read_bytes()
+
+
+class TestFixedSplitterStreamCopy:
+    """Test stream-copy splitting when input and output formats match."""
+    
+    def test_can_stream_copy(self):
+        """Test stream copy is used only for matching copyable formats."""
+        splitter = FixedSplitter()
+        
+        assert splitter._can_stream_copy(Path("talk.MP3"), "mp3") is True
+        assert splitter._can_stream_copy(Path("talk.wav"), "mp3") is False
+        assert splitter._can_stream_copy(Path("talk.ogg"), "ogg") is False
+    
+    @pytest.mark.parametrize("segments", [
+        [(0.0, 2000.0), (2000.0, 4000.0), (4000.0, 6000.0)],
+        [(0.0, 6000.0)],
+    ])
+    def test_copy_segments_cuts_mp3(self, temp_dir, output_dir, segments):
+        """Test mp3 segments are cut in one pass without decoding the source."""
+        sf = pytest.importorskip("soundfile")
+        input_path = temp_dir / "100% tone.mp3"
+        Sine(440).to_audio_segment(duration=6000).export(str(input_path), format="mp3")
+        splitter = FixedSplitter()
+        output_paths = [
+            splitter._generate_segment_filename(input_path, i, output_dir, "mp3")
+            for i in range(1, len(segments) + 1)
+        ]
+        
+        result = splitter._copy_segments(input_path, segments, output_paths)
+        
+        assert result == output_paths
+        assert sorted(output_dir.iterdir()) == sorted(output_paths)
+        for (start, end), output_path in zip(segments, output_paths):
+            info = sf.info(str(output_path))
+            # Cuts snap to mp3 frames and each file carries decoder delay
+            assert info.duration * 1000 == pytest.approx(end - start, abs=100)
+    
+    def test_copy_segments_failure_raises(self, temp_dir, output_dir):
+        """Test ffmpeg errors surface as ProcessingError."""
+        splitter = FixedSplitter()
+        
+        with pytest.raises(ProcessingError):
+            splitter._copy_segments(
+                temp_dir / "missing.mp3", [(0.0, 1000.0)], [output_dir / "out.mp3"]
+            )
+    
+    def test_stream_copy_skips_decoding(self, temp_dir, output_dir):
+        """Test a probed mp3 is split without loading it through pydub."""
+        input_path = temp_dir / "tone.mp3"
+        Sine(440).to_audio_segment(duration=6000).export(str(input_path), format="mp3")
+        splitter = FixedSplitter()
+        
+        with patch.object(splitter, "_probe_duration_ms", return_value=6000.0), \
+                patch("src.processors.splitter.fixed.load_audio") as load_audio:
+            result = splitter.process(
+                input_path=input_path,
+                output_dir=output_dir,
+                duration_ms=2000.0,
+                output_format="mp3",
+            )
+        
+        load_audio.assert_not_called()
+        assert result.success is True
+        assert result.metadata["stream_copy"] is True
+        assert result.metadata["total_duration_ms"] == 6000.0
+        assert len(result.output_paths) == 3
+    
+    def test_probe_duration_ms(self):
+        """Test the container duration is read from ffprobe's JSON."""
+        splitter = FixedSplitter()
+        completed = MagicMock(stdout=b'{"format": {"duration": "6.026122"}}')
+        
+        with patch("src.processors.splitter.fixed.subprocess.run", return_value=completed):
+            assert splitter._probe_duration_ms(Path("tone.mp3")) == 6026.0
+    
+    def test_probe_duration_ms_without_ffprobe(self):
+        """Test a missing ffprobe falls back to decoding."""
+        splitter = FixedSplitter()
+        
+        with patch(
+            "src.processors.splitter.fixed.subprocess.run",
+            side_effect=FileNotFoundError("ffprobe"),
+        ):
+            assert splitter._probe_duration_ms(Path("tone.mp3")) is None
 
 
 class TestFixedSplitterMinLastSegment:
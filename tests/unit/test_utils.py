@@ -232,3 +232,18 @@ class TestAudioUtils:
         
         assert len(segments) == 1
         assert segments[0] == (0.0, 5000.0)
+    
+    def test_calculate_segments_remainder_longer_than_segment(self):
+        """Test a minimum last length above the segment length merges early."""
+        # After 0-3 and 3-6 only 4000ms remain, which is below the minimum
+        segments = calculate_segments(
+            duration_ms=10000.0,
+            segment_duration_ms=3000.0,
+            min_last_segment_ms=5000.0,
+        )
+        
+        assert segments == [(0.0, 3000.0), (3000.0, 10000.0)]
+    
+    def test_calculate_segments_empty_audio(self):
+        """Test zero-length audio yields no segments."""
+        assert calculate_segments(duration_ms=0.0, segment_duration_ms=1000.0) == []